@@ -1,10 +1,15 @@
+from collections.abc import Sequence
 from typing import Any, Generic, TypeVar
 
 from fastapi import HTTPException
 from pydantic import BaseModel
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm.interfaces import ORMOption
 
+from app.core import counters, events, pagination
 from app.db.database import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -13,18 +18,62 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
-    def __init__(self, model: type[ModelType]):
+    # Columns that order list pages; the last one must be unique
+    keyset: tuple[str, ...] = ("id",)
+
+    def __init__(self, model: type[ModelType], *, loaders: Sequence[ORMOption] = ()):
         self.model = model
+        # Eager loads for the relationships the endpoints' responses serialize,
+        # so listing N records doesn't lazy-load N times
+        self.loaders = tuple(loaders)
+
+    def query(self, db: Session, *options: ORMOption) -> Query:
+        """Query of the model with ``options``, or with the default loaders if none are given."""
+        return db.query(self.model).options(*(options or self.loaders))
 
     def get(self, db: Session, id: int) -> ModelType | None:
         return db.query(self.model).filter(self.model.id == id).first()
 
     def get_all(self, db: Session, skip: int = 0, limit: int = 100) -> list[ModelType]:
-        return db.query(self.model).offset(skip).limit(limit).all()
+        return self.query(db).offset(skip).limit(limit).all()
 
     def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> list[ModelType]:
         """Get multiple records with pagination."""
-        return db.query(self.model).offset(skip).limit(limit).all()
+        return self.query(db).offset(skip).limit(limit).all()
+
+    def get_page(
+        self,
+        db: Session,
+        *,
+        query: Query | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        keyset: Sequence[str] | None = None,
+    ) -> tuple[list[ModelType], str | None]:
+        """
+        One page of ``query`` (``self.query(db)`` by default) in ``keyset`` order.
+
+        ``keyset`` defaults to the class's; it must end with a unique column.
+        Pages start after ``cursor`` when given, or at offset ``skip``.
+        Returns the records and the cursor of the next page, which is None
+        on the last page.
+        """
+        if cursor is not None and skip:
+            raise HTTPException(status_code=400, detail="Use either skip or cursor, not both")
+        keyset = self.keyset if keyset is None else keyset
+        columns = [self.model.__table__.c[name] for name in keyset]
+        query = pagination.start_after(
+            self.query(db) if query is None else query, columns, cursor
+        )
+        if cursor is None:
+            query = query.offset(skip)
+        # One extra row tells whether another page follows
+        return pagination.split_page(
+            query.limit(limit + 1).all(),
+            limit,
+            lambda item: [getattr(item, name) for name in keyset],
+        )
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         try:
@@ -38,6 +87,46 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             db.rollback()
             raise HTTPException(status_code=400, detail=str(e))
 
+    def create_many(self, db: Session, *, objs_in: list[CreateSchemaType]) -> list[int]:
+        """
+        Insert many records in one transaction with a single executemany.
+
+        No ORM objects are built; the new IDs are returned in input order and
+        change events are recorded for the inserted rows.
+        """
+        try:
+            ids = self.insert_rows(db, [obj_in.model_dump() for obj_in in objs_in])
+            db.commit()
+            return ids
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def insert_rows(
+        self, db: Session, rows: list[dict[str, Any]], *, tags: list[str] | None = None
+    ) -> list[int]:
+        """
+        Insert column dicts with a single executemany, without committing.
+
+        Records change events for the new rows, with ``tags`` added to each.
+        Returns the new IDs in input order.
+        """
+        if not rows:
+            return []
+        # Autoincrement keys are assigned in VALUES order, so sorting maps the
+        # IDs back to the rows; sort_by_parameter_order would make SQLite fall
+        # back to one INSERT per row
+        ids = sorted(db.scalars(insert(self.model).returning(self.model.id), rows))
+        counters.adjust(db.connection(), {self.model.__tablename__: len(ids)})
+        events.record(
+            db,
+            self.model.__table__,
+            "created",
+            [{**row, "id": id} for row, id in zip(rows, ids, strict=True)],
+            tags=tags or (),
+        )
+        return ids
+
     def update(
         self, db: Session, *, db_obj: ModelType, obj_in: UpdateSchemaType | dict[str, Any]
     ) -> ModelType:
@@ -88,3 +177,57 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             except AttributeError:
                 raise HTTPException(status_code=400, detail=f"Invalid field: {field}")
         return query.first()
+
+    # Async variants for handlers running on an AsyncSession
+
+    async def get_async(self, db: AsyncSession, id: int) -> ModelType | None:
+        return await db.get(self.model, id)
+
+    async def get_multi_async(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
+    ) -> list[ModelType]:
+        """Get multiple records with pagination."""
+        result = await db.scalars(select(self.model).offset(skip).limit(limit))
+        return list(result)
+
+    async def create_async(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        try:
+            db_obj = self.model(**obj_in.model_dump())
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            return db_obj
+        except IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def update_async(
+        self, db: AsyncSession, *, db_obj: ModelType, obj_in: UpdateSchemaType | dict[str, Any]
+    ) -> ModelType:
+        try:
+            if isinstance(obj_in, dict):
+                obj_data = obj_in
+            else:
+                obj_data = obj_in.model_dump(exclude_unset=True)
+
+            for field, value in obj_data.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            await db.commit()
+            await db.refresh(db_obj)
+            return db_obj
+        except IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def delete_async(self, db: AsyncSession, *, id: int) -> ModelType:
+        obj = await db.get(self.model, id)
+        if not obj:
+            raise HTTPException(status_code=404, detail="Item not found")
+        try:
+            await db.delete(obj)
+            await db.commit()
+            return obj
+        except IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=f"Cannot delete item due to existing references: {e!s}")
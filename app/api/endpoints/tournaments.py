@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db
 from app.crud.player_stats import player_stats as crud_player_stats
 from app.crud.tournament import tournament as crud_tournament
-from app.schemas.player_stats import PlayerStats
+from app.schemas.player_stats import TopScorer
 from app.schemas.tournament import Tournament, TournamentCreate, TournamentUpdate
 
 router = APIRouter()
@@ -20,7 +20,7 @@ def get_tournament(tournament_id: int, db: Session = Depends(get_db)):
     return tournament
 
 
-@router.get("/{tournament_id}/top-scorers", response_model=list[PlayerStats])
+@router.get("/{tournament_id}/top-scorers", response_model=list[TopScorer])
 def get_tournament_top_scorers(
     tournament_id: int,
     limit: int = 5,
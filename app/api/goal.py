@@ -1,29 +1,33 @@
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
-from app.api.crud_base import CRUDBase
+from app.core.etag import conditional_get
+from app.core.events import tag
+from app.core.pagination import set_next_cursor
+from app.core.timing import TimedRoute
+from app.crud.goal import CRUDGoal
 from app.db.database import get_db
 from app.models.goal import Goal
 from app.schemas.goal import Goal as GoalSchema
 from app.schemas.goal import GoalCreate, GoalUpdate
 
-router = APIRouter()
-crud = CRUDBase(Goal)
+router = APIRouter(route_class=TimedRoute)
+crud = CRUDGoal(Goal, loaders=(joinedload(Goal.player), joinedload(Goal.team)))
 
 
 @router.get("/", response_model=list[GoalSchema])
 def get_goals(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db)
 ):
     """Get all goals."""
-    goals = db.query(Goal).options(
-        joinedload(Goal.player),
-        joinedload(Goal.team)
-    ).offset(skip).limit(limit).all()
+    goals, next_cursor = crud.get_page(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
     return goals
 
 
@@ -41,10 +45,7 @@ def create_goal(goal: GoalCreate, db: Session = Depends(get_db)):
 @router.get("/{goal_id}", response_model=GoalSchema)
 def read_goal(goal_id: int = Path(...), db: Session = Depends(get_db)):
     """Get a goal by ID."""
-    db_goal = db.query(Goal).options(
-        joinedload(Goal.player),
-        joinedload(Goal.team)
-    ).filter(Goal.id == goal_id).first()
+    db_goal = crud.query(db).filter(Goal.id == goal_id).first()
     
     if db_goal is None:
         raise HTTPException(status_code=404, detail="Goal not found")
@@ -78,47 +79,66 @@ def delete_goal(goal_id: int = Path(...), db: Session = Depends(get_db)):
 
 @router.get("/match/{match_id}", response_model=list[GoalSchema])
 def list_goals_by_match(
+    request: Request,
+    response: Response,
     match_id: int = Path(...),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db),
 ):
-    """List all goals for a specific match."""
-    goals = db.query(Goal).options(
-        joinedload(Goal.player),
-        joinedload(Goal.team)
-    ).filter(Goal.match_id == match_id).offset(skip).limit(limit).all()
-    
+    """List all goals for a specific match, or 304 if the client's ETag is still current."""
+    conditional_get(request, response, db, [tag("matches", match_id), "players", "teams"])
+    goals, next_cursor = crud.get_page(
+        db,
+        query=crud.query(db).filter(Goal.match_id == match_id),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+        # In the order they were scored, as CRUDGoal.get_by_match
+        keyset=("minute", "id"),
+    )
+    set_next_cursor(response, next_cursor)
     return goals
 
 
 @router.get("/player/{player_id}", response_model=list[GoalSchema])
 def list_goals_by_player(
+    response: Response,
     player_id: int = Path(...),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db),
 ):
     """List all goals scored by a specific player."""
-    goals = db.query(Goal).options(
-        joinedload(Goal.match),
-        joinedload(Goal.team)
-    ).filter(Goal.player_id == player_id).offset(skip).limit(limit).all()
-    
+    goals, next_cursor = crud.get_page(
+        db,
+        query=crud.query(db).filter(Goal.player_id == player_id),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
     return goals
 
 
 @router.get("/team/{team_id}", response_model=list[GoalSchema])
 def list_goals_by_team(
+    response: Response,
     team_id: int = Path(...),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db),
 ):
     """List all goals scored by a specific team."""
-    goals = db.query(Goal).options(
-        joinedload(Goal.player),
-        joinedload(Goal.match)
-    ).filter(Goal.team_id == team_id).offset(skip).limit(limit).all()
-    
+    goals, next_cursor = crud.get_page(
+        db,
+        query=crud.query(db).filter(Goal.team_id == team_id),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
     return goals 
\ No newline at end of file
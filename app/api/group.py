@@ -1,23 +1,36 @@
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.api.crud_base import CRUDBase
+from app.core.pagination import set_next_cursor
+from app.core.standings import rebuild_group_standings
+from app.core.timing import TimedRoute
 from app.db.database import get_db
 from app.models.group import Group as GroupModel
 from app.models.team import Team as TeamModel
 from app.schemas.group import Group, GroupCreate, GroupUpdate, TeamToGroup
 
-router = APIRouter()
-crud = CRUDBase[GroupModel, GroupCreate, GroupUpdate](GroupModel)
+router = APIRouter(route_class=TimedRoute)
+crud = CRUDBase[GroupModel, GroupCreate, GroupUpdate](
+    GroupModel, loaders=(selectinload(GroupModel.teams),)
+)
 
 
 @router.get("/", response_model=list[Group])
-def get_groups(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_groups(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve all groups.
     """
-    return crud.get_all(db, skip=skip, limit=limit)
+    groups, next_cursor = crud.get_page(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return groups
 
 
 @router.post("/", response_model=Group)
@@ -88,6 +101,7 @@ def add_team_to_group(
         raise HTTPException(status_code=404, detail="Team not found")
 
     db_group.teams.append(db_team)
+    rebuild_group_standings(db, group_id)
     db.commit()
     db.refresh(db_group)
     return db_group
@@ -115,6 +129,7 @@ def remove_team_from_group(group_id: int, team_id: int, db: Session = Depends(ge
         raise HTTPException(status_code=400, detail="Team is not in this group")
 
     db_group.teams.remove(db_team)
+    rebuild_group_standings(db, group_id)
     db.commit()
     db.refresh(db_group)
     return db_group
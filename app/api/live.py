@@ -0,0 +1,151 @@
+"""Live update streams for tournaments and matches."""
+import asyncio
+import contextlib
+import json
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.config import settings
+from app.core.live import GOAL_FIELDS, MatchChannel, event_stream, match_center
+from app.core.timing import TimedRoute
+from app.db.database import get_async_db
+from app.models.goal import Goal
+from app.models.match import Match
+from app.models.tournament import Tournament
+
+router = APIRouter(route_class=TimedRoute)
+
+
+@router.get("/tournament/{tournament_id}")
+async def tournament_feed(
+    tournament_id: int = Path(...),
+    last_event_id: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Stream goals, score and status changes and standings deltas for a tournament.
+
+    The response is a Server-Sent Events stream. Each event has an ``id``;
+    reconnecting with it in ``Last-Event-ID`` replays the events missed in
+    between, or sends ``reset`` if they are no longer available.
+
+    Args:
+        tournament_id: ID of the tournament
+        last_event_id: ID of the last event the client received
+        db: Database session
+
+    Returns:
+        A text/event-stream response that stays open until the client leaves
+    """
+    tournament = await db.get(Tournament, tournament_id)
+    # The stream outlives the request scope, so don't hold a connection open
+    await db.close()
+    if tournament is None:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    return StreamingResponse(
+        event_stream(tournament_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _goal_order(goal: Goal) -> tuple:
+    """Sort key by minute, goals without one first as in the paged goal lists."""
+    return (goal.minute is not None, goal.minute or 0, goal.id)
+
+
+def match_snapshot(match: Match) -> dict[str, Any]:
+    """Full current state of a match, sent when a client starts following it."""
+    return {
+        "type": "snapshot",
+        "match_id": match.id,
+        "home_score": match.home_score,
+        "away_score": match.away_score,
+        "status": match.status,
+        "goals": [
+            {"action": "created", **{field: getattr(goal, field) for field in GOAL_FIELDS}}
+            for goal in sorted(match.goals, key=_goal_order)
+        ],
+    }
+
+
+async def follow_matches(db: AsyncSession, channel: MatchChannel, match_ids: list[int]) -> None:
+    """Follow ``match_ids`` on ``channel`` and queue their snapshots."""
+    match_ids = [m for m in dict.fromkeys(match_ids) if m not in channel.match_ids]
+    if len(channel.match_ids) + len(match_ids) > settings.LIVE_MAX_MATCHES:
+        channel.send({
+            "type": "error",
+            "detail": f"At most {settings.LIVE_MAX_MATCHES} matches can be followed",
+        })
+        return
+
+    # Follow before reading so no committed update falls between snapshot and deltas
+    for match_id in match_ids:
+        channel.expect_snapshot(match_id)
+    match_center.follow(channel, match_ids)
+    result = await db.scalars(
+        select(Match).options(selectinload(Match.goals)).where(Match.id.in_(match_ids))
+    )
+    matches = {match.id: match for match in result}
+    await db.close()
+
+    for match_id in match_ids:
+        if match_id in matches:
+            channel.send(match_snapshot(matches[match_id]))
+        else:
+            match_center.unfollow(channel, [match_id])
+            channel.send({"type": "error", "match_id": match_id, "detail": "Match not found"})
+
+
+async def send_updates(websocket: WebSocket, channel: MatchChannel) -> None:
+    """Write queued messages to the socket as fast as the client reads them."""
+    while True:
+        for message in await channel.next_messages():
+            await websocket.send_json(message)
+
+
+@router.websocket("/matches")
+async def match_center_socket(websocket: WebSocket, db: AsyncSession = Depends(get_async_db)):
+    """
+    Match center: follow several matches over one WebSocket.
+
+    Clients send ``{"action": "subscribe" | "unsubscribe", "match_ids": [...]}``.
+    Each followed match first gets a ``snapshot`` with its score, status and
+    goals, then ``delta`` messages with only what changed. Updates that
+    arrive while the client is still reading are merged into one delta, so
+    slow clients skip intermediate states instead of falling behind.
+    """
+    await websocket.accept()
+    channel = MatchChannel()
+    sender = asyncio.create_task(send_updates(websocket, channel))
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                message = None
+            action = message.get("action") if isinstance(message, dict) else None
+            match_ids = message.get("match_ids") if isinstance(message, dict) else None
+            if (
+                action not in ("subscribe", "unsubscribe")
+                or not isinstance(match_ids, list)
+                or not all(isinstance(m, int) for m in match_ids)
+            ):
+                channel.send({"type": "error", "detail": "Invalid message"})
+            elif action == "subscribe":
+                await follow_matches(db, channel, match_ids)
+            else:
+                match_center.unfollow(channel, match_ids)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        match_center.close(channel)
+        sender.cancel()
+        with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect):
+            await sender
@@ -1,26 +1,41 @@
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
-from app.api.crud_base import CRUDBase
+from app.core.bulk import NDJSON_TYPES, read_bulk_items
+from app.core.cache import get_or_set, to_json_data
+from app.core.config import settings
+from app.core.etag import conditional_get
+from app.core.events import tag
+from app.core.pagination import set_next_cursor
+from app.core.timing import TimedRoute
+from app.crud import goal as crud_goal
+from app.crud.match import CRUDMatch
 from app.db.database import get_db
 from app.models.match import Match
+from app.schemas.bulk import BulkResult
+from app.schemas.goal import MatchGoalsCreate
 from app.schemas.match import Match as MatchSchema
 from app.schemas.match import MatchCreate, MatchResult, MatchUpdate
 
-router = APIRouter()
-crud = CRUDBase(Match)
+router = APIRouter(route_class=TimedRoute)
+crud = CRUDMatch(Match, loaders=(joinedload(Match.home_team), joinedload(Match.away_team)))
 
 
 @router.get("/", response_model=list[MatchSchema])
 def get_matches(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db)
 ):
-    """Get all matches."""
-    return crud.get_all(db, skip=skip, limit=limit)
+    """Get all matches, ordered by date."""
+    matches, next_cursor = crud.get_page(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return matches
 
 
 @router.post("/", response_model=MatchSchema)
@@ -34,13 +49,46 @@ def create_match(match: MatchCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Invalid data for match creation")
 
 
+BULK_BODY = {
+    "required": True,
+    "content": {
+        content_type: {
+            "schema": {"type": "array", "items": {"$ref": "#/components/schemas/MatchCreate"}}
+        }
+        for content_type in ("application/json", *NDJSON_TYPES[:1])
+    },
+}
+
+
+@router.post("/bulk", response_model=BulkResult, openapi_extra={"requestBody": BULK_BODY})
+async def create_matches_bulk(
+    request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """
+    Create many matches in one transaction, e.g. a season's fixture list.
+
+    The body is a JSON array of matches, or one match per line with
+    ``Content-Type: application/x-ndjson``. References are checked with
+    one query per table; if any row is invalid nothing is inserted and the
+    response is 422 with the errors of every invalid row.
+    """
+    rows, errors = await read_bulk_items(request, MatchCreate, settings.BULK_MAX_ITEMS)
+    ids = await run_in_threadpool(crud.import_matches, db, rows, errors)
+    if errors:
+        response.status_code = 422
+    return BulkResult(created=len(ids), ids=ids, errors=errors)
+
+
 @router.get("/{match_id}", response_model=MatchSchema)
-def read_match(match_id: int = Path(...), db: Session = Depends(get_db)):
-    """Get a match by ID."""
-    db_match = db.query(Match).options(
-        joinedload(Match.home_team),
-        joinedload(Match.away_team)
-    ).filter(Match.id == match_id).first()
+def read_match(
+    request: Request,
+    response: Response,
+    match_id: int = Path(...),
+    db: Session = Depends(get_db),
+):
+    """Get a match by ID, or 304 if the client's ETag is still current."""
+    conditional_get(request, response, db, [tag("matches", match_id), "teams"])
+    db_match = crud.query(db).filter(Match.id == match_id).first()
     
     if db_match is None:
         raise HTTPException(status_code=404, detail="Match not found")
@@ -83,7 +131,7 @@ def update_match_result(
     match_id: int = Path(...),
     db: Session = Depends(get_db),
 ):
-    """Update a match result."""
+    """Update a match result and apply it to the group standings."""
     db_match = crud.get(db, id=match_id)
     if db_match is None:
         raise HTTPException(status_code=404, detail="Match not found")
@@ -96,55 +144,107 @@ def update_match_result(
         raise HTTPException(status_code=400, detail="Invalid data for match result update")
 
 
+@router.post("/{match_id}/goals/bulk", response_model=BulkResult)
+def create_match_goals_bulk(
+    sheet: MatchGoalsCreate,
+    response: Response,
+    match_id: int = Path(...),
+    db: Session = Depends(get_db),
+):
+    """
+    Record a whole match sheet: replace the match's goals and set the final score.
+
+    The goals are checked against both teams' rosters, loaded in one query.
+    The score is counted from the goals' teams and the match is completed;
+    standings and scorer statistics are updated once, in the same transaction.
+    If any goal is invalid nothing is written and the response is 422.
+    """
+    db_match = crud.get(db, id=match_id)
+    if db_match is None:
+        raise HTTPException(status_code=404, detail="Match not found")
+
+    errors = crud_goal.check_match_goals(db, match=db_match, goals=sheet.goals)
+    if errors:
+        response.status_code = 422
+        return BulkResult(created=0, errors=errors)
+
+    ids = crud_goal.replace_match_goals(db, match=db_match, goals=sheet.goals)
+    return BulkResult(created=len(ids), ids=ids)
+
+
 @router.get("/tournament/{tournament_id}", response_model=list[MatchSchema])
 def list_matches_by_tournament(
+    response: Response,
     tournament_id: int = Path(...),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db),
 ):
-    """List all matches for a tournament."""
-    matches = db.query(Match).options(
-        joinedload(Match.home_team),
-        joinedload(Match.away_team)
-    ).filter(
-        Match.tournament_id == tournament_id
-    ).offset(skip).limit(limit).all()
-    
-    return matches
+    """List all matches for a tournament, cached until one of them or their teams change."""
+    def load():
+        matches, next_cursor = crud.get_page(
+            db,
+            query=crud.query(db).filter(Match.tournament_id == tournament_id),
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
+        return {
+            "matches": to_json_data(list[MatchSchema], matches),
+            "next_cursor": next_cursor,
+        }
+
+    page = get_or_set(
+        f"matches:tournament:{tournament_id}:{skip}:{limit}:{cursor}",
+        load,
+        tags=lambda page: [
+            tag("tournaments", tournament_id),
+            *(tag("teams", m["home_team_id"]) for m in page["matches"]),
+            *(tag("teams", m["away_team_id"]) for m in page["matches"]),
+        ],
+    )
+    set_next_cursor(response, page["next_cursor"])
+    return page["matches"]
 
 
 @router.get("/phase/{phase_id}", response_model=list[MatchSchema])
 def list_matches_by_phase(
+    response: Response,
     phase_id: int = Path(...),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db),
 ):
-    """List all matches for a phase."""
-    matches = db.query(Match).options(
-        joinedload(Match.home_team),
-        joinedload(Match.away_team)
-    ).filter(
-        Match.phase_id == phase_id
-    ).offset(skip).limit(limit).all()
-    
+    """List all matches for a phase, ordered by date."""
+    matches, next_cursor = crud.get_page(
+        db,
+        query=crud.query(db).filter(Match.phase_id == phase_id),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
     return matches
 
 
 @router.get("/group/{group_id}", response_model=list[MatchSchema])
 def list_matches_by_group(
+    response: Response,
     group_id: int = Path(...),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
     db: Session = Depends(get_db),
 ):
-    """List all matches for a group."""
-    matches = db.query(Match).options(
-        joinedload(Match.home_team),
-        joinedload(Match.away_team)
-    ).filter(
-        Match.group_id == group_id
-    ).offset(skip).limit(limit).all()
-    
+    """List all matches for a group, ordered by date."""
+    matches, next_cursor = crud.get_page(
+        db,
+        query=crud.query(db).filter(Match.group_id == group_id),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
     return matches 
\ No newline at end of file
@@ -1,22 +1,32 @@
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
+from app.core.pagination import set_next_cursor
+from app.core.timing import TimedRoute
 from app.db.database import get_db
 from app.models.phase import Phase as PhaseModel
 from app.schemas.phase import Phase, PhaseCreate, PhaseUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 crud = CRUDBase[PhaseModel, PhaseCreate, PhaseUpdate](PhaseModel)
 
 
 @router.get("/", response_model=list[Phase])
-def get_phases(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_phases(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve all phases.
     """
-    return crud.get_all(db, skip=skip, limit=limit)
+    phases, next_cursor = crud.get_page(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return phases
 
 
 @router.post("/", response_model=Phase)
@@ -1,26 +1,36 @@
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app import crud
 from app.api.crud_base import CRUDBase
+from app.core.pagination import set_next_cursor
+from app.core.timing import TimedRoute
 from app.db.database import get_db
 from app.models.player import Player as PlayerModel
 from app.models.tournament import Tournament as TournamentModel
 from app.schemas.player import Player, PlayerCreate, PlayerUpdate
 from app.schemas.player_stats import PlayerStats
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 crud_player = CRUDBase[PlayerModel, PlayerCreate, PlayerUpdate](PlayerModel)
 crud_tournament = CRUDBase[TournamentModel, TournamentModel, TournamentModel](TournamentModel)
 
 
 @router.get("/", response_model=list[Player])
-def get_players(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_players(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve all players.
     """
-    return crud_player.get_all(db, skip=skip, limit=limit)
+    players, next_cursor = crud_player.get_page(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return players
 
 
 @router.post("/", response_model=Player)
@@ -62,11 +72,26 @@ def delete_player(player_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/team/{team_id}", response_model=list[Player])
-def get_players_by_team(team_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_players_by_team(
+    response: Response,
+    team_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
     """
     Get all players for a specific team.
     """
-    return db.query(PlayerModel).filter(PlayerModel.team_id == team_id).offset(skip).limit(limit).all()
+    players, next_cursor = crud_player.get_page(
+        db,
+        query=db.query(PlayerModel).filter(PlayerModel.team_id == team_id),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
+    return players
 
 
 @router.get("/{player_id}/stats", response_model=PlayerStats)
@@ -6,11 +6,12 @@ from sqlalchemy.orm import Session, joinedload
 from app import crud
 from app.api.player import crud_player
 from app.api.tournament import crud_tournament
+from app.core.timing import TimedRoute
 from app.db.database import get_db
 from app.models.player_stats import PlayerStats as PlayerStatsModel
 from app.schemas.player_stats import PlayerStats, PlayerStatsCreate, PlayerStatsUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/", response_model=list[PlayerStats])
@@ -191,44 +192,15 @@ def update_stats_from_goals(
             detail=f"Tournament with ID {tournament_id} not found",
         )
     
-    updated_stats = []
-    
     if player_id:
-        # Update stats for a specific player
         player = crud_player.get(db=db, id=player_id)
         if not player:
             raise HTTPException(
                 status_code=404,
                 detail=f"Player with ID {player_id} not found",
             )
-        
-        stats = crud.player_stats.update_stats_from_goals(
-            db=db, player_id=player_id, tournament_id=tournament_id
-        )
-        if stats:
-            updated_stats.append(stats)
-    else:
-        # Get all matches in the tournament
-        tournament_matches = crud.match.get_by_tournament(
-            db=db, tournament_id=tournament_id
-        )
-        match_ids = [m.id for m in tournament_matches]
-        
-        # Get all goals in these matches
-        all_goals = []
-        for match_id in match_ids:
-            match_goals = crud.goal.get_by_match(db=db, match_id=match_id)
-            all_goals.extend(match_goals)
-        
-        # Get unique player IDs from goals
-        player_ids = set(goal.player_id for goal in all_goals)
-        
-        # Update stats for each player
-        for pid in player_ids:
-            stats = crud.player_stats.update_stats_from_goals(
-                db=db, player_id=pid, tournament_id=tournament_id
-            )
-            if stats:
-                updated_stats.append(stats)
     
-    return updated_stats 
\ No newline at end of file
+    # One aggregate query over the tournament's goals and a single bulk write
+    return crud.player_stats.update_tournament_stats_from_goals(
+        db=db, tournament_id=tournament_id, player_id=player_id
+    )
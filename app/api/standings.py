@@ -1,31 +1,57 @@
 """API endpoints for team standings."""
 
-from fastapi import APIRouter, Depends, HTTPException, Path
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
 from sqlalchemy.orm import Session
 
-from app.core.standings import calculate_group_standings
+from app.core.cache import get_or_set, to_json_data
+from app.core.etag import SHORT_LIVED, conditional_get
+from app.core.events import tag
+from app.core.standings import get_group_standings as read_group_standings
+from app.core.timing import TimedRoute
 from app.db.database import get_db
 from app.models.group import Group
 from app.schemas.team_standing import TeamStanding
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/group/{group_id}", response_model=list[TeamStanding])
-def get_group_standings(group_id: int = Path(...), db: Session = Depends(get_db)):
+def get_group_standings(
+    request: Request,
+    response: Response,
+    group_id: int = Path(...),
+    db: Session = Depends(get_db),
+):
     """
     Get standings for all teams in a group.
+
+    Served from the persisted group table maintained on every result write,
+    and cached until a write touches the group or one of its teams.
+    Answers 304 while the client's ETag is still current.
     
     Args:
+        request: Incoming request, checked for If-None-Match
+        response: Outgoing response, given ETag and Cache-Control headers
         group_id: ID of the group
         db: Database session
         
     Returns:
         List of TeamStanding objects sorted by points and goal difference
     """
-    group = db.query(Group).filter(Group.id == group_id).first()
-    if not group:
-        raise HTTPException(status_code=404, detail="Group not found")
-    
-    standings = calculate_group_standings(db, group_id)
-    return standings 
\ No newline at end of file
+    conditional_get(
+        request, response, db, [tag("groups", group_id), "teams"], cache_control=SHORT_LIVED
+    )
+
+    def load():
+        group = db.query(Group).filter(Group.id == group_id).first()
+        if not group:
+            raise HTTPException(status_code=404, detail="Group not found")
+        return to_json_data(list[TeamStanding], read_group_standings(db, group_id))
+
+    return get_or_set(
+        f"standings:group:{group_id}",
+        load,
+        tags=lambda standings: [
+            tag("groups", group_id), *(tag("teams", s["team_id"]) for s in standings)
+        ],
+    ) 
\ No newline at end of file
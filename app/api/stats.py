@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.dashboard import get_summary
+from app.core.timing import TimedRoute
+from app.db.database import get_db
+from app.schemas.stats_summary import StatsSummary
+
+router = APIRouter(route_class=TimedRoute)
+
+
+@router.get("/summary", response_model=StatsSummary)
+def get_stats_summary(
+    tournament_id: int | None = Query(None, description="Limit to one tournament"),
+    db: Session = Depends(get_db),
+):
+    """
+    Completed matches, goals, goals per match and clean sheets.
+
+    Computed in one query and cached until the next result write to the
+    tournament (or to any tournament, for the overall summary).
+    """
+    return get_summary(db, tournament_id)
@@ -1,24 +1,35 @@
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
+from app.api.player import crud_player
+from app.core.pagination import set_next_cursor
+from app.core.timing import TimedRoute
 from app.db.database import get_db
 from app.models.player import Player as PlayerModel
 from app.models.team import Team as TeamModel
 from app.schemas.player import Player, PlayerCreate
 from app.schemas.team import Team, TeamCreate, TeamUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 crud = CRUDBase[TeamModel, TeamCreate, TeamUpdate](TeamModel)
 
 
 @router.get("/", response_model=list[Team])
-def get_teams(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_teams(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
     """
     Retrieve all teams.
     """
-    return crud.get_all(db, skip=skip, limit=limit)
+    teams, next_cursor = crud.get_page(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return teams
 
 
 @router.post("/", response_model=Team)
@@ -83,7 +94,14 @@ def create_team_player(team_id: int, player: PlayerCreate, db: Session = Depends
 
 
 @router.get("/{team_id}/players/", response_model=list[Player])
-def get_team_players(team_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_team_players(
+    response: Response,
+    team_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
     """
     Get all players for a specific team.
     """
@@ -91,5 +109,12 @@ def get_team_players(team_id: int, skip: int = 0, limit: int = 100, db: Session
     if db_team is None:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    players = db.query(PlayerModel).filter(PlayerModel.team_id == team_id).offset(skip).limit(limit).all()
+    players, next_cursor = crud_player.get_page(
+        db,
+        query=db.query(PlayerModel).filter(PlayerModel.team_id == team_id),
+        skip=skip,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
     return players
@@ -4,10 +4,14 @@ from fastapi import APIRouter, Depends, HTTPException, Path
 from sqlalchemy.orm import Session
 
 from app import crud
+from app.api.tournament import crud_tournament
+from app.core.cache import get_or_set, to_json_data
+from app.core.events import tag
+from app.core.timing import TimedRoute
 from app.db.database import get_db
 from app.schemas.team_stats import TeamStats
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/", response_model=list[TeamStats])
@@ -52,9 +56,17 @@ def get_tournament_team_stats(
 ) -> Any:
     """
     Get all team statistics for a tournament, ranked by points.
+    
+    Cached until a write touches the tournament or one of the ranked teams.
     """
-    return crud.team_stats.get_tournament_teams_ranked(
-        db=db, tournament_id=tournament_id, limit=limit
+    return get_or_set(
+        f"team-stats:tournament:{tournament_id}:{limit}",
+        lambda: to_json_data(list[TeamStats], crud.team_stats.get_tournament_teams_ranked(
+            db=db, tournament_id=tournament_id, limit=limit
+        )),
+        tags=lambda stats: [
+            tag("tournaments", tournament_id), *(tag("teams", s["team_id"]) for s in stats)
+        ],
     )
 
 
@@ -91,4 +103,22 @@ def update_team_stats(
     if not stats:
         raise HTTPException(status_code=404, detail="Team or tournament not found")
     
-    return stats 
\ No newline at end of file
+    return stats
+
+
+@router.post("/recompute/{tournament_id}", response_model=list[TeamStats])
+def recompute_tournament_team_stats(
+    tournament_id: int = Path(...),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    Recalculate statistics for every team in a tournament.
+    
+    Aggregates all completed matches in a single pass and writes all team
+    statistics in one transaction. Returns the teams ranked by points.
+    """
+    tournament = crud_tournament.get(db, id=tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    
+    return crud.team_stats.recompute_tournament(db=db, tournament_id=tournament_id)
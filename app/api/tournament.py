@@ -1,15 +1,20 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
+from app.core.cache import get_or_set, to_json_data
+from app.core.events import tag
+from app.core.export import ENTITIES, FORMATS, export_csv, export_ndjson
+from app.core.timing import TimedRoute
 from app.crud import player_stats as crud_player_stats
 from app.db.database import get_db
 from app.models.tournament import Tournament as TournamentModel
-from app.schemas.player_stats import PlayerStats
+from app.schemas.player_stats import TopScorer
 from app.schemas.tournament import Tournament, TournamentCreate, TournamentUpdate
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 crud_tournament = CRUDBase[TournamentModel, TournamentCreate, TournamentUpdate](TournamentModel)
 
 
@@ -61,7 +66,7 @@ def delete_tournament(tournament_id: int, db: Session = Depends(get_db)):
     return crud_tournament.delete(db, id=tournament_id)
 
 
-@router.get("/{tournament_id}/top-scorers", response_model=list[PlayerStats])
+@router.get("/{tournament_id}/top-scorers", response_model=list[TopScorer])
 def get_tournament_top_scorers(
     tournament_id: int, 
     limit: int = Query(5, ge=1, le=50, description="Number of top scorers to return"),
@@ -69,13 +74,72 @@ def get_tournament_top_scorers(
 ):
     """
     Get top scorers for a tournament.
+    
+    Read-only: counts are computed from goals and never written back. Cached
+    until a goal or match of the tournament, or a listed player, changes.
     """
-    # Check if tournament exists
-    db_tournament = crud_tournament.get(db, id=tournament_id)
-    if db_tournament is None:
+    def load():
+        # Check if tournament exists
+        db_tournament = crud_tournament.get(db, id=tournament_id)
+        if db_tournament is None:
+            raise HTTPException(status_code=404, detail="Tournament not found")
+        
+        # Get top scorers
+        return to_json_data(list[TopScorer], crud_player_stats.get_tournament_top_scorers(
+            db=db, tournament_id=tournament_id, limit=limit
+        ))
+
+    return get_or_set(
+        f"top-scorers:tournament:{tournament_id}:{limit}",
+        load,
+        tags=lambda scorers: [
+            tag("tournaments", tournament_id),
+            *(tag("players", s["player_id"]) for s in scorers),
+            *(tag("teams", s["team"]["id"]) for s in scorers if s["team"]),
+        ],
+    )
+
+
+@router.get("/{tournament_id}/export")
+def export_tournament(
+    tournament_id: int,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    entity: str | None = Query(
+        None,
+        pattern=f"^({'|'.join(ENTITIES)})$",
+        description="Export only this entity; required for csv",
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Stream a tournament's matches, goals, players and statistics.
+
+    NDJSON lines carry an ``entity`` field; CSV exports one entity per
+    request. Rows are streamed from server-side cursors, so large
+    tournaments are exported in one call with flat memory use.
+    """
+    if crud_tournament.get(db, id=tournament_id) is None:
         raise HTTPException(status_code=404, detail="Tournament not found")
-    
-    # Get top scorers
-    return crud_player_stats.get_tournament_top_scorers(
-        db=db, tournament_id=tournament_id, limit=limit
+    if format == "csv" and entity is None:
+        raise HTTPException(status_code=400, detail="CSV export needs an entity")
+
+    if format == "csv":
+        chunks = export_csv(db, tournament_id, entity)
+        filename = f"tournament-{tournament_id}-{entity}.csv"
+    else:
+        chunks = export_ndjson(db, tournament_id, [entity] if entity else list(ENTITIES))
+        filename = f"tournament-{tournament_id}.ndjson"
+
+    def stream():
+        # The request's session is closed before the body is sent; reading
+        # reopens it, so close it again once the export is done
+        try:
+            yield from chunks
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type=FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -0,0 +1,82 @@
+"""Parsing of bulk request bodies sent as a JSON array, NDJSON or a JSON text sequence."""
+import json
+from collections.abc import AsyncIterator
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, Request
+from pydantic import BaseModel, ValidationError
+
+from app.schemas.bulk import BulkRowError
+
+SchemaType = TypeVar("SchemaType", bound=BaseModel)
+
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-seq")
+
+# Record separators of the streamed formats; RFC 7464 starts each record with RS
+_SEPARATORS = {"application/json-seq": b"\x1e"}
+
+
+def _format_errors(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" if e["loc"] else e["msg"]
+        for e in error.errors(include_url=False)
+    ]
+
+
+async def _record_items(request: Request, separator: bytes = b"\n") -> AsyncIterator[Any]:
+    """Decode one JSON document per record as the body streams in."""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *records, buffer = buffer.split(separator)
+        for record in records:
+            if record.strip():
+                yield json.loads(record)
+    if buffer.strip():
+        yield json.loads(buffer)
+
+
+async def read_bulk_items(
+    request: Request, schema: type[SchemaType], max_items: int
+) -> tuple[list[tuple[int, SchemaType]], list[BulkRowError]]:
+    """
+    Validate every row of a bulk body against ``schema``.
+
+    Rows are numbered from 0 in request order. Rows that fail validation are
+    reported instead of aborting the whole request.
+
+    Returns:
+        The valid rows with their index, and the errors of the invalid ones
+
+    Raises:
+        HTTPException: 400 for a body that isn't a JSON array, NDJSON or json-seq,
+            413 for more than ``max_items`` rows
+    """
+    items: list[tuple[int, SchemaType]] = []
+    errors: list[BulkRowError] = []
+
+    def add(index: int, raw: Any) -> None:
+        if index >= max_items:
+            raise HTTPException(status_code=413, detail=f"At most {max_items} rows per request")
+        try:
+            items.append((index, schema.model_validate(raw)))
+        except ValidationError as e:
+            errors.append(BulkRowError(index=index, errors=_format_errors(e)))
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    try:
+        if content_type in NDJSON_TYPES:
+            index = 0
+            async for raw in _record_items(request, _SEPARATORS.get(content_type, b"\n")):
+                add(index, raw)
+                index += 1
+        else:
+            rows = json.loads(await request.body())
+            if not isinstance(rows, list):
+                raise HTTPException(status_code=400, detail="Expected a JSON array of rows")
+            for index, raw in enumerate(rows):
+                add(index, raw)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Malformed body: {e}")
+
+    return items, errors
@@ -0,0 +1,211 @@
+"""Response cache for read endpoints, invalidated by change events.
+
+Entries are stored as JSON-compatible data together with tags naming the
+rows they were built from (see app.core.events). A committed write to any
+of those rows drops the entry; the TTL bounds staleness for writes that
+bypass the ORM.
+
+The backend is chosen with ``CACHE_BACKEND``: ``memory`` (per-process LRU,
+the default), ``redis`` (shared between workers, needs the ``redis``
+package) or ``none``.
+"""
+import functools
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any, Protocol
+
+from pydantic import TypeAdapter
+
+from app.core import events
+from app.core.config import settings
+
+Tags = Iterable[str] | Callable[[Any], Iterable[str]]
+
+
+class CacheBackend(Protocol):
+    """Storage used by the response cache."""
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str], ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Drop every entry stored with any of ``tags``."""
+
+    def clear(self) -> None:
+        """Drop every entry."""
+
+
+class NullCache:
+    """Backend that never stores anything."""
+
+    def get(self, key: str) -> Any | None:
+        return None
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str], ttl: float) -> None:
+        pass
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class MemoryCache:
+    """In-process LRU cache with per-entry TTL and a tag index."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any, frozenset[str]]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value, _ = entry
+            if expires < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str], ttl: float) -> None:
+        tags = frozenset(tags)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._keys_by_tag.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in self._keys_by_tag.pop(tag, ()):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+class RedisCache:
+    """Cache shared by all workers, stored in Redis."""
+
+    def __init__(self, url: str, prefix: str = "torneig:cache:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package") from e
+        self._redis = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        raw = self._redis.get(self.prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, *, tags: Iterable[str], ttl: float) -> None:
+        pipe = self._redis.pipeline()
+        pipe.set(self.prefix + key, json.dumps(value), px=int(ttl * 1000))
+        for tag in tags:
+            pipe.sadd(f"{self.prefix}tag:{tag}", key)
+            # Tag sets live as long as the newest entry that uses them
+            pipe.pexpire(f"{self.prefix}tag:{tag}", int(ttl * 1000))
+        pipe.execute()
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            tag_key = f"{self.prefix}tag:{tag}"
+            keys = self._redis.smembers(tag_key)
+            pipe = self._redis.pipeline()
+            if keys:
+                pipe.delete(*(self.prefix + key.decode() for key in keys))
+            pipe.delete(tag_key)
+            pipe.execute()
+
+    def clear(self) -> None:
+        keys = list(self._redis.scan_iter(match=f"{self.prefix}*"))
+        if keys:
+            self._redis.delete(*keys)
+
+
+def create_cache() -> CacheBackend:
+    """Build the backend selected in the settings."""
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCache(settings.CACHE_REDIS_URL)
+    if settings.CACHE_BACKEND == "none":
+        return NullCache()
+    return MemoryCache(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+cache: CacheBackend = create_cache()
+
+# Bumped on every invalidation, so a value loaded while a write committed
+# is not stored over the invalidation it raced with
+_invalidations = 0
+
+
+def get_or_set(key: str, loader: Callable[[], Any], *, tags: Tags, ttl: float | None = None) -> Any:
+    """
+    Return the cached value for ``key``, computing and storing it on a miss.
+
+    ``tags`` may be a callable receiving the loaded value, for entries whose
+    dependencies are only known from the data (e.g. the teams listed).
+    """
+    value = cache.get(key)
+    if value is None:
+        seen = _invalidations
+        value = loader()
+        if seen != _invalidations:
+            return value
+        cache.set(
+            key,
+            value,
+            tags=tags(value) if callable(tags) else tags,
+            ttl=settings.CACHE_TTL if ttl is None else ttl,
+        )
+    return value
+
+
+@functools.cache
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def to_json_data(schema: Any, value: Any) -> Any:
+    """Validate ORM objects against ``schema`` and dump them as cacheable JSON data."""
+    adapter = _adapter(schema)
+    return adapter.dump_python(adapter.validate_python(value, from_attributes=True), mode="json")
+
+
+@events.subscribe
+def _invalidate_on_change(change: events.ChangeEvent) -> None:
+    """Drop cached reads built from the row that changed, or from its whole table."""
+    global _invalidations
+    _invalidations += 1
+    cache.invalidate({*change.tags, change.entity})
@@ -0,0 +1,88 @@
+"""Maintained row counts of the tables totalled on the home page.
+
+Every flush adds the rows it created and subtracts the rows it deleted,
+in the same transaction, so reading the totals is a single-row-per-table
+lookup instead of a COUNT(*) scan per table. Core inserts made through
+``CRUDBase.insert_rows`` are counted too; other writes that bypass the
+ORM are not, and deleting a table's row in ``row_counts`` makes the next
+read count it again.
+
+Migration d3a9f1c6b742 seeds the counts; databases created without it
+(``Base.metadata.create_all``) are primed on their first read.
+"""
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import event, func, insert, inspect, literal, select, text, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.db.database import Base
+from app.models.row_count import RowCount
+
+# Tables whose rows are counted
+COUNTED = ("tournaments", "teams", "phases", "groups", "matches")
+
+_counts = RowCount.__table__
+
+
+def adjust(connection: Connection, deltas: dict[str, int]) -> None:
+    """Add ``deltas`` to the stored counts; tables not primed yet are left alone."""
+    for table_name, delta in deltas.items():
+        if delta and table_name in COUNTED:
+            connection.execute(
+                update(_counts)
+                .where(_counts.c.table_name == table_name)
+                .values(count=_counts.c.count + delta)
+            )
+
+
+def prime(db: Session, table_names: Iterable[str]) -> dict[str, int]:
+    """
+    Count the rows of ``table_names`` once and store the counts.
+
+    Each count is taken by the INSERT that stores it, with the table locked
+    against writes on PostgreSQL (SQLite runs one writer at a time anyway).
+    A row inserted concurrently is therefore either counted here or adjusts
+    the stored count afterwards, never neither.
+    """
+    table_names = list(table_names)
+    try:
+        for name in table_names:
+            if db.get_bind().dialect.name == "postgresql":
+                # Waits for open writes to the table and holds off new ones until commit
+                db.execute(text(f"LOCK TABLE {name} IN SHARE MODE"))
+            db.execute(insert(_counts).from_select(
+                ["table_name", "count"],
+                select(literal(name), func.count()).select_from(Base.metadata.tables[name]),
+            ))
+        db.commit()
+    except IntegrityError:
+        # Primed concurrently by another request; its counts are as good
+        db.rollback()
+    return dict(db.execute(
+        select(_counts.c.table_name, _counts.c.count).where(_counts.c.table_name.in_(table_names))
+    ).tuples().all())
+
+
+def get_counts(db: Session) -> dict[str, int]:
+    """Number of rows of every counted table, priming any not counted yet."""
+    counts = dict(db.execute(select(_counts.c.table_name, _counts.c.count)).tuples().all())
+    missing = [name for name in COUNTED if name not in counts]
+    if missing:
+        counts.update(prime(db, missing))
+    return {name: counts[name] for name in COUNTED}
+
+
+@event.listens_for(Session, "after_flush")
+def _count_flushed_rows(session: Session, flush_context: Any) -> None:
+    """Apply the rows created and deleted by this flush to the counts."""
+    deltas: Counter[str] = Counter()
+    for obj in session.new:
+        deltas[inspect(obj).mapper.local_table.name] += 1
+    for obj in session.deleted:
+        deltas[inspect(obj).mapper.local_table.name] -= 1
+    if any(deltas[name] for name in COUNTED):
+        adjust(session.connection(), deltas)
@@ -0,0 +1,58 @@
+"""Headline numbers of the stats overview, for all tournaments or one."""
+from typing import Any
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_or_set
+from app.core.events import tag
+from app.models.goal import Goal
+from app.models.match import Match
+from app.models.team_stats import TeamStats
+
+# Tables the summary is computed from; a global summary is dropped on any write to them
+SUMMARY_TABLES = ("matches", "goals", "team_stats")
+
+
+def summary_statement(tournament_id: int | None = None) -> Select:
+    """One statement returning completed matches, goals and clean sheets."""
+    matches = select(func.count(Match.id)).where(Match.status == "completed")
+    goals = select(func.count(Goal.id))
+    clean_sheets = select(func.coalesce(func.sum(TeamStats.clean_sheets), 0))
+    if tournament_id is not None:
+        matches = matches.where(Match.tournament_id == tournament_id)
+        goals = goals.join(Match, Goal.match_id == Match.id).where(
+            Match.tournament_id == tournament_id
+        )
+        clean_sheets = clean_sheets.where(TeamStats.tournament_id == tournament_id)
+    return select(
+        matches.scalar_subquery().label("total_matches"),
+        goals.scalar_subquery().label("total_goals"),
+        clean_sheets.scalar_subquery().label("total_clean_sheets"),
+    )
+
+
+def calculate_summary(db: Session, tournament_id: int | None = None) -> dict[str, Any]:
+    """Compute the summary with a single query."""
+    row = db.execute(summary_statement(tournament_id)).one()
+    return {
+        "tournament_id": tournament_id,
+        "total_matches": row.total_matches,
+        "total_goals": row.total_goals,
+        "goals_per_match": row.total_goals / row.total_matches if row.total_matches else 0,
+        "total_clean_sheets": row.total_clean_sheets,
+    }
+
+
+def get_summary(db: Session, tournament_id: int | None = None) -> dict[str, Any]:
+    """
+    Summary for ``tournament_id`` (all tournaments if None), from the cache when current.
+
+    A tournament's summary is kept until a match, goal or statistic of that
+    tournament is written; the global one until any of them is.
+    """
+    return get_or_set(
+        f"stats:summary:{'all' if tournament_id is None else tournament_id}",
+        lambda: calculate_summary(db, tournament_id),
+        tags=SUMMARY_TABLES if tournament_id is None else [tag("tournaments", tournament_id)],
+    )
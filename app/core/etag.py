@@ -0,0 +1,148 @@
+"""Version counters and conditional GET handling for polled endpoints.
+
+A response's ETag is derived from the request URL and the versions of the
+resources it is built from, so it can be checked against ``If-None-Match``
+with a few index lookups, before loading the data. Two kinds of versions
+exist:
+
+- one row, e.g. ``"matches:7"``: bumped by every write tagged with it,
+  including writes to the rows hanging off it (the goals of the match);
+- a whole table, e.g. ``"teams"``: the sum of the versions of its rows,
+  which only writes to the table itself bump.
+
+The counters are stored in the ``change_versions`` table and bumped in the
+transaction of the write, so every worker and every other process writing
+through the ORM (e.g. the scripts) sees the same versions. Writes that
+bypass the ORM must record their change events (``events.record``) to
+bump them.
+
+Only the families in ROW_VERSIONED and TABLE_VERSIONED are counted, and
+there is no counter for a whole table. A write only waits for concurrent
+writes to the same match, group, team or player.
+"""
+import hashlib
+from collections.abc import Iterable
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.db.upsert import dialect_insert
+from app.models.change_version import ChangeVersion
+
+# Cache-Control policies for conditional endpoints
+NO_CACHE = "no-cache"  # always revalidate; for live data such as match scores
+SHORT_LIVED = "public, max-age=5, must-revalidate"  # tables that may lag a few seconds
+
+# Tables whose rows have versions a response may depend on, e.g. tag("matches", id)
+ROW_VERSIONED = frozenset({"groups", "matches"})
+# Tables whose whole content a response may depend on, e.g. "teams"
+TABLE_VERSIONED = frozenset({"players", "teams"})
+
+_versions = ChangeVersion.__table__
+
+
+def _family(key: str) -> str:
+    return key.partition(":")[0]
+
+
+def versions(db: Session, keys: Iterable[str]) -> dict[str, int]:
+    """
+    Current versions of rows or tables; 0 for those never written.
+
+    Raises:
+        ValueError: for a key whose family is not counted
+    """
+    keys = set(keys)
+    rows = [key for key in keys if ":" in key and _family(key) in ROW_VERSIONED]
+    tables = [key for key in keys if key in TABLE_VERSIONED]
+    if len(rows) + len(tables) != len(keys):
+        raise ValueError(f"No versions are kept for {sorted(keys - {*rows, *tables})}")
+
+    current = dict.fromkeys(keys, 0)
+    if rows:
+        current.update(db.execute(
+            select(_versions.c.key, _versions.c.version).where(_versions.c.key.in_(rows))
+        ).all())
+    for table in tables:
+        # Range scan of the primary key over the table's row keys ("teams:...")
+        current[table] = db.scalar(
+            select(func.coalesce(func.sum(_versions.c.version), 0)).where(
+                _versions.c.key > f"{table}:", _versions.c.key < f"{table};"
+            )
+        )
+    return current
+
+
+def make_etag(request: Request, current: dict[str, int]) -> str:
+    """Strong ETag for ``request`` at the ``current`` versions of its resources."""
+    digest = hashlib.sha1(f"{request.url.path}?{request.url.query}".encode())
+    for key in sorted(current):
+        digest.update(f"|{key}={current[key]}".encode())
+    return f'"{digest.hexdigest()[:16]}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag`` (RFC 9110)."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    db: Session,
+    keys: Iterable[str],
+    *,
+    cache_control: str = NO_CACHE,
+) -> None:
+    """
+    Answer 304 Not Modified if the client already has the current representation.
+
+    Must be called before the data is loaded: the ETag is computed from the
+    versions at this point, so a write committing during the load makes the
+    next request miss instead of wrongly hitting.
+
+    Raises:
+        HTTPException: 304 when ``If-None-Match`` matches the current ETag
+    """
+    etag = make_etag(request, versions(db, keys))
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+
+def _bumped_keys(change: events.ChangeEvent) -> set[str]:
+    """Counters advanced by one change event."""
+    keys = {t for t in change.tags if _family(t) in ROW_VERSIONED}
+    # Only the table's own writes count towards its version, not rows pointing at it
+    if change.entity in TABLE_VERSIONED:
+        keys.add(events.tag(change.entity, change.id))
+    return keys
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_versions(session: Session) -> None:
+    """Advance the counters of every row written by the committing transaction."""
+    # Flush first, so the changes the commit would flush are collected too
+    session.flush()
+    pending: list[events.ChangeEvent] = session.info.get(events.PENDING_EVENTS, [])
+    keys = set().union(*(_bumped_keys(change) for change in pending))
+    if not keys:
+        return
+    statement = dialect_insert(session, _versions)
+    session.connection().execute(
+        statement.on_conflict_do_update(
+            index_elements=[_versions.c.key],
+            set_={"version": _versions.c.version + 1},
+        ),
+        # Sorted, so concurrent commits lock the rows in the same order
+        [{"key": key, "version": 1} for key in sorted(keys)],
+    )
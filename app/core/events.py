@@ -0,0 +1,225 @@
+"""In-process change events emitted for every committed ORM write.
+
+Each new, updated or deleted object produces a ChangeEvent once its
+transaction commits. Events carry tags such as ``"tournaments:1"`` or
+``"groups:3"`` naming the rows that changed and the rows they point to
+through foreign keys, so subscribers (e.g. the response cache) can tell
+which reads are affected without knowing the models.
+"""
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from sqlalchemy import Table, event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.group import Group
+from app.models.match import Match
+from app.models.phase import Phase
+
+# Key of the pending events in Session.info until the transaction ends
+PENDING_EVENTS = "pending_change_events"
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A committed write to one row."""
+
+    entity: str  # table name, e.g. "matches"
+    action: str  # "created", "updated" or "deleted"
+    id: Any
+    tags: frozenset[str]
+    data: dict[str, Any] = field(default_factory=dict)  # column values after the write
+    changed: frozenset[str] = frozenset()  # columns the write set or changed
+
+
+Subscriber = Callable[[ChangeEvent], None]
+
+_subscribers: list[Subscriber] = []
+
+
+def subscribe(handler: Subscriber) -> Subscriber:
+    """Register a handler for change events; usable as a decorator."""
+    if handler not in _subscribers:
+        _subscribers.append(handler)
+    return handler
+
+
+def unsubscribe(handler: Subscriber) -> None:
+    """Remove a previously registered handler."""
+    if handler in _subscribers:
+        _subscribers.remove(handler)
+
+
+def emit(events: Iterable[ChangeEvent]) -> None:
+    """
+    Deliver events to every subscriber, in order.
+
+    The write is already committed when events are emitted, so a failing
+    subscriber is logged and skipped rather than failing the request or
+    starving the subscribers after it.
+    """
+    for change in events:
+        for handler in list(_subscribers):
+            try:
+                handler(change)
+            except Exception:
+                logger.exception(
+                    "change_event_subscriber_failed",
+                    subscriber=getattr(handler, "__qualname__", repr(handler)),
+                    entity=change.entity,
+                    action=change.action,
+                    id=change.id,
+                )
+
+
+def tag(entity: str, id: Any) -> str:
+    """Tag naming one row of a table."""
+    return f"{entity}:{id}"
+
+
+def tagged_ids(change: ChangeEvent, entity: str) -> list[int]:
+    """IDs of the rows of ``entity`` that ``change`` is tagged with."""
+    prefix = f"{entity}:"
+    return [
+        int(t.removeprefix(prefix)) for t in change.tags
+        if t.startswith(prefix) and t.removeprefix(prefix).isdigit()
+    ]
+
+
+def record(
+    session: Session,
+    table: Table,
+    action: str,
+    rows: Iterable[dict[str, Any]],
+    *,
+    tags: Iterable[str] = (),
+) -> None:
+    """
+    Queue events for rows written with Core statements, such as bulk inserts.
+
+    Such writes bypass the flush hooks; recorded events are emitted on commit
+    and discarded on rollback exactly like ORM writes. ``tags`` are added to
+    every event, for scopes the rows don't reference directly.
+    """
+    extra = set(tags)
+    pending = session.info.setdefault(PENDING_EVENTS, [])
+    for row in rows:
+        row_tags = {tag(table.name, row.get("id")), *extra}
+        for column in table.columns:
+            value = row.get(column.key)
+            if value is not None:
+                row_tags.update(tag(fk.column.table.name, value) for fk in column.foreign_keys)
+        pending.append(ChangeEvent(
+            entity=table.name,
+            action=action,
+            id=row.get("id"),
+            tags=frozenset(row_tags),
+            data=dict(row),
+            changed=frozenset(row) if action != "deleted" else frozenset(),
+        ))
+
+
+def _row_tags(obj: Any) -> set[str]:
+    """Tags for the row itself and every row its foreign keys point to, old and new."""
+    state = inspect(obj)
+    mapper = state.mapper
+    tags = {tag(mapper.local_table.name, state.dict.get("id"))}
+    for column in mapper.local_table.columns:
+        for foreign_key in column.foreign_keys:
+            attr = state.attrs[mapper.get_property_by_column(column).key]
+            history = attr.history
+            for value in (*history.unchanged, *history.added, *history.deleted):
+                if value is not None:
+                    tags.add(tag(foreign_key.column.table.name, value))
+    return tags
+
+
+def _snapshot(obj: Any) -> dict[str, Any]:
+    """Loaded column values of ``obj`` after the flush, without emitting SQL."""
+    state = inspect(obj)
+    return {attr.key: state.dict.get(attr.key) for attr in state.mapper.column_attrs}
+
+
+def _changed(action: str, obj: Any) -> frozenset[str]:
+    """Columns written by the flush; history is still available in after_flush."""
+    if action == "deleted":
+        return frozenset()
+    state = inspect(obj)
+    return frozenset(
+        attr.key for attr in state.mapper.column_attrs
+        if action == "created" or state.attrs[attr.key].history.has_changes()
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session: Session, flush_context: Any) -> None:
+    """Record the rows written by this flush until the transaction commits."""
+    changes = [
+        *(("created", obj) for obj in session.new),
+        *(("updated", obj) for obj in session.dirty if session.is_modified(obj)),
+        *(("deleted", obj) for obj in session.deleted),
+    ]
+    if not changes:
+        return
+
+    collected = [
+        (action, obj, _row_tags(obj), _snapshot(obj)) for action, obj in changes
+    ]
+
+    # Rows hanging off a match (goals) also affect the match's tournament and group
+    match_ids = {
+        data["match_id"] for _, _, _, data in collected if data.get("match_id") is not None
+    }
+    match_scopes: dict[int, set[str]] = {}
+    if match_ids:
+        rows = session.connection().execute(
+            select(Match.id, Match.tournament_id, Match.group_id).where(Match.id.in_(match_ids))
+        )
+        for match_id, tournament_id, group_id in rows:
+            match_scopes[match_id] = {tag("tournaments", tournament_id)}
+            if group_id is not None:
+                match_scopes[match_id].add(tag("groups", group_id))
+
+    # Rows hanging off a group (standings) also affect the group's tournament
+    group_ids = {
+        data["group_id"] for _, _, _, data in collected
+        if data.get("group_id") is not None and "tournament_id" not in data
+    }
+    group_scopes: dict[int, set[str]] = {}
+    if group_ids:
+        rows = session.connection().execute(
+            select(Group.id, Phase.tournament_id)
+            .join(Phase, Group.phase_id == Phase.id)
+            .where(Group.id.in_(group_ids))
+        )
+        for group_id, tournament_id in rows:
+            group_scopes[group_id] = {tag("tournaments", tournament_id)}
+
+    pending = session.info.setdefault(PENDING_EVENTS, [])
+    for action, obj, tags, data in collected:
+        tags |= match_scopes.get(data.get("match_id"), set())
+        tags |= group_scopes.get(data.get("group_id"), set())
+        pending.append(ChangeEvent(
+            entity=inspect(obj).mapper.local_table.name,
+            action=action,
+            id=data.get("id"),
+            tags=frozenset(tags),
+            data=data,
+            changed=_changed(action, obj),
+        ))
+
+
+@event.listens_for(Session, "after_commit")
+def _emit_changes(session: Session) -> None:
+    """Publish the writes of a committed transaction."""
+    emit(session.info.pop(PENDING_EVENTS, []))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    """Writes that were rolled back never happened."""
+    session.info.pop(PENDING_EVENTS, None)
@@ -0,0 +1,103 @@
+"""Streaming export of a tournament's data as NDJSON or CSV.
+
+Rows are read with server-side cursors (``yield_per``) and written out one
+batch at a time, so memory use does not grow with the tournament size.
+Plain table rows are selected, without building ORM objects.
+"""
+import csv
+import io
+import json
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from sqlalchemy import Select, select, union
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.goal import Goal
+from app.models.match import Match
+from app.models.player import Player
+from app.models.player_stats import PlayerStats
+from app.models.team_stats import TeamStats
+
+FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _matches(tournament_id: int) -> Select:
+    table = Match.__table__
+    return (
+        select(table)
+        .where(table.c.tournament_id == tournament_id)
+        .order_by(table.c.date, table.c.id)
+    )
+
+
+def _goals(tournament_id: int) -> Select:
+    table = Goal.__table__
+    return (
+        select(table)
+        .join(Match.__table__, table.c.match_id == Match.id)
+        .where(Match.tournament_id == tournament_id)
+        .order_by(table.c.match_id, table.c.minute, table.c.id)
+    )
+
+
+def _players(tournament_id: int) -> Select:
+    table = Player.__table__
+    teams = union(
+        select(Match.home_team_id).where(Match.tournament_id == tournament_id),
+        select(Match.away_team_id).where(Match.tournament_id == tournament_id),
+    )
+    return select(table).where(table.c.team_id.in_(teams)).order_by(table.c.team_id, table.c.id)
+
+
+def _team_stats(tournament_id: int) -> Select:
+    table = TeamStats.__table__
+    return select(table).where(table.c.tournament_id == tournament_id).order_by(table.c.team_id)
+
+
+def _player_stats(tournament_id: int) -> Select:
+    table = PlayerStats.__table__
+    return (
+        select(table).where(table.c.tournament_id == tournament_id).order_by(table.c.player_id)
+    )
+
+
+# Exported entities, in output order
+ENTITIES: dict[str, Callable[[int], Select]] = {
+    "matches": _matches,
+    "goals": _goals,
+    "players": _players,
+    "team_stats": _team_stats,
+    "player_stats": _player_stats,
+}
+
+
+def _batches(db: Session, query: Select) -> Iterator[list[dict[str, Any]]]:
+    """Rows of ``query`` as dicts, fetched from a server-side cursor in batches."""
+    result = db.execute(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+    for partition in result.mappings().partitions():
+        yield [dict(row) for row in partition]
+
+
+def export_ndjson(db: Session, tournament_id: int, entities: list[str]) -> Iterator[str]:
+    """One JSON object per line, tagged with its entity."""
+    for entity in entities:
+        for batch in _batches(db, ENTITIES[entity](tournament_id)):
+            yield "".join(
+                json.dumps({"entity": entity, **row}, default=str) + "\n" for row in batch
+            )
+
+
+def export_csv(db: Session, tournament_id: int, entity: str) -> Iterator[str]:
+    """A header line and one CSV row per record of a single entity."""
+    query = ENTITIES[entity](tournament_id)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.name for column in query.selected_columns])
+    yield buffer.getvalue()
+    for batch in _batches(db, query):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(row.values() for row in batch)
+        yield buffer.getvalue()
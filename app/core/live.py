@@ -0,0 +1,320 @@
+"""In-process fan-out of live tournament updates.
+
+Committed goal, match and standings writes are turned into LiveEvents and
+pushed to every subscriber of the tournament. Events are numbered per
+process and the most recent ones are kept, so a reconnecting client can
+resume from its ``Last-Event-ID``.
+
+The match center follows individual matches instead: each connection gets
+one coalesced delta per match, so a slow client skips intermediate states
+rather than queueing them.
+
+Subscribers only see writes made by the same process: run the live feed
+on a single worker, or put a shared bus in front of ``broker.publish``.
+"""
+import asyncio
+import json
+import secrets
+import threading
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core import events
+from app.core.config import settings
+from app.core.standings import STANDING_FIELDS
+
+GOAL_FIELDS = ("id", "match_id", "player_id", "team_id", "minute", "type")
+SCORE_FIELDS = ("home_score", "away_score")
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+    """One update pushed to live subscribers."""
+
+    id: str
+    seq: int
+    tournament_id: int
+    type: str  # "goal", "score", "status" or "standings"
+    data: dict[str, Any]
+
+    def encode(self) -> str:
+        """Server-Sent Events frame for this event."""
+        payload = json.dumps(self.data, default=str, separators=(",", ":"))
+        return f"id: {self.id}\nevent: {self.type}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """Queue of events for one subscriber, filled from any thread."""
+
+    def __init__(self, tournament_id: int, max_pending: int):
+        self.tournament_id = tournament_id
+        self.max_pending = max_pending
+        self.overflowed = False
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[LiveEvent | None] = asyncio.Queue()
+
+    def push(self, event: LiveEvent) -> None:
+        """Hand ``event`` to the subscriber's event loop."""
+        self._loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event: LiveEvent) -> None:
+        if self.overflowed:
+            return
+        if self._queue.qsize() >= self.max_pending:
+            # Too slow to keep up: end the stream and let the client resume
+            self.overflowed = True
+            self._queue.put_nowait(None)
+            return
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> LiveEvent | None:
+        """Next event, or None after ``timeout`` seconds without one."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LiveBroker:
+    """Publishes live events to the subscribers of each tournament."""
+
+    def __init__(self, history_size: int, max_pending: int):
+        self.max_pending = max_pending
+        self._process_id = secrets.token_hex(4)
+        self._seq = 0
+        self._history: deque[LiveEvent] = deque(maxlen=history_size)
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, tournament_id: int, type: str, data: dict[str, Any]) -> LiveEvent:
+        """Number, record and fan out an event; safe to call from any thread."""
+        with self._lock:
+            self._seq += 1
+            event = LiveEvent(
+                id=f"{self._process_id}-{self._seq}",
+                seq=self._seq,
+                tournament_id=tournament_id,
+                type=type,
+                data=data,
+            )
+            self._history.append(event)
+            subscribers = list(self._subscribers.get(tournament_id, ()))
+        for subscription in subscribers:
+            subscription.push(event)
+        return event
+
+    def subscribe(
+        self, tournament_id: int, last_event_id: str | None = None
+    ) -> tuple[Subscription, list[LiveEvent] | None]:
+        """
+        Register a subscriber, returning it with the events it missed.
+
+        The missed events are None when ``last_event_id`` cannot be resumed
+        from (issued by another process, or older than the kept history),
+        in which case the client must reload the full state.
+        """
+        subscription = Subscription(tournament_id, self.max_pending)
+        with self._lock:
+            self._subscribers.setdefault(tournament_id, set()).add(subscription)
+            missed = self._missed(tournament_id, last_event_id) if last_event_id else []
+        return subscription, missed
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to ``subscription``."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.tournament_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.tournament_id]
+
+    def subscriber_count(self, tournament_id: int) -> int:
+        """Number of open subscriptions to a tournament."""
+        return len(self._subscribers.get(tournament_id, ()))
+
+    def _missed(self, tournament_id: int, last_event_id: str) -> list[LiveEvent] | None:
+        process_id, _, seq = last_event_id.partition("-")
+        if process_id != self._process_id or not seq.isdigit():
+            return None
+        last_seq = int(seq)
+        if self._history and self._history[0].seq > last_seq + 1:
+            return None
+        return [e for e in self._history if e.seq > last_seq and e.tournament_id == tournament_id]
+
+
+class MatchChannel:
+    """Coalesced updates of the matches one match-center client follows."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._outbox: list[dict[str, Any]] = []
+        self._deltas: dict[int, dict[str, Any]] = {}
+        self._awaiting_snapshot: set[int] = set()
+        self.match_ids: set[int] = set()
+        self.coalesced = 0  # updates merged into a delta that was not sent yet
+
+    def push(self, match_id: int, type: str, data: dict[str, Any]) -> None:
+        """Hand an update to the channel's event loop; safe from any thread."""
+        self._loop.call_soon_threadsafe(self._merge, match_id, type, data)
+
+    def expect_snapshot(self, match_id: int) -> None:
+        """Hold back deltas of ``match_id`` until its snapshot is queued."""
+        self._awaiting_snapshot.add(match_id)
+
+    def send(self, message: dict[str, Any]) -> None:
+        """Queue a message (snapshot or error) ahead of pending deltas."""
+        self._outbox.append(message)
+        if message.get("type") == "snapshot":
+            self._awaiting_snapshot.discard(message["match_id"])
+        self._ready.set()
+
+    def forget(self, match_id: int) -> None:
+        """Drop anything pending for a match that is no longer followed."""
+        self._deltas.pop(match_id, None)
+        self._awaiting_snapshot.discard(match_id)
+
+    def _merge(self, match_id: int, type: str, data: dict[str, Any]) -> None:
+        if match_id not in self.match_ids:
+            return
+        delta = self._deltas.get(match_id)
+        if delta is None:
+            delta = self._deltas[match_id] = {"type": "delta", "match_id": match_id}
+        else:
+            self.coalesced += 1
+        if type == "goal":
+            # Keyed by goal id: a goal edited twice is sent once, in its last state
+            delta.setdefault("goals", {})[data["id"]] = data
+        else:
+            delta.update((k, v) for k, v in data.items() if k != "match_id")
+        self._ready.set()
+
+    async def next_messages(self) -> list[dict[str, Any]]:
+        """Wait for and take everything ready to send, oldest state first."""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            messages, self._outbox = self._outbox, []
+            for match_id in [m for m in self._deltas if m not in self._awaiting_snapshot]:
+                delta = self._deltas.pop(match_id)
+                if "goals" in delta:
+                    delta["goals"] = list(delta["goals"].values())
+                messages.append(delta)
+            if messages:
+                return messages
+
+
+class MatchCenter:
+    """Routes match updates to the channels following each match."""
+
+    def __init__(self):
+        self._channels: dict[int, set[MatchChannel]] = {}
+        self._lock = threading.Lock()
+
+    def follow(self, channel: MatchChannel, match_ids: Iterable[int]) -> None:
+        """Start delivering updates of ``match_ids`` to ``channel``."""
+        with self._lock:
+            for match_id in match_ids:
+                channel.match_ids.add(match_id)
+                self._channels.setdefault(match_id, set()).add(channel)
+
+    def unfollow(self, channel: MatchChannel, match_ids: Iterable[int]) -> None:
+        """Stop delivering updates of ``match_ids`` to ``channel``."""
+        with self._lock:
+            for match_id in match_ids:
+                channel.match_ids.discard(match_id)
+                channel.forget(match_id)
+                channels = self._channels.get(match_id)
+                if channels is not None:
+                    channels.discard(channel)
+                    if not channels:
+                        del self._channels[match_id]
+
+    def close(self, channel: MatchChannel) -> None:
+        """Remove a channel from every match it follows."""
+        self.unfollow(channel, list(channel.match_ids))
+
+    def publish(self, match_id: int, type: str, data: dict[str, Any]) -> None:
+        """Push an update to every channel following ``match_id``."""
+        with self._lock:
+            channels = list(self._channels.get(match_id, ()))
+        for channel in channels:
+            channel.push(match_id, type, data)
+
+    def follower_count(self, match_id: int) -> int:
+        """Number of channels following a match."""
+        return len(self._channels.get(match_id, ()))
+
+
+broker = LiveBroker(
+    history_size=settings.LIVE_HISTORY_SIZE, max_pending=settings.LIVE_MAX_PENDING
+)
+match_center = MatchCenter()
+
+
+async def event_stream(
+    tournament_id: int,
+    last_event_id: str | None = None,
+    *,
+    heartbeat: float | None = None,
+) -> AsyncIterator[str]:
+    """
+    Server-Sent Events frames for a tournament, starting after ``last_event_id``.
+
+    A ``reset`` event tells the client to reload the full state because the
+    missed events are no longer available. Comments are sent as heartbeats
+    while idle so proxies keep the connection open.
+    """
+    heartbeat = settings.LIVE_HEARTBEAT if heartbeat is None else heartbeat
+    subscription, missed = broker.subscribe(tournament_id, last_event_id)
+    try:
+        yield f"retry: {settings.LIVE_RETRY_MS}\n\n"
+        if missed is None:
+            yield "event: reset\ndata: {}\n\n"
+        else:
+            for event in missed:
+                yield event.encode()
+        while True:
+            event = await subscription.get(heartbeat)
+            if subscription.overflowed and event is None:
+                return
+            yield ": keep-alive\n\n" if event is None else event.encode()
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def _pick(data: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    return {field: data.get(field) for field in fields}
+
+
+def live_updates(change: events.ChangeEvent) -> list[tuple[str, dict[str, Any]]]:
+    """The live events (type, data) a committed write produces."""
+    data = change.data
+    if change.entity == "goals":
+        return [("goal", {"action": change.action, **_pick(data, GOAL_FIELDS)})]
+    if change.entity == "matches" and change.action == "updated":
+        updates = []
+        if change.changed & set(SCORE_FIELDS):
+            updates.append(("score", {"match_id": change.id, **_pick(data, SCORE_FIELDS)}))
+        if "status" in change.changed:
+            updates.append(("status", {"match_id": change.id, "status": data.get("status")}))
+        return updates
+    if change.entity == "group_standings" and change.action != "deleted":
+        return [("standings", _pick(data, ("group_id", "team_id", *STANDING_FIELDS)))]
+    return []
+
+
+@events.subscribe
+def _publish_change(change: events.ChangeEvent) -> None:
+    """Fan committed writes out to the subscribers of their tournament and match."""
+    updates = live_updates(change)
+    if not updates:
+        return
+    for tournament_id in events.tagged_ids(change, "tournaments"):
+        for type, data in updates:
+            broker.publish(tournament_id, type, data)
+    for type, data in updates:
+        if type != "standings" and data.get("match_id") is not None:
+            match_center.publish(data["match_id"], type, data)
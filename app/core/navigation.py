@@ -0,0 +1,50 @@
+"""Previous/next navigation between the matches of a group or phase."""
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import get_or_set
+from app.core.events import tag
+from app.models.match import Match
+
+# Kickoff order; matches without a date or time yet come last
+KICKOFF_ORDER = (Match.date.asc().nulls_last(), Match.time.asc().nulls_last(), Match.id.asc())
+
+
+def match_scope(match: Match) -> tuple[str, int]:
+    """The group a match belongs to, or its phase when it has no group."""
+    if match.group_id is not None:
+        return "groups", match.group_id
+    return "phases", match.phase_id
+
+
+def calculate_neighbours(db: Session, entity: str, scope_id: int) -> dict[str, list[int | None]]:
+    """Previous and next match of every match in a group or phase, by match id."""
+    column = Match.group_id if entity == "groups" else Match.phase_id
+    ids = list(db.scalars(select(Match.id).where(column == scope_id).order_by(*KICKOFF_ORDER)))
+    # String keys, so the mapping survives a JSON round trip through the cache
+    return {
+        str(match_id): [
+            ids[position - 1] if position > 0 else None,
+            ids[position + 1] if position + 1 < len(ids) else None,
+        ]
+        for position, match_id in enumerate(ids)
+    }
+
+
+def get_neighbours(db: Session, match: Match) -> tuple[int | None, int | None]:
+    """
+    IDs of the matches before and after ``match`` in its group or phase.
+
+    The whole sequence is cached per group or phase and dropped on any write
+    to one of its matches, so every match page after the first is a lookup.
+    """
+    entity, scope_id = match_scope(match)
+    neighbours: dict[str, Any] = get_or_set(
+        f"matches:neighbours:{entity}:{scope_id}",
+        lambda: calculate_neighbours(db, entity, scope_id),
+        tags=[tag(entity, scope_id)],
+    )
+    previous, following = neighbours.get(str(match.id), (None, None))
+    return previous, following
@@ -0,0 +1,106 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+A page ends with the sort key of its last row; the next page starts
+strictly after that key instead of skipping rows with OFFSET. Deep pages
+cost the same as the first, and rows written between requests cannot shift
+a page boundary, so nothing is skipped or returned twice.
+
+The key is handed to clients as an opaque cursor in the ``X-Next-Cursor``
+response header, leaving list bodies unchanged for offset clients.
+"""
+import base64
+import binascii
+import datetime as _dt
+import json
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Column, ColumnElement, and_, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+Q = TypeVar("Q")  # a Query or a Select
+
+_TEMPORAL = (_dt.date, _dt.datetime, _dt.time)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for a row with sort key ``values``."""
+    payload = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Column]) -> list[Any]:
+    """
+    Sort key stored in ``cursor``, typed like ``columns``.
+
+    Raises:
+        HTTPException: 400 when the cursor was not issued for these columns
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError(cursor)
+        return [_parse(column, value) for column, value in zip(columns, values, strict=True)]
+    except (ValueError, TypeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _parse(column: Column, value: Any) -> Any:
+    if value is None:
+        if not column.nullable:
+            raise ValueError(column.name)
+        return None
+    python_type = column.type.python_type
+    if python_type in _TEMPORAL:
+        return python_type.fromisoformat(value)
+    if not isinstance(value, python_type) or isinstance(value, bool):
+        raise TypeError(column.name)
+    return value
+
+
+def order_by(columns: Sequence[Column]) -> list[ColumnElement]:
+    """Ascending sort on ``columns``, with NULLs first on every backend."""
+    return [column.asc().nulls_first() if column.nullable else column.asc() for column in columns]
+
+
+def after(columns: Sequence[Column], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Rows sorting strictly after ``values`` in ``order_by(columns)``."""
+    column, value = columns[0], values[0]
+    if len(columns) == 1:
+        return column > value if value is not None else column.is_not(None)
+    rest = after(columns[1:], values[1:])
+    if value is None:
+        return or_(column.is_not(None), and_(column.is_(None), rest))
+    return or_(column > value, and_(column == value, rest))
+
+
+def start_after(query: Q, columns: Sequence[Column], cursor: str | None) -> Q:
+    """Order ``query`` by ``columns`` and start it after ``cursor``, if given."""
+    query = query.order_by(*order_by(columns))
+    if cursor is not None:
+        query = query.filter(after(columns, decode_cursor(cursor, columns)))
+    return query
+
+
+def split_page(
+    rows: list[T], limit: int, key: Callable[[T], Sequence[Any]]
+) -> tuple[list[T], str | None]:
+    """
+    Cut rows fetched with ``limit + 1`` down to a page and the cursor of the next one.
+
+    ``key`` gives the sort key of a row; the cursor is None on the last page.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(key(rows[-1]))
+
+
+def set_next_cursor(response: Response, cursor: str | None) -> None:
+    """Expose the cursor of the next page, if there is one."""
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -1,12 +1,29 @@
 """Module for calculating standings from match results."""
 from typing import Any
 
+from sqlalchemy import and_, case, func, literal, select, union_all, update
 from sqlalchemy.orm import Session
 
-from app.models.group import Group
+from app.core import events
+from app.core.config import settings
+from app.models.group import Group, team_group
+from app.models.group_standing import GroupStanding
 from app.models.match import Match
+from app.models.team import Team
 from app.schemas.team_standing import TeamStanding
 
+# Counters copied between TeamStanding objects and persisted GroupStanding rows
+STANDING_FIELDS = (
+    "matches_played",
+    "wins",
+    "draws",
+    "losses",
+    "goals_for",
+    "goals_against",
+    "goal_difference",
+    "points",
+)
+
 
 def calculate_group_standings(db: Session, group_id: int) -> list[TeamStanding]:
     """
@@ -17,7 +34,8 @@ def calculate_group_standings(db: Session, group_id: int) -> list[TeamStanding]:
         group_id: ID of the group to calculate standings for
         
     Returns:
-        List of TeamStanding objects ordered by points (descending) and goal difference
+        List of TeamStanding objects ordered by points, goal difference and goals
+        scored (descending), then team ID
     """
     # Get all teams in the group
     group = db.query(Group).filter(Group.id == group_id).first()
@@ -93,11 +111,316 @@ def calculate_group_standings(db: Session, group_id: int) -> list[TeamStanding]:
             standings[team_id]["goals_for"] - standings[team_id]["goals_against"]
         )
     
-    # Convert to list of TeamStanding objects and sort
+    # Convert to list of TeamStanding objects and sort; the team id settles
+    # full ties, as in calculate_group_standings_sql and get_group_standings
     standings_list = [TeamStanding(**data) for data in standings.values()]
     standings_list.sort(
-        key=lambda x: (x.points, x.goal_difference, x.goals_for),
-        reverse=True
+        key=lambda x: (-x.points, -x.goal_difference, -x.goals_for, x.team_id)
     )
     
-    return standings_list 
\ No newline at end of file
+    return standings_list
+
+
+def calculate_group_standings_sql(db: Session, group_id: int) -> list[TeamStanding]:
+    """
+    Calculate standings for teams in a group with a single aggregate query.
+
+    Each completed match is expanded into a home and an away row with UNION ALL,
+    aggregated per team and left-joined onto the group's teams, so results come
+    back as plain tuples without hydrating any Match objects.
+
+    Args:
+        db: Database session
+        group_id: ID of the group to calculate standings for
+
+    Returns:
+        List of TeamStanding objects ordered by points, goal difference and goals
+        scored (descending), then team ID
+    """
+    group_team_ids = select(team_group.c.team_id).where(team_group.c.group_id == group_id)
+    counted = (
+        Match.group_id == group_id,
+        Match.status == "completed",
+        Match.home_score.isnot(None),
+        Match.away_score.isnot(None),
+        # Skip matches where either team is not in the group
+        Match.home_team_id.in_(group_team_ids),
+        Match.away_team_id.in_(group_team_ids),
+    )
+    results = union_all(
+        select(
+            Match.home_team_id.label("team_id"),
+            Match.home_score.label("goals_for"),
+            Match.away_score.label("goals_against"),
+        ).where(*counted),
+        select(
+            Match.away_team_id.label("team_id"),
+            Match.away_score.label("goals_for"),
+            Match.home_score.label("goals_against"),
+        ).where(*counted),
+    ).subquery()
+
+    totals = (
+        select(
+            results.c.team_id,
+            func.count().label("matches_played"),
+            func.sum(case((results.c.goals_for > results.c.goals_against, 1), else_=0)).label("wins"),
+            func.sum(case((results.c.goals_for == results.c.goals_against, 1), else_=0)).label("draws"),
+            func.sum(case((results.c.goals_for < results.c.goals_against, 1), else_=0)).label("losses"),
+            func.sum(results.c.goals_for).label("goals_for"),
+            func.sum(results.c.goals_against).label("goals_against"),
+        )
+        .group_by(results.c.team_id)
+        .subquery()
+    )
+
+    zero = literal(0)
+    matches_played = func.coalesce(totals.c.matches_played, zero)
+    wins = func.coalesce(totals.c.wins, zero)
+    draws = func.coalesce(totals.c.draws, zero)
+    losses = func.coalesce(totals.c.losses, zero)
+    goals_for = func.coalesce(totals.c.goals_for, zero)
+    goals_against = func.coalesce(totals.c.goals_against, zero)
+    goal_difference = goals_for - goals_against
+    points = wins * 3 + draws
+
+    rows = db.execute(
+        select(
+            Team.id,
+            Team.name,
+            Team.short_name,
+            Team.logo_url,
+            matches_played,
+            wins,
+            draws,
+            losses,
+            goals_for,
+            goals_against,
+            goal_difference,
+            points,
+        )
+        .join(team_group, team_group.c.team_id == Team.id)
+        .outerjoin(totals, totals.c.team_id == Team.id)
+        .where(team_group.c.group_id == group_id)
+        .order_by(points.desc(), goal_difference.desc(), goals_for.desc(), Team.id)
+    ).all()
+
+    return [
+        TeamStanding(
+            team_id=row[0],
+            team_name=row[1],
+            team_short_name=row[2],
+            team_logo_url=row[3],
+            **dict(zip(STANDING_FIELDS, row[4:], strict=True)),
+        )
+        for row in rows
+    ]
+
+
+def compute_group_standings(db: Session, group_id: int) -> list[TeamStanding]:
+    """
+    Calculate standings for a group from its matches.
+
+    Dispatches to the Python or SQL implementation according to
+    settings.STANDINGS_BACKEND.
+    """
+    if settings.STANDINGS_BACKEND == "sql":
+        return calculate_group_standings_sql(db, group_id)
+    return calculate_group_standings(db, group_id)
+
+
+def snapshot_result(match: Match | None) -> dict[str, Any] | None:
+    """
+    Capture the part of a match that contributes to a group table.
+
+    Args:
+        match: Match to capture, or None for a match that no longer exists
+
+    Returns:
+        Dictionary with the group, teams and scores, or None if the match
+        does not count towards any group standings
+    """
+    if (
+        match is None
+        or match.group_id is None
+        or match.status != "completed"
+        or match.home_score is None
+        or match.away_score is None
+    ):
+        return None
+    return {
+        "group_id": match.group_id,
+        "home_team_id": match.home_team_id,
+        "away_team_id": match.away_team_id,
+        "home_score": match.home_score,
+        "away_score": match.away_score,
+    }
+
+
+def apply_result_change(
+    db: Session, previous: dict[str, Any] | None, current: dict[str, Any] | None
+) -> None:
+    """
+    Apply the delta between two match snapshots to the persisted group tables.
+
+    Must be called once the match change has been applied to the session and
+    before it is committed, so the standings update shares the transaction.
+    Groups whose table has not been primed yet are rebuilt from their matches.
+
+    Args:
+        db: Database session
+        previous: Snapshot taken before the change (see snapshot_result)
+        current: Snapshot taken after the change
+    """
+    if previous == current:
+        return
+
+    db.flush()
+    rebuilt: set[int] = set()
+    for snapshot, sign in ((previous, -1), (current, 1)):
+        if snapshot is None or snapshot["group_id"] in rebuilt:
+            continue
+
+        group_id = snapshot["group_id"]
+        member_ids = {
+            team_id
+            for (team_id,) in db.query(team_group.c.team_id).filter(
+                team_group.c.group_id == group_id
+            )
+        }
+        row_ids = {
+            team_id
+            for (team_id,) in db.query(GroupStanding.team_id).filter(
+                GroupStanding.group_id == group_id
+            )
+        }
+
+        if row_ids != member_ids:
+            # Table not primed (or out of sync with the group): the rebuild
+            # already reflects the flushed match state, so skip the delta
+            rebuild_group_standings(db, group_id)
+            rebuilt.add(group_id)
+            continue
+
+        home_id = snapshot["home_team_id"]
+        away_id = snapshot["away_team_id"]
+        # Matches against teams outside the group don't count
+        if home_id not in row_ids or away_id not in row_ids:
+            continue
+
+        home_score, away_score = snapshot["home_score"], snapshot["away_score"]
+        _apply_score(db, group_id, home_id, home_score, away_score, sign)
+        _apply_score(db, group_id, away_id, away_score, home_score, sign)
+
+
+def _apply_score(
+    db: Session, group_id: int, team_id: int, goals_for: int, goals_against: int, sign: int
+) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) one result from a standings row.
+
+    The counters are incremented in the UPDATE itself rather than read and
+    written back, so concurrent results in the same group all add up.
+    """
+    won, drawn = goals_for > goals_against, goals_for == goals_against
+    table = GroupStanding.__table__
+    statement = (
+        update(GroupStanding)
+        .where(GroupStanding.group_id == group_id, GroupStanding.team_id == team_id)
+        .values(
+            matches_played=GroupStanding.matches_played + sign,
+            wins=GroupStanding.wins + sign * won,
+            draws=GroupStanding.draws + sign * drawn,
+            losses=GroupStanding.losses + sign * (not won and not drawn),
+            goals_for=GroupStanding.goals_for + sign * goals_for,
+            goals_against=GroupStanding.goals_against + sign * goals_against,
+            goal_difference=GroupStanding.goal_difference + sign * (goals_for - goals_against),
+            points=GroupStanding.points + sign * (3 if won else 1 if drawn else 0),
+        )
+        .returning(*table.c)
+    )
+    # A Core-style write: its change events are recorded by hand
+    events.record(db, table, "updated", [dict(row) for row in db.execute(statement).mappings()])
+
+
+def rebuild_group_standings(db: Session, group_id: int) -> list[TeamStanding]:
+    """
+    Recalculate a group table from its matches and persist it.
+
+    Rows are upserted for every team in the group and removed for teams that
+    left it. The caller is responsible for committing.
+
+    Args:
+        db: Database session
+        group_id: ID of the group to rebuild
+
+    Returns:
+        The recalculated standings
+    """
+    db.flush()
+    standings = compute_group_standings(db, group_id)
+
+    rows = {
+        row.team_id: row
+        for row in db.query(GroupStanding).filter(GroupStanding.group_id == group_id)
+    }
+    for standing in standings:
+        row = rows.pop(standing.team_id, None)
+        if row is None:
+            row = GroupStanding(group_id=group_id, team_id=standing.team_id)
+            db.add(row)
+        for field in STANDING_FIELDS:
+            setattr(row, field, getattr(standing, field))
+
+    for stale_row in rows.values():
+        db.delete(stale_row)
+
+    return standings
+
+
+def get_group_standings(db: Session, group_id: int) -> list[TeamStanding]:
+    """
+    Read the persisted standings for a group.
+
+    Runs a single query over the group's teams and their standings rows.
+    Falls back to a full calculation (without writing) when the group table
+    has not been primed yet.
+
+    Args:
+        db: Database session
+        group_id: ID of the group
+
+    Returns:
+        List of TeamStanding objects ordered by points, goal difference and goals
+        scored (descending), then team ID
+    """
+    rows = (
+        db.query(Team, GroupStanding)
+        .join(team_group, team_group.c.team_id == Team.id)
+        .outerjoin(
+            GroupStanding,
+            and_(GroupStanding.team_id == Team.id, GroupStanding.group_id == group_id),
+        )
+        .filter(team_group.c.group_id == group_id)
+        .order_by(
+            GroupStanding.points.desc(),
+            GroupStanding.goal_difference.desc(),
+            GroupStanding.goals_for.desc(),
+            Team.id,
+        )
+        .all()
+    )
+
+    if any(standing is None for _, standing in rows):
+        return compute_group_standings(db, group_id)
+
+    return [
+        TeamStanding(
+            team_id=team.id,
+            team_name=team.name,
+            team_short_name=team.short_name,
+            team_logo_url=team.logo_url,
+            **{field: getattr(standing, field) for field in STANDING_FIELDS},
+        )
+        for team, standing in rows
+    ]
@@ -0,0 +1,146 @@
+"""Per-request database and serialization timings.
+
+Cursor events on every engine count the statements a request runs and how
+long they take; ``TimedRoute`` measures the time spent turning an
+endpoint's return value into the response body. ``main.log_requests``
+puts the totals in its log line and in a ``Server-Timing`` header.
+
+Statements slower than ``SLOW_QUERY_MS`` are logged on their own, with the
+request path, when the threshold is set.
+"""
+import asyncio
+import functools
+import time
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+# Longest statement text kept in log lines
+STATEMENT_PREVIEW = 500
+
+
+@dataclass
+class RequestStats:
+    """What one request spent on the database and on serialization."""
+
+    path: str
+    queries: int = 0
+    db_time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+    endpoint_done: float | None = None
+    serialize_time: float | None = None
+
+    def log_fields(self) -> dict[str, Any]:
+        """Fields added to the request's log line."""
+        fields = {
+            "db_queries": self.queries,
+            "db_time_ms": round(self.db_time * 1000, 2),
+        }
+        if self.slowest_statement is not None:
+            fields["db_slowest_ms"] = round(self.slowest_time * 1000, 2)
+            fields["db_slowest_statement"] = self.slowest_statement[:STATEMENT_PREVIEW]
+        if self.serialize_time is not None:
+            fields["serialize_ms"] = round(self.serialize_time * 1000, 2)
+        return fields
+
+    def server_timing(self, total: float) -> str:
+        """``Server-Timing`` header value (durations in milliseconds)."""
+        metrics = [f'db;dur={self.db_time * 1000:.2f};desc="{self.queries} queries"']
+        if self.serialize_time is not None:
+            metrics.append(f"serialize;dur={self.serialize_time * 1000:.2f}")
+        metrics.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def start_request(path: str) -> RequestStats:
+    """Collect the stats of the request being handled in this context."""
+    stats = RequestStats(path=path)
+    _current.set(stats)
+    return stats
+
+
+def current_stats() -> RequestStats | None:
+    """Stats of the request being handled, if any."""
+    return _current.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+        if elapsed >= stats.slowest_time:
+            stats.slowest_time = elapsed
+            stats.slowest_statement = statement
+    if settings.SLOW_QUERY_MS and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "slow_query",
+            path=stats.path if stats else None,
+            duration_ms=round(elapsed * 1000, 2),
+            statement=statement[:STATEMENT_PREVIEW],
+        )
+
+
+def _mark_done(call: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap an endpoint to note when it returns, keeping it sync or async."""
+    if asyncio.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+            result = await call(*args, **kwargs)
+            _endpoint_done()
+            return result
+
+        return async_endpoint
+
+    @functools.wraps(call)
+    def endpoint(*args: Any, **kwargs: Any) -> Any:
+        result = call(*args, **kwargs)
+        _endpoint_done()
+        return result
+
+    return endpoint
+
+
+def _endpoint_done() -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.endpoint_done = time.perf_counter()
+
+
+class TimedRoute(APIRoute):
+    """Route recording how long the response model serialization takes."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        self.dependant.call = _mark_done(self.dependant.call)
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            response = await handler(request)
+            stats = _current.get()
+            if stats is not None and stats.endpoint_done is not None:
+                stats.serialize_time = time.perf_counter() - stats.endpoint_done
+            return response
+
+        return timed_handler
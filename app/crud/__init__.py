@@ -1,3 +1,6 @@
+# The CRUD classes build on app.api.crud_base and the API routers use them:
+# load the API package first so no router sees a half-imported CRUD module
+import app.api  # noqa: F401
 from app.crud.goal import goal
 from app.crud.match import match
 from app.crud.player_stats import player_stats
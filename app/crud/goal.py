@@ -1,12 +1,98 @@
 
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
+from app.core import events
+from app.core.standings import apply_result_change, snapshot_result
+from app.crud.player_stats import player_stats
 from app.models.goal import Goal
-from app.schemas.goal import GoalCreate, GoalUpdate
+from app.models.match import Match
+from app.models.player import Player
+from app.schemas.bulk import BulkRowError
+from app.schemas.goal import GoalCreate, GoalType, GoalUpdate, MatchGoal
 
 
 class CRUDGoal(CRUDBase[Goal, GoalCreate, GoalUpdate]):
+    def create(self, db: Session, *, obj_in: GoalCreate) -> Goal:
+        """Create a goal and recount its scorer's stats."""
+        try:
+            db_obj = self.model(**obj_in.model_dump())
+            db.add(db_obj)
+            db.flush()
+            self.refresh_scorer_stats(db, [(db_obj.match_id, db_obj.player_id)])
+            db.commit()
+            db.refresh(db_obj)
+            return db_obj
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def update(
+        self, db: Session, *, db_obj: Goal, obj_in: GoalUpdate | dict[str, Any]
+    ) -> Goal:
+        """Update a goal and recount the stats of its scorer before and after."""
+        previous = (db_obj.match_id, db_obj.player_id)
+        try:
+            obj_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+            for field, value in obj_data.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            db.flush()
+            self.refresh_scorer_stats(db, [previous, (db_obj.match_id, db_obj.player_id)])
+            db.commit()
+            db.refresh(db_obj)
+            return db_obj
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def delete(self, db: Session, *, id: int) -> Goal:
+        """Delete a goal and recount its scorer's stats."""
+        obj = db.get(self.model, id)
+        if not obj:
+            raise HTTPException(status_code=404, detail="Item not found")
+        try:
+            db.delete(obj)
+            db.flush()
+            self.refresh_scorer_stats(db, [(obj.match_id, obj.player_id)])
+            db.commit()
+            return obj
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=400, detail=f"Cannot delete item due to existing references: {e!s}"
+            )
+
+    def refresh_scorer_stats(
+        self, db: Session, scorers: Iterable[tuple[int | None, int | None]]
+    ) -> None:
+        """
+        Recount the persisted stats of (match_id, player_id) scorers in their tournaments.
+
+        Goal writes must be flushed first; the caller is responsible for committing.
+        """
+        players_by_match: dict[int, set[int]] = {}
+        for match_id, player_id in scorers:
+            if match_id is not None and player_id is not None:
+                players_by_match.setdefault(match_id, set()).add(player_id)
+        if not players_by_match:
+            return
+        players_by_tournament: dict[int, set[int]] = {}
+        for match_id, tournament_id in db.execute(
+            select(Match.id, Match.tournament_id).where(Match.id.in_(players_by_match))
+        ):
+            players_by_tournament.setdefault(tournament_id, set()).update(
+                players_by_match[match_id]
+            )
+        for tournament_id, player_ids in players_by_tournament.items():
+            player_stats.apply_goal_totals(db, tournament_id=tournament_id, player_ids=player_ids)
+
     def get_by_match(
         self, db: Session, *, match_id: int, skip: int = 0, limit: int = 100
     ) -> list[Goal]:
@@ -61,5 +147,85 @@ class CRUDGoal(CRUDBase[Goal, GoalCreate, GoalUpdate]):
             self.model.team_id == team_id
         ).count()
 
+    def check_match_goals(
+        self, db: Session, *, match: Match, goals: list[MatchGoal]
+    ) -> list[BulkRowError]:
+        """
+        Check that every goal's team plays the match and its scorer plays for it.
+
+        Both rosters are loaded in one query. Own goals are credited to
+        team_id but scored by a player of the opponent.
+        """
+        teams = (match.home_team_id, match.away_team_id)
+        roster = dict(
+            db.execute(select(Player.id, Player.team_id).where(Player.team_id.in_(teams))).all()
+        )
+        errors = []
+        for index, goal in enumerate(goals):
+            problems = []
+            if goal.team_id not in teams:
+                problems.append(f"team_id: Team {goal.team_id} does not play this match")
+            elif goal.player_id is not None:
+                scorer_team = (
+                    teams[1 - teams.index(goal.team_id)]
+                    if goal.type == GoalType.OWN_GOAL
+                    else goal.team_id
+                )
+                if roster.get(goal.player_id) != scorer_team:
+                    problems.append(
+                        f"player_id: Player {goal.player_id} does not play for team {scorer_team}"
+                    )
+            if problems:
+                errors.append(BulkRowError(index=index, errors=problems))
+        return errors
+
+    def replace_match_goals(
+        self, db: Session, *, match: Match, goals: list[MatchGoal]
+    ) -> list[int]:
+        """
+        Replace a match's goals with a full match sheet in one transaction.
+
+        The goals are inserted with one executemany, the final score is set
+        from them and the match is completed. Group standings and the stats
+        of the affected scorers are then updated once for the whole sheet.
+
+        Returns:
+            The IDs of the new goals in input order
+        """
+        previous = snapshot_result(match)
+        scopes = [events.tag("tournaments", match.tournament_id)]
+        if match.group_id is not None:
+            scopes.append(events.tag("groups", match.group_id))
+        try:
+            removed = db.execute(
+                delete(Goal.__table__)
+                .where(Goal.match_id == match.id)
+                .returning(*Goal.__table__.columns)
+            ).mappings().all()
+            events.record(db, Goal.__table__, "deleted", removed, tags=scopes)
+
+            ids = self.insert_rows(
+                db, [{"match_id": match.id, **goal.model_dump()} for goal in goals], tags=scopes
+            )
+
+            match.home_score = sum(goal.team_id == match.home_team_id for goal in goals)
+            match.away_score = sum(goal.team_id == match.away_team_id for goal in goals)
+            match.status = "completed"
+            db.add(match)
+            apply_result_change(db, previous, snapshot_result(match))
+
+            scorers = {row["player_id"] for row in removed} | {goal.player_id for goal in goals}
+            scorers.discard(None)
+            if scorers:
+                player_stats.apply_goal_totals(
+                    db, tournament_id=match.tournament_id, player_ids=scorers
+                )
+            db.commit()
+            db.refresh(match)
+            return ids
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
 
 goal = CRUDGoal(Goal) 
\ No newline at end of file
@@ -1,13 +1,27 @@
 from typing import Any
 
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
+from app.core.standings import apply_result_change, snapshot_result
+from app.crud.player_stats import player_stats
+from app.models.goal import Goal
+from app.models.group import Group
 from app.models.match import Match
+from app.models.phase import Phase
+from app.models.team import Team
+from app.models.tournament import Tournament
+from app.schemas.bulk import BulkRowError
 from app.schemas.match import MatchCreate, MatchUpdate
 
 
 class CRUDMatch(CRUDBase[Match, MatchCreate, MatchUpdate]):
+    keyset = ("date", "id")
+
     def get_by_tournament(
         self, db: Session, *, tournament_id: int, skip: int = 0, limit: int = 100
     ) -> list[Match]:
@@ -68,5 +82,179 @@ class CRUDMatch(CRUDBase[Match, MatchCreate, MatchUpdate]):
         
         return query.order_by(self.model.date, self.model.id).offset(skip).limit(limit).all()
 
+    def check_references(self, db: Session, objs_in: list[MatchCreate]) -> list[list[str]]:
+        """
+        Check the tournament, phase, group and teams of many matches at once.
+
+        Runs one query per referenced table and checks every row against the
+        loaded sets, instead of querying for each match.
+
+        Returns:
+            The list of problems for each match, in input order (empty if valid)
+        """
+        team_ids = {m.home_team_id for m in objs_in} | {m.away_team_id for m in objs_in}
+        tournaments = set(db.scalars(
+            select(Tournament.id).where(Tournament.id.in_({m.tournament_id for m in objs_in}))
+        ))
+        teams = set(db.scalars(select(Team.id).where(Team.id.in_(team_ids))))
+        phases = {
+            phase_id: tournament_id
+            for phase_id, tournament_id in db.execute(
+                select(Phase.id, Phase.tournament_id).where(
+                    Phase.id.in_({m.phase_id for m in objs_in})
+                )
+            )
+        }
+        groups = {
+            group_id: phase_id
+            for group_id, phase_id in db.execute(
+                select(Group.id, Group.phase_id).where(
+                    Group.id.in_({m.group_id for m in objs_in if m.group_id is not None})
+                )
+            )
+        }
+
+        problems = []
+        for m in objs_in:
+            errors = []
+            if m.tournament_id not in tournaments:
+                errors.append(f"tournament_id: Tournament {m.tournament_id} not found")
+            if m.phase_id not in phases:
+                errors.append(f"phase_id: Phase {m.phase_id} not found")
+            elif phases[m.phase_id] != m.tournament_id:
+                errors.append(
+                    f"phase_id: Phase {m.phase_id} is not in tournament {m.tournament_id}"
+                )
+            if m.group_id is not None:
+                if m.group_id not in groups:
+                    errors.append(f"group_id: Group {m.group_id} not found")
+                elif groups[m.group_id] != m.phase_id:
+                    errors.append(f"group_id: Group {m.group_id} is not in phase {m.phase_id}")
+            for field in ("home_team_id", "away_team_id"):
+                if getattr(m, field) not in teams:
+                    errors.append(f"{field}: Team {getattr(m, field)} not found")
+            if m.home_team_id == m.away_team_id:
+                errors.append("away_team_id: A team cannot play against itself")
+            problems.append(errors)
+        return problems
+
+    def import_matches(
+        self, db: Session, rows: list[tuple[int, MatchCreate]], errors: list[BulkRowError]
+    ) -> list[int]:
+        """
+        Validate the references of many matches and insert them in one transaction.
+
+        Nothing is inserted if any row is invalid; the problems are appended
+        to ``errors`` (which may already hold schema errors) by row index.
+
+        Returns:
+            The IDs of the new matches in input order, or [] if nothing was inserted
+        """
+        problems = self.check_references(db, [match for _, match in rows])
+        errors.extend(
+            BulkRowError(index=index, errors=row_errors)
+            for (index, _), row_errors in zip(rows, problems, strict=True)
+            if row_errors
+        )
+        if errors:
+            errors.sort(key=lambda e: e.index)
+            return []
+        return self.create_many(db, objs_in=[match for _, match in rows])
+
+    def update(
+        self, db: Session, *, db_obj: Match, obj_in: MatchUpdate | dict[str, Any]
+    ) -> Match:
+        """Update a match and apply the result delta to its group standings."""
+        previous = snapshot_result(db_obj)
+        try:
+            if isinstance(obj_in, dict):
+                obj_data = obj_in
+            else:
+                obj_data = obj_in.model_dump(exclude_unset=True)
+
+            for field, value in obj_data.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            apply_result_change(db, previous, snapshot_result(db_obj))
+            db.commit()
+            db.refresh(db_obj)
+            return db_obj
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    def delete(self, db: Session, *, id: int) -> Match:
+        """Delete a match and roll its result back out of the group standings."""
+        obj = db.get(self.model, id)
+        if not obj:
+            raise HTTPException(status_code=404, detail="Item not found")
+        previous = snapshot_result(obj)
+        scorers = {goal.player_id for goal in obj.goals if goal.player_id is not None}
+        try:
+            db.delete(obj)
+            apply_result_change(db, previous, None)
+            if scorers:
+                # The goals are deleted with the match; take them out of the scorers' stats
+                db.flush()
+                player_stats.apply_goal_totals(
+                    db, tournament_id=obj.tournament_id, player_ids=scorers
+                )
+            db.commit()
+            return obj
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=f"Cannot delete item due to existing references: {e!s}")
+
+    async def update_async(
+        self, db: AsyncSession, *, db_obj: Match, obj_in: MatchUpdate | dict[str, Any]
+    ) -> Match:
+        """Async variant of :meth:`update`, keeping the group standings in step."""
+        previous = snapshot_result(db_obj)
+        try:
+            if isinstance(obj_in, dict):
+                obj_data = obj_in
+            else:
+                obj_data = obj_in.model_dump(exclude_unset=True)
+
+            for field, value in obj_data.items():
+                setattr(db_obj, field, value)
+            db.add(db_obj)
+            current = snapshot_result(db_obj)
+            await db.run_sync(lambda session: apply_result_change(session, previous, current))
+            await db.commit()
+            # No refresh: it would expire relationships the caller already loaded
+            return db_obj
+        except IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
+
+    async def delete_async(self, db: AsyncSession, *, id: int) -> Match:
+        """Async variant of :meth:`delete`, keeping the group standings in step."""
+        obj = await db.get(self.model, id)
+        if not obj:
+            raise HTTPException(status_code=404, detail="Item not found")
+        previous = snapshot_result(obj)
+        scorers = set(await db.scalars(
+            select(Goal.player_id).where(Goal.match_id == id, Goal.player_id.is_not(None))
+        ))
+
+        def remove_result(session: Session) -> None:
+            apply_result_change(session, previous, None)
+            if scorers:
+                # The goals are deleted with the match; take them out of the scorers' stats
+                session.flush()
+                player_stats.apply_goal_totals(
+                    session, tournament_id=obj.tournament_id, player_ids=scorers
+                )
+
+        try:
+            await db.delete(obj)
+            await db.run_sync(remove_result)
+            await db.commit()
+            return obj
+        except IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(status_code=400, detail=f"Cannot delete item due to existing references: {e!s}")
+
 
 match = CRUDMatch(Match) 
\ No newline at end of file
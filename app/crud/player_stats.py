@@ -1,10 +1,25 @@
+from collections.abc import Collection
 from typing import Any
 
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
+from app.db.upsert import upsert
 from app.models.player_stats import PlayerStats
-from app.schemas.player_stats import PlayerStatsBase, PlayerStatsCreate
+from app.schemas.player_stats import PlayerStatsBase, PlayerStatsCreate, TopScorer
+
+# Columns written when goals are recounted
+STATS_COLUMNS = (
+    "player_id",
+    "tournament_id",
+    "matches_played",
+    "goals_scored",
+    "minutes_played",
+    "goals_per_match",
+    "minutes_per_goal",
+)
 
 
 class CRUDPlayerStats(CRUDBase[PlayerStats, PlayerStatsBase, PlayerStatsBase]):
@@ -75,48 +90,79 @@ class CRUDPlayerStats(CRUDBase[PlayerStats, PlayerStatsBase, PlayerStatsBase]):
         db: Session,
         tournament_id: int,
         limit: int = 5
-    ) -> list[PlayerStats]:
-        """Get top scorers for a tournament."""
-        from sqlalchemy import desc, func
-        from sqlalchemy.orm import joinedload
+    ) -> list[TopScorer]:
+        """
+        Get top scorers for a tournament.
+        
+        Pure read: goal counts are computed from the goals table and joined with
+        Player, Team and the players' PlayerStats rows in a single query, without
+        creating or touching any PlayerStats rows. Matches and minutes played
+        come from the stats row, as goals only tell the matches a player scored
+        in; that count is the fallback for players without a row.
+        """
+        from sqlalchemy import and_, desc, distinct, func
 
         from app.models.goal import Goal
         from app.models.match import Match
+        from app.models.player import Player
+        from app.models.team import Team
+        from app.models.tournament import Tournament
         
         # Count goals by player in matches of the tournament
         goals_by_player = (
             db.query(
-                Goal.player_id,
-                func.count(Goal.id).label("goal_count")
+                Goal.player_id.label("player_id"),
+                func.count(Goal.id).label("goal_count"),
+                func.count(distinct(Goal.match_id)).label("match_count"),
             )
             .join(Match, Goal.match_id == Match.id)
             .filter(Match.tournament_id == tournament_id)
             .group_by(Goal.player_id)
-            .order_by(desc("goal_count"))
+            .order_by(desc("goal_count"), Goal.player_id)
             .limit(limit)
+            .subquery()
+        )
+        
+        rows = (
+            db.query(
+                Player,
+                Team,
+                self.model,
+                goals_by_player.c.goal_count,
+                goals_by_player.c.match_count,
+            )
+            .join(goals_by_player, Player.id == goals_by_player.c.player_id)
+            .outerjoin(Team, Player.team_id == Team.id)
+            .outerjoin(self.model, and_(
+                self.model.player_id == Player.id,
+                self.model.tournament_id == tournament_id,
+            ))
+            .order_by(goals_by_player.c.goal_count.desc(), Player.id)
             .all()
         )
+        # Already in the identity map when the caller checked that it exists
+        tournament = db.get(Tournament, tournament_id)
         
-        # Create or update player stats for each top scorer
         top_scorers = []
-        for player_id, goal_count in goals_by_player:
-            # Get or create stats for this player in this tournament
-            stats = db.query(self.model).options(
-                joinedload(self.model.player),
-                joinedload(self.model.tournament)
-            ).filter(
-                self.model.player_id == player_id,
-                self.model.tournament_id == tournament_id
-            ).first()
-            
-            if not stats:
-                stats = self.create_for_player(db, player_id=player_id, tournament_id=tournament_id)
-                
-            # Update with goal count
-            stats.goals_scored = goal_count
-            stats.update_calculated_stats()
-            
-            top_scorers.append(stats)
+        for player, team, stats, goal_count, match_count in rows:
+            if stats is not None:
+                matches_played, minutes_played = stats.matches_played, stats.minutes_played
+            else:
+                # Estimate minutes played (90 minutes per match), as in update_stats_from_goals
+                matches_played, minutes_played = match_count, match_count * 90
+            top_scorers.append(TopScorer(
+                id=stats.id if stats is not None else None,
+                player_id=player.id,
+                tournament_id=tournament_id,
+                matches_played=matches_played,
+                goals_scored=goal_count,
+                minutes_played=minutes_played,
+                goals_per_match=goal_count / matches_played if matches_played else 0.0,
+                minutes_per_goal=minutes_played / goal_count if goal_count else 0.0,
+                player=player,
+                tournament=tournament,
+                team=team,
+            ))
             
         return top_scorers
     
@@ -148,72 +194,129 @@ class CRUDPlayerStats(CRUDBase[PlayerStats, PlayerStatsBase, PlayerStatsBase]):
     def create_or_update(
         self, db: Session, *, obj_in: PlayerStatsCreate | dict[str, Any]
     ) -> PlayerStats:
-        """Create or update player stats for a tournament."""
+        """Create or update player stats for a tournament, in one upsert."""
         if isinstance(obj_in, dict):
-            player_id = obj_in.get("player_id")
-            tournament_id = obj_in.get("tournament_id")
+            values, changed = obj_in, list(obj_in)
         else:
-            player_id = obj_in.player_id
-            tournament_id = obj_in.tournament_id
-            
-        db_obj = self.get_by_player_tournament(
-            db=db, player_id=player_id, tournament_id=tournament_id
-        )
+            values = obj_in.model_dump()
+            changed = list(obj_in.model_dump(exclude_unset=True))
+        try:
+            upsert(
+                db,
+                self.model.__table__,
+                [values],
+                conflict=("player_id", "tournament_id"),
+                update=changed,
+            )
+            db.commit()
+        except IntegrityError as e:
+            db.rollback()
+            raise HTTPException(status_code=400, detail=str(e))
         
-        if db_obj:
-            return self.update(db=db, db_obj=db_obj, obj_in=obj_in)
-        return self.create(db=db, obj_in=obj_in)
+        # populate_existing: a row already in the session was updated behind its back
+        return db.query(self.model).populate_existing().filter(
+            self.model.player_id == values["player_id"],
+            self.model.tournament_id == values["tournament_id"],
+        ).one()
     
     def update_stats_from_goals(
         self, db: Session, *, player_id: int, tournament_id: int
     ) -> PlayerStats | None:
         """Update player stats based on goals scored in the tournament."""
-        from app.crud.goal import goal
-        from app.crud.match import match
-        
-        # Get or create player stats
-        db_obj = self.get_by_player_tournament(
-            db=db, player_id=player_id, tournament_id=tournament_id
-        )
-        
-        if not db_obj:
-            db_obj = self.create(
-                db=db, 
-                obj_in=PlayerStatsCreate(
-                    player_id=player_id,
-                    tournament_id=tournament_id
-                )
-            )
-        
-        # Get all matches in the tournament
-        tournament_matches = match.get_by_tournament(
-            db=db, tournament_id=tournament_id
+        updated = self.update_tournament_stats_from_goals(
+            db=db, tournament_id=tournament_id, player_id=player_id
         )
-        match_ids = [m.id for m in tournament_matches]
+        return updated[0] if updated else None
+    
+    def update_tournament_stats_from_goals(
+        self, db: Session, *, tournament_id: int, player_id: int | None = None
+    ) -> list[PlayerStats]:
+        """
+        Update the stats of every scorer in a tournament with set-based queries.
         
-        # Get all goals by the player in these matches
-        player_goals = goal.get_by_player_in_matches(
-            db=db, player_id=player_id, match_ids=match_ids
+        Runs one aggregate query over the tournament's goals, loads the existing
+        stats rows in one query and writes all of them in a single commit.
+        If player_id is given, only that player is updated, and a zeroed row is
+        returned when the player has not scored.
+        """
+        from sqlalchemy.orm import joinedload
+
+        existing = self.apply_goal_totals(
+            db,
+            tournament_id=tournament_id,
+            player_ids=None if player_id is None else [player_id],
         )
+        if not existing:
+            return []
         
-        # Update stats
-        db_obj.goals_scored = len(player_goals)
+        db.flush()
+        stats_ids = [stats.id for stats in existing]
+        db.commit()
         
-        # Count matches played (matches where the player scored)
-        matches_with_goals = set(g.match_id for g in player_goals)
-        db_obj.matches_played = len(matches_with_goals)
+        # Reload everything, with relationships, in a single query
+        return db.query(self.model).options(
+            joinedload(self.model.player),
+            joinedload(self.model.tournament)
+        ).filter(
+            self.model.id.in_(stats_ids)
+        ).order_by(
+            self.model.goals_scored.desc(), self.model.player_id
+        ).all()
+
+    def apply_goal_totals(
+        self, db: Session, *, tournament_id: int, player_ids: Collection[int] | None = None
+    ) -> list[PlayerStats]:
+        """
+        Recount the goals of players in a tournament into their stats rows.
         
-        # Estimate minutes played (90 minutes per match)
-        db_obj.minutes_played = db_obj.matches_played * 90
+        Every scorer is updated when player_ids is None; otherwise only the
+        given players, with zeroed rows for those who have no goals left.
+        The caller is responsible for committing.
+        """
+        from sqlalchemy import distinct, func
+
+        from app.models.goal import Goal
+        from app.models.match import Match
         
-        # Update calculated stats
-        db_obj.update_calculated_stats()
+        totals_query = db.query(
+            Goal.player_id,
+            func.count(Goal.id),
+            func.count(distinct(Goal.match_id)),
+        ).join(
+            Match, Goal.match_id == Match.id
+        ).filter(
+            Match.tournament_id == tournament_id,
+            Goal.player_id.isnot(None),
+        ).group_by(Goal.player_id)
+        if player_ids is not None:
+            totals_query = totals_query.filter(Goal.player_id.in_(player_ids))
+        totals = {pid: (goals, matches) for pid, goals, matches in totals_query}
+        for pid in player_ids or ():
+            totals.setdefault(pid, (0, 0))
+        if not totals:
+            return []
         
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        rows = []
+        for pid, (goals_scored, matches_played) in totals.items():
+            # Transient: only used to derive the calculated columns
+            stats = self.model(
+                player_id=pid,
+                tournament_id=tournament_id,
+                goals_scored=goals_scored,
+                # Count matches played (matches where the player scored)
+                matches_played=matches_played,
+                # Estimate minutes played (90 minutes per match)
+                minutes_played=matches_played * 90,
+            )
+            stats.update_calculated_stats()
+            rows.append({column: getattr(stats, column) for column in STATS_COLUMNS})
+        # One upsert: concurrent recounts of a player cannot race into a duplicate row
+        upsert(db, self.model.__table__, rows, conflict=("player_id", "tournament_id"))
         
-        return db_obj
-
+        # populate_existing: rows already in the session were updated behind its back
+        return db.query(self.model).populate_existing().filter(
+            self.model.tournament_id == tournament_id,
+            self.model.player_id.in_(totals),
+        ).all()
 
 player_stats = CRUDPlayerStats(PlayerStats) 
\ No newline at end of file
@@ -1,10 +1,33 @@
 
+from collections.abc import Iterable
+
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
+from app.db.upsert import upsert
+from app.models.match import Match
 from app.models.team_stats import TeamStats
 from app.schemas.team_stats import TeamStatsCreate, TeamStatsUpdate
 
+# Columns written by a recalculation; a stored position is left as it is
+STATS_COLUMNS = (
+    "team_id",
+    "tournament_id",
+    "matches_played",
+    "wins",
+    "draws",
+    "losses",
+    "goals_for",
+    "goals_against",
+    "goal_difference",
+    "clean_sheets",
+    "points",
+    "win_percentage",
+    "goals_per_match",
+    "points_per_match",
+)
+
 
 class CRUDTeamStats(CRUDBase[TeamStats, TeamStatsCreate, TeamStatsUpdate]):
     """CRUD operations for team statistics."""
@@ -62,38 +85,100 @@ class CRUDTeamStats(CRUDBase[TeamStats, TeamStatsCreate, TeamStatsUpdate]):
         self, db: Session, *, team_id: int, tournament_id: int
     ) -> TeamStats | None:
         """Update team stats based on match results in the tournament."""
-        from app.crud.match import match
+        # Get completed matches where the team participated, in a single query
+        matches = db.query(
+            Match.home_team_id, Match.home_score, Match.away_score
+        ).filter(
+            Match.tournament_id == tournament_id,
+            Match.status == "completed",
+            Match.home_score.isnot(None),
+            Match.away_score.isnot(None),
+            or_(Match.home_team_id == team_id, Match.away_team_id == team_id),
+        ).all()
         
-        # Get or create team stats
-        db_obj = self.get_by_team_tournament(
-            db=db, team_id=team_id, tournament_id=tournament_id
-        )
+        stats = TeamStats(team_id=team_id, tournament_id=tournament_id)
+        self._reset_counters(stats)
+        for home_team_id, home_score, away_score in matches:
+            if home_team_id == team_id:
+                self._add_result(stats, home_score, away_score)
+            else:
+                self._add_result(stats, away_score, home_score)
         
-        if not db_obj:
-            db_obj = self.create_for_team(
-                db=db, team_id=team_id, tournament_id=tournament_id
-            )
+        self._write(db, [stats])
+        db.commit()
         
-        # Get completed matches where the team participated
-        home_matches = match.get_all_by_fields(
-            db=db,
-            fields={
-                "home_team_id": team_id,
-                "tournament_id": tournament_id,
-                "status": "completed"
-            }
-        )
+        # populate_existing: rows already in the session were updated behind its back
+        return db.query(TeamStats).populate_existing().filter(
+            TeamStats.team_id == team_id,
+            TeamStats.tournament_id == tournament_id
+        ).first()
+    
+    def recompute_tournament(self, db: Session, *, tournament_id: int) -> list[TeamStats]:
+        """
+        Recalculate the statistics of every team in a tournament.
+        
+        Loads all matches of the tournament in one query, aggregates every team
+        in a single pass and upserts all TeamStats rows in one statement.
+        Teams that only have scheduled matches get zeroed statistics.
+        
+        Returns:
+            The tournament's team statistics ranked by points and goal difference
+        """
+        matches = db.query(
+            Match.home_team_id,
+            Match.away_team_id,
+            Match.home_score,
+            Match.away_score,
+            Match.status,
+        ).filter(Match.tournament_id == tournament_id).all()
         
-        away_matches = match.get_all_by_fields(
-            db=db,
-            fields={
-                "away_team_id": team_id,
-                "tournament_id": tournament_id,
-                "status": "completed"
-            }
+        team_ids = set(
+            db.scalars(select(TeamStats.team_id).where(TeamStats.tournament_id == tournament_id))
         )
+        for home_team_id, away_team_id, _, _, _ in matches:
+            team_ids.update((home_team_id, away_team_id))
+        team_ids.discard(None)
         
-        # Reset stats before recalculation
+        all_stats: dict[int, TeamStats] = {}
+        for team_id in team_ids:
+            # Transient: only used to add up the counters before the upsert
+            all_stats[team_id] = TeamStats(team_id=team_id, tournament_id=tournament_id)
+            self._reset_counters(all_stats[team_id])
+        
+        for home_team_id, away_team_id, home_score, away_score, status in matches:
+            if status != "completed" or home_score is None or away_score is None:
+                continue
+            self._add_result(all_stats[home_team_id], home_score, away_score)
+            self._add_result(all_stats[away_team_id], away_score, home_score)
+        
+        self._write(db, all_stats.values())
+        db.commit()
+        
+        return db.query(TeamStats).populate_existing().filter(
+            TeamStats.tournament_id == tournament_id,
+        ).order_by(
+            TeamStats.points.desc(),
+            TeamStats.goal_difference.desc(),
+            TeamStats.goals_for.desc(),
+        ).all()
+    
+    @staticmethod
+    def _write(db: Session, all_stats: Iterable[TeamStats]) -> None:
+        """
+        Upsert computed stats by team and tournament.
+        
+        Concurrent recalculations of the same rows both succeed, the last
+        one winning, instead of failing on the unique index.
+        """
+        rows = []
+        for stats in all_stats:
+            stats.update_calculated_stats()
+            rows.append({column: getattr(stats, column) for column in STATS_COLUMNS})
+        upsert(db, TeamStats.__table__, rows, conflict=("team_id", "tournament_id"))
+    
+    @staticmethod
+    def _reset_counters(db_obj: TeamStats) -> None:
+        """Zero the raw counters before a recalculation."""
         db_obj.matches_played = 0
         db_obj.wins = 0
         db_obj.draws = 0
@@ -102,57 +187,28 @@ class CRUDTeamStats(CRUDBase[TeamStats, TeamStatsCreate, TeamStatsUpdate]):
         db_obj.goals_against = 0
         db_obj.clean_sheets = 0
         db_obj.points = 0
+    
+    @staticmethod
+    def _add_result(db_obj: TeamStats, goals_for: int, goals_against: int) -> None:
+        """Add one completed match, seen from the team's side, to its counters."""
+        db_obj.matches_played += 1
+        db_obj.goals_for += goals_for
+        db_obj.goals_against += goals_against
         
-        # Calculate stats from home matches
-        for match in home_matches:
-            db_obj.matches_played += 1
-            db_obj.goals_for += match.home_score
-            db_obj.goals_against += match.away_score
-            
-            if match.home_score > match.away_score:
-                # Win
-                db_obj.wins += 1
-                db_obj.points += 3
-            elif match.home_score == match.away_score:
-                # Draw
-                db_obj.draws += 1
-                db_obj.points += 1
-            else:
-                # Loss
-                db_obj.losses += 1
-            
-            if match.away_score == 0:
-                db_obj.clean_sheets += 1
-        
-        # Calculate stats from away matches
-        for match in away_matches:
-            db_obj.matches_played += 1
-            db_obj.goals_for += match.away_score
-            db_obj.goals_against += match.home_score
-            
-            if match.away_score > match.home_score:
-                # Win
-                db_obj.wins += 1
-                db_obj.points += 3
-            elif match.away_score == match.home_score:
-                # Draw
-                db_obj.draws += 1
-                db_obj.points += 1
-            else:
-                # Loss
-                db_obj.losses += 1
-            
-            if match.home_score == 0:
-                db_obj.clean_sheets += 1
-        
-        # Update calculated stats
-        db_obj.update_calculated_stats()
-        
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        if goals_for > goals_against:
+            # Win
+            db_obj.wins += 1
+            db_obj.points += 3
+        elif goals_for == goals_against:
+            # Draw
+            db_obj.draws += 1
+            db_obj.points += 1
+        else:
+            # Loss
+            db_obj.losses += 1
         
-        return db_obj
+        if goals_against == 0:
+            db_obj.clean_sheets += 1
     
     def get_tournament_teams_ranked(
         self, db: Session, *, tournament_id: int, limit: int = 100
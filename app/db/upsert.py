@@ -0,0 +1,51 @@
+"""``INSERT ... ON CONFLICT DO UPDATE`` on the supported database backends."""
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import Insert, Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core import events
+
+_INSERTS = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+
+def dialect_insert(db: Session, table: Table) -> Insert:
+    """INSERT into ``table`` supporting ``on_conflict_do_update`` on the session's backend."""
+    return _INSERTS[db.get_bind().dialect.name](table)
+
+
+def upsert(
+    db: Session,
+    table: Table,
+    rows: Sequence[dict[str, Any]],
+    *,
+    conflict: Sequence[str],
+    update: Sequence[str] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Insert ``rows``, updating instead the row that already has their ``conflict`` columns.
+
+    ``conflict`` must match a unique index. An existing row takes the
+    ``update`` columns (by default every other column given) from the new
+    one. The database settles concurrent writers of the same key, so none
+    of them fails with an IntegrityError or writes a duplicate. Change
+    events are recorded for the written rows; the caller is responsible for
+    committing.
+
+    Returns:
+        The written rows, with all their columns
+    """
+    if not rows:
+        return []
+    statement = dialect_insert(db, table)
+    columns = [key for key in (rows[0] if update is None else update) if key not in conflict]
+    # A no-op update still returns the existing row, unlike DO NOTHING
+    statement = statement.on_conflict_do_update(
+        index_elements=list(conflict),
+        set_={key: statement.excluded[key] for key in columns or conflict[:1]},
+    ).returning(*table.c)
+    written = [dict(row) for row in db.execute(statement, list(rows)).mappings()]
+    events.record(db, table, "updated", written)
+    return written
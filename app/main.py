@@ -1,3 +1,5 @@
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import sentry_sdk
@@ -10,16 +12,21 @@ from sentry_sdk.integrations.fastapi import FastApiIntegration
 from app.api import (
     goal,
     group,
+    live,
     match,
     phase,
     player,
     player_stats,
     standings,
+    stats,
     team,
     team_stats,
     tournament,
 )
-from app.db.database import Base, engine
+from app.core import timing
+from app.core.config import settings
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.db.database import Base, async_engine, engine
 from app.ui import ui_router
 
 # Configure structured logging
@@ -45,7 +52,16 @@ sentry_sdk.init(
     profiles_sample_rate=1.0,
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close pooled async connections on shutdown so worker threads can exit."""
+    yield
+    await async_engine.dispose()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Soccer Tournament Management System",
     description="API for managing soccer tournaments, teams, matches, and statistics",
     version="1.0.0",  # Released March 2024
@@ -58,6 +74,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # Mount static files
@@ -76,6 +93,8 @@ app.include_router(goal.router, prefix="/api/goals", tags=["goals"])
 app.include_router(player.router, prefix="/api/players", tags=["players"])
 app.include_router(player_stats.router, prefix="/api/player-stats", tags=["player-stats"])
 app.include_router(team_stats.router, prefix="/api/team-stats", tags=["team-stats"])
+app.include_router(stats.router, prefix="/api/stats", tags=["stats"])
+app.include_router(live.router, prefix="/api/live", tags=["live"])
 
 # Include UI router
 app.include_router(ui_router.router)
@@ -85,19 +104,26 @@ Base.metadata.create_all(bind=engine)
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all requests with structured logging."""
+    """Log all requests with structured logging, including their database timings."""
     logger.info(
         "request_started",
         path=request.url.path,
         method=request.method,
         client=request.client.host if request.client else None,
     )
+    started = time.perf_counter()
+    stats = timing.start_request(request.url.path)
     response = await call_next(request)
+    total = time.perf_counter() - started
+    if settings.SERVER_TIMING:
+        response.headers["Server-Timing"] = stats.server_timing(total)
     logger.info(
         "request_completed",
         path=request.url.path,
         method=request.method,
         status_code=response.status_code,
+        duration_ms=round(total * 1000, 2),
+        **stats.log_fields(),
     )
     return response
 
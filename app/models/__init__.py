@@ -1,9 +1,12 @@
+from app.models.change_version import ChangeVersion
 from app.models.goal import Goal
 from app.models.group import Group
+from app.models.group_standing import GroupStanding
 from app.models.match import Match
 from app.models.phase import Phase
 from app.models.player import Player
 from app.models.player_stats import PlayerStats
+from app.models.row_count import RowCount
 from app.models.team import Team
 from app.models.team_stats import TeamStats
 from app.models.tournament import Tournament
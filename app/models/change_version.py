@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String
+
+from app.db.database import Base
+
+
+class ChangeVersion(Base):
+    """Number of committed writes to a tag or table, shared by every process."""
+    __tablename__ = "change_versions"
+
+    key = Column(String, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
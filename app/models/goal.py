@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, ForeignKey, Integer
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -6,6 +6,11 @@ from app.db.database import Base
 
 class Goal(Base):
     __tablename__ = "goals"
+    __table_args__ = (
+        # Covers the tournament leaderboard: goals per player within matches
+        Index("ix_goals_match_id_player_id", "match_id", "player_id"),
+        Index("ix_goals_player_id", "player_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     match_id = Column(Integer, ForeignKey("matches.id"))
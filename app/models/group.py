@@ -25,3 +25,6 @@ class Group(Base):
     matches = relationship(
         "Match", back_populates="group", cascade="all, delete-orphan"
     )
+    standings = relationship(
+        "GroupStanding", back_populates="group", cascade="all, delete-orphan"
+    )
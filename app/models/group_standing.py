@@ -0,0 +1,29 @@
+from sqlalchemy import Column, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import relationship
+
+from app.db.database import Base
+
+
+class GroupStanding(Base):
+    """Persisted standings row for a team in a group, maintained incrementally."""
+    __tablename__ = "group_standings"
+    __table_args__ = (
+        UniqueConstraint("group_id", "team_id", name="uq_group_standings_group_team"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    group_id = Column(Integer, ForeignKey("groups.id"), nullable=False)
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=False)
+
+    matches_played = Column(Integer, default=0, nullable=False)
+    wins = Column(Integer, default=0, nullable=False)
+    draws = Column(Integer, default=0, nullable=False)
+    losses = Column(Integer, default=0, nullable=False)
+    goals_for = Column(Integer, default=0, nullable=False)
+    goals_against = Column(Integer, default=0, nullable=False)
+    goal_difference = Column(Integer, default=0, nullable=False)
+    points = Column(Integer, default=0, nullable=False)
+
+    # Relationships
+    group = relationship("Group", back_populates="standings")
+    team = relationship("Team", back_populates="group_standings")
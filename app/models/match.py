@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, Enum, ForeignKey, Integer, String, Time
+from sqlalchemy import Column, Date, Enum, ForeignKey, Index, Integer, String, Time
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -6,6 +6,14 @@ from app.db.database import Base
 
 class Match(Base):
     __tablename__ = "matches"
+    __table_args__ = (
+        Index("ix_matches_tournament_id_id", "tournament_id", "id"),
+        Index("ix_matches_tournament_id_status", "tournament_id", "status"),
+        Index("ix_matches_group_id_status", "group_id", "status"),
+        Index("ix_matches_phase_id", "phase_id"),
+        Index("ix_matches_home_team_id", "home_team_id"),
+        Index("ix_matches_away_team_id", "away_team_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     tournament_id = Column(Integer, ForeignKey("tournaments.id"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -7,6 +7,10 @@ from app.db.database import Base
 class PlayerStats(Base):
     """Model for player statistics."""
     __tablename__ = "player_stats"
+    __table_args__ = (
+        # One stats row per player and tournament
+        Index("uq_player_stats_player_id_tournament_id", "player_id", "tournament_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     player_id = Column(Integer, ForeignKey("players.id"))
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String
+
+from app.db.database import Base
+
+
+class RowCount(Base):
+    """Maintained number of rows of a table, read instead of a COUNT(*) scan."""
+    __tablename__ = "row_counts"
+
+    table_name = Column(String, primary_key=True)
+    count = Column(Integer, default=0, nullable=False)
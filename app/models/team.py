@@ -22,3 +22,6 @@ class Team(Base):
     groups = relationship("Group", secondary="team_group", back_populates="teams")
     goals = relationship("Goal", back_populates="team")
     stats = relationship("TeamStats", back_populates="team", cascade="all, delete-orphan")
+    group_standings = relationship(
+        "GroupStanding", back_populates="team", cascade="all, delete-orphan"
+    )
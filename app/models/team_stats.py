@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app.db.database import Base
@@ -7,6 +7,10 @@ from app.db.database import Base
 class TeamStats(Base):
     """Model for team statistics."""
     __tablename__ = "team_stats"
+    __table_args__ = (
+        # One stats row per team and tournament
+        Index("uq_team_stats_team_id_tournament_id", "team_id", "tournament_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     team_id = Column(Integer, ForeignKey("teams.id"))
@@ -1,4 +1,13 @@
-from app.schemas.goal import Goal, GoalBase, GoalCreate, GoalType, GoalUpdate
+from app.schemas.bulk import BulkResult, BulkRowError
+from app.schemas.goal import (
+    Goal,
+    GoalBase,
+    GoalCreate,
+    GoalType,
+    GoalUpdate,
+    MatchGoal,
+    MatchGoalsCreate,
+)
 from app.schemas.group import Group, GroupBase, GroupCreate, GroupUpdate, GroupWithTeams
 from app.schemas.match import Match, MatchBase, MatchCreate, MatchResult, MatchUpdate
 from app.schemas.phase import Phase, PhaseBase, PhaseCreate, PhaseUpdate
@@ -7,7 +16,9 @@ from app.schemas.player_stats import (
     PlayerStatsBase,
     PlayerStatsCreate,
     PlayerStatsUpdate,
+    TopScorer,
 )
+from app.schemas.stats_summary import StatsSummary
 from app.schemas.team import Team, TeamBase, TeamCreate, TeamUpdate
 from app.schemas.team_standing import TeamStanding
 from app.schemas.team_stats import TeamStats, TeamStatsBase, TeamStatsCreate, TeamStatsUpdate
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class BulkRowError(BaseModel):
+    index: int  # position of the row in the request, starting at 0
+    errors: list[str]
+
+
+class BulkResult(BaseModel):
+    created: int
+    ids: list[int] = []
+    errors: list[BulkRowError] = []
@@ -28,6 +28,18 @@ class GoalUpdate(BaseModel):
     type: GoalType | None = None
 
 
+class MatchGoal(BaseModel):
+    """A goal on a match sheet; team_id is the team credited, also for own goals."""
+    player_id: int | None = None
+    team_id: int
+    minute: int = Field(..., ge=0, le=120)
+    type: GoalType = GoalType.REGULAR
+
+
+class MatchGoalsCreate(BaseModel):
+    goals: list[MatchGoal] = Field(..., max_length=200)
+
+
 class PlayerBase(BaseModel):
     id: int
     name: str
@@ -1,3 +1,4 @@
+import datetime as _dt
 from datetime import date, time
 from enum import Enum
 
@@ -16,8 +17,8 @@ class MatchBase(BaseModel):
     group_id: int | None = None
     home_team_id: int
     away_team_id: int
-    date: date
-    time: time | None = None
+    date: _dt.date
+    time: _dt.time | None = None
     location: str | None = None
 
 
@@ -30,8 +31,8 @@ class MatchUpdate(BaseModel):
     group_id: int | None = None
     home_team_id: int | None = None
     away_team_id: int | None = None
-    date: date | None = None
-    time: time | None = None
+    date: _dt.date | None = None
+    time: _dt.time | None = None
     location: str | None = None
     home_score: int | None = None
     away_score: int | None = None
@@ -1,6 +1,7 @@
 
 from pydantic import BaseModel, Field
 
+from app.schemas.match import TeamBase
 from app.schemas.player import Player
 from app.schemas.tournament import Tournament
 
@@ -25,6 +26,18 @@ class PlayerStats(PlayerStatsBase):
     model_config = {"from_attributes": True}
 
 
+class TopScorer(PlayerStatsBase):
+    """Leaderboard entry: goals counted on the fly, the rest from the player's stats row."""
+    id: int | None = None  # of the stats row; None if the player has none yet
+    player_id: int
+    tournament_id: int
+    player: Player
+    tournament: Tournament | None = None
+    team: TeamBase | None = None
+
+    model_config = {"from_attributes": True}
+
+
 # Properties to receive on creation
 class PlayerStatsCreate(PlayerStatsBase):
     """Schema for creating player statistics."""
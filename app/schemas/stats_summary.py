@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class StatsSummary(BaseModel):
+    tournament_id: int | None = None  # None for all tournaments
+    total_matches: int  # completed matches
+    total_goals: int
+    goals_per_match: float
+    total_clean_sheets: int
@@ -5,6 +5,7 @@ document.addEventListener('DOMContentLoaded', function() {
     initializeDropdowns();
     initializeFormValidation();
     initializeClickableRows();
+    initializeHighlightedRows();
     
     // Add event listeners for filter forms
     const filterForms = document.querySelectorAll('.filter-form');
@@ -74,6 +75,18 @@ function initializeClickableRows() {
     });
 }
 
+// Highlight the rows of the listed teams, in tables shared by several pages
+function initializeHighlightedRows() {
+    document.querySelectorAll('[data-highlight-teams]').forEach(container => {
+        const teamIds = container.dataset.highlightTeams.split(' ');
+        container.querySelectorAll('tr[data-team-id]').forEach(row => {
+            if (teamIds.includes(row.dataset.teamId)) {
+                row.classList.add('highlight');
+            }
+        });
+    });
+}
+
 // Format date for display
 function formatDate(dateString) {
     if (!dateString) return '';
@@ -1,12 +1,16 @@
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
-from app.db.database import Base, get_db
+from app.core.cache import cache
+from app.db.database import Base, get_async_db, get_db
 from app.main import app
 
 # Create test database
@@ -16,11 +20,18 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine on the same database for the handlers using get_async_db.
+# NullPool: every TestClient runs its own event loop, so connections can't be reused.
+async_engine = create_async_engine("sqlite+aiosqlite:///./test.db", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 @pytest.fixture(scope="function")
 def db() -> Generator[Session, None, None]:
     # Create the database tables
     Base.metadata.create_all(bind=engine)
+    # Cached reads from a previous test would refer to dropped rows
+    cache.clear()
 
     # Create a new session for each test
     db = TestingSessionLocal()
@@ -41,7 +52,12 @@ def client(db: Session) -> Generator[TestClient, None, None]:
         finally:
             pass  # Don't close the db here, it will be closed by the db fixture
 
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
 
     with TestClient(app) as c:
         yield c
@@ -61,3 +77,32 @@ def refresh_objects(db: Session, *objects: Any) -> None:
 def refresh() -> Callable[[Session, Any], None]:
     """Fixture to provide the refresh_objects function."""
     return refresh_objects
+
+
+@pytest.fixture
+def query_budget(db: Session) -> Callable[[int], AbstractContextManager[list[str]]]:
+    """
+    Context manager failing the test if its block runs more than ``max_queries`` statements.
+
+    Yields the list of statements run so far, for closer assertions.
+    """
+    engine = db.get_bind()
+
+    @contextmanager
+    def budget(max_queries: int) -> Generator[list[str], None, None]:
+        statements: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        assert len(statements) <= max_queries, (
+            f"{len(statements)} queries, over the budget of {max_queries}:\n"
+            + "\n".join(statements)
+        )
+
+    return budget
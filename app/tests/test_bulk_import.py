@@ -0,0 +1,146 @@
+"""Test module for the bulk match import endpoint."""
+import json
+
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.match import Match
+from app.tests.fixtures import (
+    create_test_group,
+    create_test_phase,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+def round_robin(tournament_id, phase_id, group_id, team_ids):
+    """Fixture list where every team hosts every other team once."""
+    return [
+        {
+            "tournament_id": tournament_id,
+            "phase_id": phase_id,
+            "group_id": group_id,
+            "home_team_id": home,
+            "away_team_id": away,
+            "date": "2024-08-18",
+        }
+        for home in team_ids
+        for away in team_ids
+        if home != away
+    ]
+
+
+def count_statements(db: Session, run):
+    """Run ``run`` and return how many SQL statements it executed on ``db``'s engine."""
+    engine = db.get_bind()
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+
+def setup_league(db: Session, teams: int):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    team_ids = [create_test_team(db).id for _ in range(teams)]
+    return tournament, phase, group, team_ids
+
+
+def test_bulk_import_json_array(client, db: Session):
+    tournament, phase, group, team_ids = setup_league(db, 4)
+    fixtures = round_robin(tournament.id, phase.id, group.id, team_ids)
+
+    # A cached list must be invalidated by the bulk insert
+    assert client.get(f"/api/matches/tournament/{tournament.id}").json() == []
+
+    response = client.post("/api/matches/bulk", json=fixtures)
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == 12
+    assert result["errors"] == []
+
+    matches = client.get(f"/api/matches/tournament/{tournament.id}").json()
+    assert sorted(m["id"] for m in matches) == sorted(result["ids"])
+    first = next(m for m in matches if m["id"] == result["ids"][0])
+    assert (first["home_team_id"], first["away_team_id"]) == (team_ids[0], team_ids[1])
+    assert first["status"] == "scheduled"
+
+
+def test_bulk_import_ndjson(client, db: Session):
+    tournament, phase, group, team_ids = setup_league(db, 3)
+    body = "\n".join(json.dumps(m) for m in round_robin(tournament.id, phase.id, None, team_ids))
+
+    response = client.post(
+        "/api/matches/bulk", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.json()["created"] == 6
+
+
+def test_bulk_import_json_seq(client, db: Session):
+    tournament, phase, group, team_ids = setup_league(db, 3)
+    # RFC 7464: every record starts with RS and ends with LF
+    body = "".join(
+        f"\x1e{json.dumps(m, indent=2)}\n"
+        for m in round_robin(tournament.id, phase.id, None, team_ids)
+    )
+
+    response = client.post(
+        "/api/matches/bulk", content=body, headers={"Content-Type": "application/json-seq"}
+    )
+    assert response.status_code == 200
+    assert response.json()["created"] == 6
+
+
+def test_bulk_import_query_count_does_not_grow(client, db: Session):
+    tournament, phase, group, team_ids = setup_league(db, 20)
+    fixtures = round_robin(tournament.id, phase.id, group.id, team_ids)
+
+    small = count_statements(db, lambda: client.post("/api/matches/bulk", json=fixtures[:2]))
+    large = count_statements(db, lambda: client.post("/api/matches/bulk", json=fixtures[2:]))
+    assert len(fixtures[2:]) == 378
+    assert large <= small + 1  # executemany may batch the VALUES into a few statements
+    assert db.scalar(select(func.count(Match.id))) == 380
+
+
+def test_bulk_import_reports_every_invalid_row(client, db: Session):
+    tournament, phase, group, team_ids = setup_league(db, 2)
+    other_phase = create_test_phase(db, tournament.id)
+    fixtures = round_robin(tournament.id, phase.id, group.id, team_ids)
+    fixtures += [
+        {**fixtures[0], "home_team_id": 999},
+        {**fixtures[0], "phase_id": other_phase.id},
+        {**fixtures[0], "away_team_id": fixtures[0]["home_team_id"]},
+        {key: value for key, value in fixtures[0].items() if key != "date"},
+    ]
+
+    response = client.post("/api/matches/bulk", json=fixtures)
+    assert response.status_code == 422
+    result = response.json()
+    assert result["created"] == 0
+    assert [e["index"] for e in result["errors"]] == [2, 3, 4, 5]
+    assert result["errors"][0]["errors"] == ["home_team_id: Team 999 not found"]
+    assert result["errors"][1]["errors"] == [
+        f"group_id: Group {group.id} is not in phase {other_phase.id}"
+    ]
+    assert result["errors"][3]["errors"] == ["date: Field required"]
+    assert db.scalar(select(func.count(Match.id))) == 0
+
+
+def test_bulk_import_rejects_bad_bodies(client, db: Session, monkeypatch):
+    assert client.post("/api/matches/bulk", json={"not": "a list"}).status_code == 400
+    assert client.post(
+        "/api/matches/bulk", content="{broken", headers={"Content-Type": "application/json"}
+    ).status_code == 400
+
+    monkeypatch.setattr(settings, "BULK_MAX_ITEMS", 1)
+    assert client.post("/api/matches/bulk", json=[{}, {}]).status_code == 413
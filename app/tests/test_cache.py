@@ -0,0 +1,175 @@
+"""Test module for the read cache and change events."""
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core import events
+from app.core.cache import MemoryCache, cache
+from app.models.team import Team
+from app.tests.fixtures import (
+    add_team_to_group,
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+@pytest.fixture
+def recorded_events():
+    """Collect the change events emitted during a test."""
+    received = []
+    events.subscribe(received.append)
+    yield received
+    events.unsubscribe(received.append)
+
+
+class TestMemoryCache:
+    """Test the in-process cache backend."""
+
+    def test_lru_eviction(self):
+        backend = MemoryCache(max_entries=2)
+        backend.set("a", 1, tags=[], ttl=60)
+        backend.set("b", 2, tags=[], ttl=60)
+        assert backend.get("a") == 1  # "b" is now least recently used
+        backend.set("c", 3, tags=[], ttl=60)
+
+        assert backend.get("b") is None
+        assert backend.get("a") == 1
+        assert backend.get("c") == 3
+
+    def test_ttl_expiry(self):
+        backend = MemoryCache()
+        backend.set("a", 1, tags=[], ttl=0.01)
+        time.sleep(0.02)
+        assert backend.get("a") is None
+        assert len(backend) == 0
+
+    def test_invalidate_by_tag(self):
+        backend = MemoryCache()
+        backend.set("standings", [1], tags=["groups:1", "teams:2"], ttl=60)
+        backend.set("scorers", [2], tags=["tournaments:1"], ttl=60)
+
+        backend.invalidate(["teams:2"])
+        assert backend.get("standings") is None
+        assert backend.get("scorers") == [2]
+
+
+class TestChangeEvents:
+    """Test the events emitted for committed writes."""
+
+    def test_commit_emits_tags_for_row_and_parents(self, db: Session, recorded_events):
+        tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        group = create_test_group(db, phase.id)
+        recorded_events.clear()
+
+        match = create_test_match(db, tournament.id, phase.id, group.id)
+
+        change = next(e for e in recorded_events if e.entity == "matches")
+        assert change.action == "created"
+        assert change.id == match.id
+        assert {
+            f"matches:{match.id}",
+            f"tournaments:{tournament.id}",
+            f"groups:{group.id}",
+            f"teams:{match.home_team_id}",
+        } <= change.tags
+
+    def test_failing_subscriber_does_not_stop_the_others(self, db: Session, recorded_events):
+        def broken(change):
+            raise RuntimeError("subscriber down")
+
+        events.subscribe(broken)
+        received = []
+        events.subscribe(received.append)
+        try:
+            team = create_test_team(db)
+        finally:
+            events.unsubscribe(broken)
+            events.unsubscribe(received.append)
+
+        assert db.get(Team, team.id) is not None
+        assert [(e.entity, e.id) for e in received] == [("teams", team.id)]
+
+    def test_failing_subscriber_keeps_the_request_successful(self, client, db: Session):
+        def broken(change):
+            raise RuntimeError("subscriber down")
+
+        events.subscribe(broken)
+        try:
+            response = client.post(
+                "/api/teams/", json={"name": "Subscribed FC", "short_name": "SFC"}
+            )
+        finally:
+            events.unsubscribe(broken)
+
+        assert response.status_code == 200
+        assert db.get(Team, response.json()["id"]).name == "Subscribed FC"
+
+    def test_rollback_emits_nothing(self, db: Session, recorded_events):
+        db.add(Team(name="Never saved"))
+        db.flush()
+        db.rollback()
+        assert recorded_events == []
+
+
+class TestCachedEndpoints:
+    """Test caching and invalidation of the read endpoints."""
+
+    def test_standings_invalidated_by_result(self, client, db: Session):
+        tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        group = create_test_group(db, phase.id)
+        home, away = create_test_team(db), create_test_team(db)
+        add_team_to_group(db, home, group)
+        add_team_to_group(db, away, group)
+        match = create_test_match(db, tournament.id, phase.id, group.id, home.id, away.id)
+
+        response = client.get(f"/api/standings/group/{group.id}")
+        assert all(s["points"] == 0 for s in response.json())
+
+        # Writes that bypass the ORM are not seen until the entry is invalidated
+        db.execute(text("UPDATE teams SET name = 'Renamed' WHERE id = :id"), {"id": home.id})
+        db.commit()
+        response = client.get(f"/api/standings/group/{group.id}")
+        assert "Renamed" not in [s["team_name"] for s in response.json()]
+
+        response = client.put(
+            f"/api/matches/{match.id}/result",
+            json={"home_score": 2, "away_score": 0, "status": "completed"},
+        )
+        assert response.status_code == 200
+
+        response = client.get(f"/api/standings/group/{group.id}")
+        leader = response.json()[0]
+        assert (leader["team_id"], leader["points"], leader["team_name"]) == (home.id, 3, "Renamed")
+
+    def test_top_scorers_invalidated_by_goal(self, client, db: Session):
+        tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        team = create_test_team(db)
+        player = create_test_player(db, team.id)
+        match = create_test_match(db, tournament.id, phase.id, None, team.id)
+
+        response = client.get(f"/api/tournaments/{tournament.id}/top-scorers")
+        assert response.json() == []
+        assert len(cache) == 1
+
+        response = client.post("/api/goals/", json={
+            "match_id": match.id, "player_id": player.id, "team_id": team.id, "minute": 12,
+        })
+        assert response.status_code == 200
+        assert len(cache) == 0
+
+        response = client.get(f"/api/tournaments/{tournament.id}/top-scorers")
+        assert [s["player_id"] for s in response.json()] == [player.id]
+
+    def test_missing_resources_are_not_cached(self, client):
+        assert client.get("/api/standings/group/999").status_code == 404
+        assert client.get("/api/tournaments/999/top-scorers").status_code == 404
+        assert len(cache) == 0
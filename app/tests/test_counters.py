@@ -0,0 +1,110 @@
+"""Test module for the maintained home page counters."""
+import threading
+import time
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.counters import COUNTED, get_counts
+from app.db.database import Base
+from app.models.team import Team
+from app.tests.conftest import TestingSessionLocal
+from app.tests.fixtures import (
+    create_test_group,
+    create_test_phase,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+def actual_counts(db: Session) -> dict[str, int]:
+    return {
+        name: db.scalar(select(func.count()).select_from(Base.metadata.tables[name]))
+        for name in COUNTED
+    }
+
+
+def test_counts_are_primed_once_then_read(db: Session, query_budget):
+    tournament = create_test_tournament(db)
+    create_test_phase(db, tournament.id)
+
+    assert get_counts(db) == {
+        "tournaments": 1, "teams": 0, "phases": 1, "groups": 0, "matches": 0,
+    }
+    with query_budget(1):
+        get_counts(db)
+
+
+def test_writes_keep_counts_current(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    create_test_group(db, phase.id)
+    get_counts(db)
+
+    team_ids = [
+        client.post("/api/teams/", json={"name": f"T{i}", "short_name": f"T{i}"}).json()["id"]
+        for i in range(3)
+    ]
+    client.post("/api/matches/bulk", json=[
+        {
+            "tournament_id": tournament.id,
+            "phase_id": phase.id,
+            "home_team_id": home,
+            "away_team_id": away,
+            "date": "2024-08-18",
+        }
+        for home in team_ids
+        for away in team_ids
+        if home != away
+    ])
+    client.delete(f"/api/matches/{client.get('/api/matches/').json()[0]['id']}")
+    client.delete(f"/api/teams/{team_ids[0]}")
+    db.expire_all()
+    assert get_counts(db) == {
+        "tournaments": 1, "teams": 2, "phases": 1, "groups": 1, "matches": 5,
+    }
+
+    # Deleting the phase takes its groups and matches with it
+    client.delete(f"/api/phases/{phase.id}")
+    db.expire_all()
+    assert get_counts(db) == actual_counts(db) == {
+        "tournaments": 1, "teams": 2, "phases": 0, "groups": 0, "matches": 0,
+    }
+
+
+def test_priming_during_an_uncommitted_insert(db: Session):
+    create_test_team(db)
+    primed = {}
+
+    def read_counts():
+        with TestingSessionLocal() as reader:
+            primed.update(get_counts(reader))
+
+    with TestingSessionLocal() as writer:
+        # Flushed before the table is primed: there is no stored count to adjust yet
+        writer.add(Team(name="In flight", short_name="IF"))
+        writer.flush()
+        priming = threading.Thread(target=read_counts)
+        priming.start()
+        time.sleep(0.2)
+        writer.commit()
+    priming.join()
+
+    assert primed["teams"] == 2
+    db.expire_all()
+    assert get_counts(db)["teams"] == actual_counts(db)["teams"] == 2
+
+
+def test_rolled_back_writes_are_not_counted(db: Session):
+    create_test_team(db)
+    get_counts(db)
+    db.add(Team(name="Rolled back", short_name="RB"))
+    db.flush()
+    db.rollback()
+    assert get_counts(db)["teams"] == 1
+
+
+def test_home_page_shows_counts(client, db: Session):
+    create_test_tournament(db)
+    response = client.get("/")
+    assert response.status_code == 200
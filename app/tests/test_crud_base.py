@@ -1,8 +1,11 @@
+import asyncio
+
 from sqlalchemy.orm import Session
 
 from app.api.crud_base import CRUDBase
 from app.models.team import Team
 from app.schemas.team import TeamCreate, TeamUpdate
+from app.tests.utils.utils import TestingAsyncSessionLocal
 
 
 class TestCRUDBase:
@@ -346,4 +349,24 @@ class TestCRUDBase:
         from fastapi import HTTPException
         with pytest.raises(HTTPException) as exc_info:
             crud.get_all_by_fields(db, fields={"nonexistent": "value"})
-        assert exc_info.value.status_code == 400 
\ No newline at end of file
+        assert exc_info.value.status_code == 400 
+
+    def test_async_variants(self, db: Session):
+        """Test the AsyncSession variants of the CRUD operations."""
+        crud = CRUDBase[Team, TeamCreate, TeamUpdate](Team)
+
+        async def run():
+            async with TestingAsyncSessionLocal() as async_db:
+                team = await crud.create_async(
+                    async_db, obj_in=TeamCreate(name="Async Team", short_name="AT")
+                )
+                assert (await crud.get_async(async_db, team.id)).name == "Async Team"
+
+                team = await crud.update_async(async_db, db_obj=team, obj_in={"city": "Girona"})
+                assert team.city == "Girona"
+                assert len(await crud.get_multi_async(async_db)) == 1
+
+                await crud.delete_async(async_db, id=team.id)
+                assert await crud.get_async(async_db, team.id) is None
+
+        asyncio.run(run())
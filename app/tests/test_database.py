@@ -0,0 +1,47 @@
+"""Test module for database engine configuration."""
+import threading
+
+from sqlalchemy import text
+
+from app.db.database import create_db_engine
+
+
+def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """Test that new SQLite connections use WAL and the configured pragmas."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -64000
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_reader_not_blocked_by_writer(tmp_path):
+    """Test that a reader sees committed data while a write transaction is open."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'concurrency.db'}")
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE scores (value INTEGER)"))
+            conn.execute(text("INSERT INTO scores VALUES (1)"))
+
+        with engine.connect() as writer:
+            writer.begin()
+            writer.execute(text("UPDATE scores SET value = 2"))
+
+            result = []
+
+            def read():
+                with engine.connect() as reader:
+                    result.append(reader.execute(text("SELECT value FROM scores")).scalar())
+
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join(timeout=2)
+            writer.commit()
+
+        assert result == [1]
+    finally:
+        engine.dispose()
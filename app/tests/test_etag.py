@@ -0,0 +1,156 @@
+"""Test module for ETag and conditional GET handling."""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.etag import NO_CACHE, SHORT_LIVED, versions
+from app.models.change_version import ChangeVersion
+from app.models.goal import Goal
+from app.models.match import Match
+from app.tests.conftest import TestingSessionLocal
+from app.tests.fixtures import (
+    add_team_to_group,
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+def revalidate(client, url, etag):
+    """GET ``url`` with ``If-None-Match: etag``."""
+    return client.get(url, headers={"If-None-Match": etag})
+
+
+def test_match_not_modified_until_result_written(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    match = create_test_match(db, tournament.id, phase.id)
+    url = f"/api/matches/{match.id}"
+
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == NO_CACHE
+
+    response = revalidate(client, url, etag)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    client.put(f"{url}/result", json={"home_score": 1, "away_score": 0, "status": "completed"})
+    response = revalidate(client, url, etag)
+    assert response.status_code == 200
+    assert response.json()["home_score"] == 1
+    assert response.headers["ETag"] != etag
+
+
+def test_write_from_another_process_invalidates_etag(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    match = create_test_match(db, tournament.id, phase.id)
+    url = f"/api/matches/{match.id}"
+    etag = client.get(url).headers["ETag"]
+
+    # Its own session and connection, as a script or another worker would have
+    with TestingSessionLocal() as other:
+        other.get(Match, match.id).status = "in-progress"
+        other.commit()
+
+    response = revalidate(client, url, etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_goals_by_match_changes_on_new_goal(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    team = create_test_team(db)
+    player = create_test_player(db, team.id)
+    match = create_test_match(db, tournament.id, phase.id, None, team.id)
+    other = create_test_match(db, tournament.id, phase.id, None, team.id)
+    url = f"/api/goals/match/{match.id}"
+
+    etag = client.get(url).headers["ETag"]
+    client.post("/api/goals/", json={
+        "match_id": other.id, "player_id": player.id, "team_id": team.id, "minute": 3,
+    })
+    assert revalidate(client, url, etag).status_code == 304
+
+    client.post("/api/goals/", json={
+        "match_id": match.id, "player_id": player.id, "team_id": team.id, "minute": 5,
+    })
+    response = revalidate(client, url, etag)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_standings_etag(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    home, away = create_test_team(db), create_test_team(db)
+    add_team_to_group(db, home, group)
+    add_team_to_group(db, away, group)
+    match = create_test_match(db, tournament.id, phase.id, group.id, home.id, away.id)
+    url = f"/api/standings/group/{group.id}"
+
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == SHORT_LIVED
+    assert revalidate(client, url, f'W/{etag}, "other"').status_code == 304
+    assert revalidate(client, url, "*").status_code == 304
+    assert revalidate(client, url, '"other"').status_code == 200
+    # The query string is part of the representation
+    assert client.get(f"{url}?x=1").headers["ETag"] != etag
+
+    client.put(f"/api/matches/{match.id}/result", json={"home_score": 0, "away_score": 2})
+    assert revalidate(client, url, etag).status_code == 200
+
+
+def test_goals_in_different_matches_bump_disjoint_counters(db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    team = create_test_team(db)
+    player = create_test_player(db, team.id)
+    first = create_test_match(db, tournament.id, phase.id, None, team.id)
+    second = create_test_match(db, tournament.id, phase.id, None, team.id)
+
+    def bumped_by_goal(match):
+        before = dict(db.execute(select(ChangeVersion.key, ChangeVersion.version)).all())
+        db.add(Goal(match_id=match.id, player_id=player.id, team_id=team.id, minute=1))
+        db.commit()
+        after = dict(db.execute(select(ChangeVersion.key, ChangeVersion.version)).all())
+        return {key for key, version in after.items() if before.get(key) != version}
+
+    # No table-wide or tournament-wide counter that every goal would wait on
+    assert bumped_by_goal(first) == {f"matches:{first.id}"}
+    assert bumped_by_goal(second) == {f"matches:{second.id}"}
+
+
+def test_table_version_follows_writes_to_the_table(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    match = create_test_match(db, tournament.id, phase.id)
+    url = f"/api/matches/{match.id}"
+    etag = client.get(url).headers["ETag"]
+    teams_version = versions(db, ["teams"])["teams"]
+
+    # A team outside the match: "teams" covers the whole table
+    client.put(f"/api/teams/{create_test_team(db).id}", json={"city": "Vic"})
+    assert versions(db, ["teams"])["teams"] > teams_version
+    assert revalidate(client, url, etag).status_code == 200
+
+
+def test_versions_rejects_uncounted_keys(db: Session):
+    with pytest.raises(ValueError):
+        versions(db, ["tournaments:1"])
+    with pytest.raises(ValueError):
+        versions(db, ["matches"])
+
+
+def test_missing_resource_has_no_etag(client):
+    response = client.get("/api/matches/999")
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
@@ -0,0 +1,89 @@
+"""Test module for the streaming tournament export."""
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.goal import Goal
+from app.tests.fixtures import (
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+@pytest.fixture
+def tournament_data(db: Session):
+    """A tournament with three matches, a player per team and two goals."""
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    home, away = create_test_team(db), create_test_team(db)
+    players = [create_test_player(db, home.id), create_test_player(db, away.id)]
+    matches = [
+        create_test_match(db, tournament.id, phase.id, group.id, home.id, away.id)
+        for _ in range(3)
+    ]
+    db.add_all([
+        Goal(match_id=matches[0].id, player_id=players[0].id, team_id=home.id, minute=10),
+        Goal(match_id=matches[1].id, player_id=players[1].id, team_id=away.id, minute=20),
+    ])
+    db.commit()
+    # Nothing from another tournament may leak into the export
+    other = create_test_tournament(db)
+    create_test_match(db, other.id, phase.id, group.id, home.id, away.id)
+    # The export closes the request's session, which detaches these objects
+    return {
+        "tournament_id": tournament.id,
+        "match_ids": [m.id for m in matches],
+        "player_ids": [p.id for p in players],
+    }
+
+
+def test_ndjson_streams_every_entity(client, tournament_data, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    tournament_id = tournament_data["tournament_id"]
+
+    response = client.get(f"/api/tournaments/{tournament_id}/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert f"tournament-{tournament_id}.ndjson" in response.headers["content-disposition"]
+
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    matches = [r for r in rows if r["entity"] == "matches"]
+    assert [m["id"] for m in matches] == tournament_data["match_ids"]
+    assert {m["tournament_id"] for m in matches} == {tournament_id}
+    assert [g["minute"] for g in rows if g["entity"] == "goals"] == [10, 20]
+    players = sorted(r["id"] for r in rows if r["entity"] == "players")
+    assert players == sorted(tournament_data["player_ids"])
+    # Entities come out grouped, in a fixed order
+    order = [r["entity"] for r in rows]
+    assert order == sorted(order, key=["matches", "goals", "players"].index)
+
+
+def test_csv_exports_one_entity(client, tournament_data, monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 1)
+    tournament_id = tournament_data["tournament_id"]
+    url = f"/api/tournaments/{tournament_id}/export?format=csv"
+
+    assert client.get(url).status_code == 400
+
+    response = client.get(f"{url}&entity=goals")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["minute"] for row in rows] == ["10", "20"]
+    assert {row["match_id"] for row in rows} == {str(m) for m in tournament_data["match_ids"][:2]}
+
+
+def test_export_errors(client, tournament_data):
+    assert client.get("/api/tournaments/99999/export").status_code == 404
+    tournament_id = tournament_data["tournament_id"]
+    assert client.get(f"/api/tournaments/{tournament_id}/export?format=xml").status_code == 422
+    assert client.get(f"/api/tournaments/{tournament_id}/export?entity=x").status_code == 422
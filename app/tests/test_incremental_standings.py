@@ -0,0 +1,199 @@
+"""Test module for the incrementally maintained group standings."""
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.standings import calculate_group_standings, get_group_standings
+from app.crud.match import match as crud_match
+from app.models.group_standing import GroupStanding
+from app.models.match import Match
+from app.tests.conftest import TestingSessionLocal
+from app.tests.fixtures import (
+    create_test_group,
+    create_test_phase,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+@pytest.fixture
+def group_setup(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+
+    teams = []
+    for i in range(1, 5):
+        team = create_test_team(db)
+        team.name = f"Team {i}"
+        db.commit()
+        response = client.post(f"/api/groups/{group.id}/teams", json={"team_id": team.id})
+        assert response.status_code == 200
+        teams.append(team)
+
+    return tournament, phase, group, teams
+
+
+def create_match(client, tournament, phase, group, home_team, away_team):
+    response = client.post(
+        "/api/matches/",
+        json={
+            "tournament_id": tournament.id,
+            "phase_id": phase.id,
+            "group_id": group.id,
+            "home_team_id": home_team.id,
+            "away_team_id": away_team.id,
+            "date": str(date(2024, 5, 1)),
+        },
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def set_result(client, match_id, home_score, away_score):
+    response = client.put(
+        f"/api/matches/{match_id}/result",
+        json={"home_score": home_score, "away_score": away_score, "status": "completed"},
+    )
+    assert response.status_code == 200
+
+
+def persisted(db: Session, group_id: int, team_id: int) -> GroupStanding:
+    db.expire_all()
+    return db.query(GroupStanding).filter(
+        GroupStanding.group_id == group_id,
+        GroupStanding.team_id == team_id,
+    ).one()
+
+
+@pytest.mark.standings
+class TestIncrementalStandings:
+    """Test cases for the persisted standings table."""
+
+    def test_rows_primed_when_teams_join(self, db: Session, group_setup):
+        """Every team in the group gets an empty standings row."""
+        _, _, group, teams = group_setup
+        for team in teams:
+            row = persisted(db, group.id, team.id)
+            assert row.matches_played == 0
+            assert row.points == 0
+
+    def test_result_applies_delta(self, client, db: Session, group_setup):
+        """Recording a result updates both teams' rows."""
+        tournament, phase, group, teams = group_setup
+        match = create_match(client, tournament, phase, group, teams[0], teams[1])
+        set_result(client, match["id"], 2, 1)
+
+        winner = persisted(db, group.id, teams[0].id)
+        assert (winner.matches_played, winner.wins, winner.points) == (1, 1, 3)
+        assert (winner.goals_for, winner.goals_against, winner.goal_difference) == (2, 1, 1)
+
+        loser = persisted(db, group.id, teams[1].id)
+        assert (loser.matches_played, loser.losses, loser.points) == (1, 1, 0)
+        assert loser.goal_difference == -1
+
+    def test_result_edit_replaces_previous_result(self, client, db: Session, group_setup):
+        """Editing a result removes the old outcome before adding the new one."""
+        tournament, phase, group, teams = group_setup
+        match = create_match(client, tournament, phase, group, teams[0], teams[1])
+        set_result(client, match["id"], 2, 1)
+        set_result(client, match["id"], 0, 0)
+
+        for team in teams[:2]:
+            row = persisted(db, group.id, team.id)
+            assert (row.matches_played, row.wins, row.draws, row.losses) == (1, 0, 1, 0)
+            assert (row.goals_for, row.goals_against, row.points) == (0, 0, 1)
+
+    def test_status_rollback_removes_result(self, client, db: Session, group_setup):
+        """Moving a completed match back to scheduled takes it out of the table."""
+        tournament, phase, group, teams = group_setup
+        match = create_match(client, tournament, phase, group, teams[0], teams[1])
+        set_result(client, match["id"], 3, 0)
+
+        response = client.put(f"/api/matches/{match['id']}", json={"status": "scheduled"})
+        assert response.status_code == 200
+
+        for team in teams[:2]:
+            row = persisted(db, group.id, team.id)
+            assert row.matches_played == 0
+            assert row.points == 0
+            assert row.goals_for == 0
+
+    def test_delete_removes_result(self, client, db: Session, group_setup):
+        """Deleting a completed match takes it out of the table."""
+        tournament, phase, group, teams = group_setup
+        match = create_match(client, tournament, phase, group, teams[0], teams[1])
+        set_result(client, match["id"], 1, 2)
+
+        response = client.delete(f"/api/matches/{match['id']}")
+        assert response.status_code == 200
+
+        for team in teams[:2]:
+            assert persisted(db, group.id, team.id).matches_played == 0
+
+    def test_persisted_table_matches_full_calculation(self, client, db: Session, group_setup):
+        """The incremental table agrees with a full recalculation."""
+        tournament, phase, group, teams = group_setup
+        results = [(3, 1), (2, 2), (1, 0), (0, 2), (2, 1), (3, 3)]
+        pairs = [(h, a) for i, h in enumerate(teams) for a in teams[i + 1:]]
+        for (home, away), (home_score, away_score) in zip(pairs, results, strict=True):
+            match = create_match(client, tournament, phase, group, home, away)
+            set_result(client, match["id"], home_score, away_score)
+
+        db.expire_all()
+        assert get_group_standings(db, group.id) == calculate_group_standings(db, group.id)
+
+        response = client.get(f"/api/standings/group/{group.id}")
+        assert response.status_code == 200
+        assert [s["team_id"] for s in response.json()] == [
+            s.team_id for s in calculate_group_standings(db, group.id)
+        ]
+
+    def test_concurrent_results_both_count(self, client, db: Session, group_setup):
+        """Results committed by two sessions that read the same rows both apply."""
+        tournament, phase, group, teams = group_setup
+        first_id = create_match(client, tournament, phase, group, teams[0], teams[1])["id"]
+        second_id = create_match(client, tournament, phase, group, teams[0], teams[2])["id"]
+
+        with TestingSessionLocal() as first, TestingSessionLocal() as second:
+            # Both hold the group's rows as they were before either result
+            held = [
+                session.query(GroupStanding).filter(GroupStanding.group_id == group.id).all()
+                for session in (first, second)
+            ]
+            assert [row.points for rows in held for row in rows] == [0] * 2 * len(teams)
+            for session, match_id in ((first, first_id), (second, second_id)):
+                crud_match.update(
+                    session,
+                    db_obj=session.get(Match, match_id),
+                    obj_in={"home_score": 2, "away_score": 0, "status": "completed"},
+                )
+
+        row = persisted(db, group.id, teams[0].id)
+        assert (row.matches_played, row.wins, row.goals_for, row.points) == (2, 2, 4, 6)
+        assert get_group_standings(db, group.id) == calculate_group_standings(db, group.id)
+
+    def test_unprimed_group_falls_back_to_calculation(self, db: Session):
+        """Groups without persisted rows are calculated on the fly."""
+        tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        group = create_test_group(db, phase.id)
+        home, away = create_test_team(db), create_test_team(db)
+        group.teams.extend([home, away])
+        db.add(Match(
+            tournament_id=tournament.id,
+            phase_id=phase.id,
+            group_id=group.id,
+            home_team_id=home.id,
+            away_team_id=away.id,
+            home_score=1,
+            away_score=0,
+            status="completed",
+        ))
+        db.commit()
+
+        standings = get_group_standings(db, group.id)
+        assert standings[0].team_id == home.id
+        assert standings[0].points == 3
+        assert db.query(GroupStanding).count() == 0
@@ -0,0 +1,218 @@
+"""Test module for the live tournament feed."""
+import asyncio
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.api.live import match_snapshot
+from app.core.live import (
+    LiveBroker,
+    MatchCenter,
+    MatchChannel,
+    broker,
+    event_stream,
+    match_center,
+)
+from app.tests.fixtures import (
+    add_team_to_group,
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+from app.models.goal import Goal
+from app.models.match import Match
+
+
+async def drain(subscription, timeout=0.2):
+    """Collect queued events until none arrives within ``timeout``."""
+    received = []
+    while (event := await subscription.get(timeout)) is not None:
+        received.append(event)
+    return received
+
+
+def test_result_and_goal_are_pushed(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    home, away = create_test_team(db), create_test_team(db)
+    add_team_to_group(db, home, group)
+    add_team_to_group(db, away, group)
+    match = create_test_match(db, tournament.id, phase.id, group.id, home.id, away.id)
+    other = create_test_tournament(db)
+
+    async def scenario():
+        subscription, _ = broker.subscribe(tournament.id)
+        unrelated, _ = broker.subscribe(other.id)
+        try:
+            client.post("/api/goals/", json={
+                "match_id": match.id, "team_id": home.id, "minute": 30,
+            })
+            client.put(f"/api/matches/{match.id}/result", json={
+                "home_score": 1, "away_score": 0, "status": "completed",
+            })
+            return await drain(subscription), await drain(unrelated)
+        finally:
+            broker.unsubscribe(subscription)
+            broker.unsubscribe(unrelated)
+
+    received, unrelated = asyncio.run(scenario())
+
+    assert [e.type for e in received] == ["goal", "score", "status", "standings", "standings"]
+    goal, score, status = received[:3]
+    assert goal.data["minute"] == 30 and goal.data["action"] == "created"
+    assert score.data == {"match_id": match.id, "home_score": 1, "away_score": 0}
+    assert status.data == {"match_id": match.id, "status": "completed"}
+    leader = next(e.data for e in received[3:] if e.data["team_id"] == home.id)
+    assert (leader["group_id"], leader["points"]) == (group.id, 3)
+    assert unrelated == []
+    assert broker.subscriber_count(tournament.id) == 0
+
+
+def test_resume_from_last_event_id():
+    live = LiveBroker(history_size=3, max_pending=10)
+
+    async def scenario():
+        first = live.publish(1, "goal", {"n": 1})
+        live.publish(2, "goal", {"n": 2})
+        live.publish(1, "goal", {"n": 3})
+        _, missed = live.subscribe(1, first.id)
+        _, foreign = live.subscribe(1, "0000-1")
+        live.publish(1, "goal", {"n": 4})
+        # Still resumable while the event right after it is kept
+        _, kept = live.subscribe(1, first.id)
+        live.publish(1, "goal", {"n": 5})
+        _, expired = live.subscribe(1, first.id)
+        return missed, kept, foreign, expired
+
+    missed, kept, foreign, expired = asyncio.run(scenario())
+    assert [e.data["n"] for e in missed] == [3]
+    assert [e.data["n"] for e in kept] == [3, 4]
+    assert foreign is None
+    assert expired is None
+
+
+def test_slow_subscriber_is_disconnected():
+    live = LiveBroker(history_size=10, max_pending=2)
+
+    async def scenario():
+        subscription, _ = live.subscribe(1)
+        for n in range(3):
+            live.publish(1, "goal", {"n": n})
+        received = await drain(subscription)
+        return subscription, received
+
+    subscription, received = asyncio.run(scenario())
+    assert subscription.overflowed
+    assert [e.data["n"] for e in received] == [0, 1]
+
+
+def test_event_stream_frames():
+    async def scenario():
+        stream = event_stream(1, "0000-1", heartbeat=0.01)
+        frames = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+        return frames
+
+    retry, reset, heartbeat = asyncio.run(scenario())
+    assert retry.startswith("retry: ")
+    assert reset == "event: reset\ndata: {}\n\n"
+    assert heartbeat == ": keep-alive\n\n"
+    assert broker.subscriber_count(1) == 0
+
+
+def test_feed_for_missing_tournament(client):
+    assert client.get("/api/live/tournament/999").status_code == 404
+
+
+def test_match_channel_coalesces_updates():
+    async def scenario():
+        channel = MatchChannel()
+        center = MatchCenter()
+        center.follow(channel, [1])
+        center.publish(1, "score", {"match_id": 1, "home_score": 1, "away_score": 0})
+        center.publish(1, "score", {"match_id": 1, "home_score": 2, "away_score": 0})
+        center.publish(1, "goal", {"id": 5, "match_id": 1, "minute": 10, "action": "created"})
+        center.publish(1, "goal", {"id": 5, "match_id": 1, "minute": 12, "action": "updated"})
+        center.publish(2, "status", {"match_id": 2, "status": "completed"})
+        return channel, await channel.next_messages()
+
+    channel, messages = asyncio.run(scenario())
+    assert messages == [{
+        "type": "delta",
+        "match_id": 1,
+        "home_score": 2,
+        "away_score": 0,
+        "goals": [{"id": 5, "match_id": 1, "minute": 12, "action": "updated"}],
+    }]
+    assert channel.coalesced == 3
+
+
+def test_snapshot_orders_goals_without_minute(db: Session):
+    tournament = create_test_tournament(db)
+    match = create_test_match(db, tournament.id, create_test_phase(db, tournament.id).id)
+    player = create_test_player(db, match.home_team_id)
+    goals = [
+        Goal(match_id=match.id, player_id=player.id, team_id=match.home_team_id, minute=minute)
+        for minute in (40, None, 7)
+    ]
+    db.add_all(goals)
+    db.commit()
+
+    snapshot = match_snapshot(db.get(Match, match.id))
+    assert [goal["minute"] for goal in snapshot["goals"]] == [None, 7, 40]
+
+
+def test_match_channel_holds_deltas_until_snapshot():
+    async def scenario():
+        channel = MatchChannel()
+        channel.expect_snapshot(1)
+        MatchCenter().follow(channel, [1])
+        channel.push(1, "status", {"match_id": 1, "status": "in-progress"})
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(channel.next_messages(), 0.05)
+        channel.send({"type": "snapshot", "match_id": 1})
+        return await channel.next_messages()
+
+    assert [m["type"] for m in asyncio.run(scenario())] == ["snapshot", "delta"]
+
+
+def test_match_center_socket(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    home, away = create_test_team(db), create_test_team(db)
+    match = create_test_match(db, tournament.id, phase.id, None, home.id, away.id)
+
+    with client.websocket_connect("/api/live/matches") as websocket:
+        websocket.send_json({"action": "subscribe", "match_ids": [match.id, 999]})
+        snapshot = websocket.receive_json()
+        assert snapshot == {
+            "type": "snapshot",
+            "match_id": match.id,
+            "home_score": None,
+            "away_score": None,
+            "status": "scheduled",
+            "goals": [],
+        }
+        assert websocket.receive_json()["detail"] == "Match not found"
+
+        client.post("/api/goals/", json={"match_id": match.id, "team_id": home.id, "minute": 7})
+        delta = websocket.receive_json()
+        assert delta["type"] == "delta"
+        assert [g["minute"] for g in delta["goals"]] == [7]
+
+        client.put(f"/api/matches/{match.id}/result", json={
+            "home_score": 1, "away_score": 0, "status": "completed",
+        })
+        state = {}
+        while state.get("status") != "completed":
+            state.update(websocket.receive_json())
+        assert (state["home_score"], state["away_score"]) == (1, 0)
+
+        websocket.send_text("not json")
+        assert websocket.receive_json() == {"type": "error", "detail": "Invalid message"}
+
+    assert match_center.follower_count(match.id) == 0
@@ -0,0 +1,110 @@
+"""Test module for recording a whole match sheet of goals at once."""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.goal import Goal
+from app.models.player_stats import PlayerStats
+from app.tests.fixtures import (
+    add_team_to_group,
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+@pytest.fixture
+def fixture_match(db: Session):
+    """A group match between two teams with one player each."""
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    home, away = create_test_team(db), create_test_team(db)
+    add_team_to_group(db, home, group)
+    add_team_to_group(db, away, group)
+    match = create_test_match(db, tournament.id, phase.id, group.id, home.id, away.id)
+    return {
+        "tournament": tournament,
+        "group": group,
+        "match": match,
+        "home": home,
+        "away": away,
+        "home_player": create_test_player(db, home.id),
+        "away_player": create_test_player(db, away.id),
+    }
+
+
+def points(client, group_id):
+    standings = client.get(f"/api/standings/group/{group_id}").json()
+    return {s["team_id"]: s["points"] for s in standings}
+
+
+def goals_scored(db: Session, player_id: int) -> int:
+    db.expire_all()
+    return db.scalar(select(PlayerStats.goals_scored).where(PlayerStats.player_id == player_id))
+
+
+def test_sheet_sets_score_standings_and_stats(client, db: Session, fixture_match):
+    m = fixture_match
+    match, home, away = m["match"], m["home"], m["away"]
+    url = f"/api/matches/{match.id}/goals/bulk"
+    scorers_url = f"/api/tournaments/{m['tournament'].id}/top-scorers"
+    assert client.get(scorers_url).json() == []
+
+    response = client.post(url, json={"goals": [
+        {"player_id": m["home_player"].id, "team_id": home.id, "minute": 12},
+        {"player_id": m["away_player"].id, "team_id": home.id, "minute": 40, "type": "own_goal"},
+        {"team_id": away.id, "minute": 88},
+    ]})
+    assert response.status_code == 200
+    assert response.json()["created"] == 3
+
+    result = client.get(f"/api/matches/{match.id}").json()
+    assert (result["home_score"], result["away_score"], result["status"]) == (2, 1, "completed")
+    assert len(client.get(f"/api/goals/match/{match.id}").json()) == 3
+    assert points(client, m["group"].id) == {home.id: 3, away.id: 0}
+    assert goals_scored(db, m["home_player"].id) == 1
+    # Cached scorers were invalidated by the recorded goal events
+    assert len(client.get(scorers_url).json()) == 2
+
+    # A corrected sheet replaces the previous one
+    response = client.post(url, json={"goals": [
+        {"team_id": home.id, "minute": 12},
+        {"player_id": m["away_player"].id, "team_id": away.id, "minute": 88},
+    ]})
+    assert response.status_code == 200
+    assert points(client, m["group"].id) == {home.id: 1, away.id: 1}
+    remaining = db.scalars(select(Goal.id).where(Goal.match_id == match.id).order_by(Goal.id))
+    assert list(remaining) == response.json()["ids"]
+    assert goals_scored(db, m["home_player"].id) == 0
+    assert goals_scored(db, m["away_player"].id) == 1
+
+
+def test_invalid_sheet_writes_nothing(client, db: Session, fixture_match):
+    m = fixture_match
+    outsider = create_test_team(db)
+    response = client.post(f"/api/matches/{m['match'].id}/goals/bulk", json={"goals": [
+        {"player_id": m["home_player"].id, "team_id": m["home"].id, "minute": 5},
+        {"team_id": outsider.id, "minute": 10},
+        {"player_id": m["home_player"].id, "team_id": m["away"].id, "minute": 20},
+        {
+            "player_id": m["home_player"].id,
+            "team_id": m["away"].id,
+            "minute": 30,
+            "type": "own_goal",
+        },
+    ]})
+    assert response.status_code == 422
+    errors = response.json()["errors"]
+    assert [e["index"] for e in errors] == [1, 2]
+    assert errors[0]["errors"] == [f"team_id: Team {outsider.id} does not play this match"]
+
+    assert db.scalar(select(Goal.id)) is None
+    assert client.get(f"/api/matches/{m['match'].id}").json()["status"] == "scheduled"
+
+
+def test_sheet_for_missing_match(client):
+    assert client.post("/api/matches/999/goals/bulk", json={"goals": []}).status_code == 404
@@ -0,0 +1,56 @@
+"""Test module for previous/next match navigation."""
+from datetime import date, time
+
+from sqlalchemy.orm import Session
+
+from app.core.navigation import get_neighbours
+from app.tests.fixtures import (
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_tournament,
+)
+
+
+def scheduled(db: Session, tournament_id: int, phase_id: int, group_id: int, kickoffs):
+    """Matches created in the given order, kicking off at ``kickoffs``."""
+    matches = []
+    for day, hour in kickoffs:
+        match = create_test_match(db, tournament_id, phase_id, group_id)
+        match.date = date(2024, 8, day) if day else None
+        match.time = time(hour) if hour is not None else None
+        matches.append(match)
+    db.commit()
+    return matches
+
+
+def test_neighbours_follow_kickoff_order(db: Session, query_budget):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    late, unscheduled, early, same_day_later = scheduled(
+        db, tournament.id, phase.id, group.id, [(20, 18), (None, None), (18, 17), (18, 21)]
+    )
+    create_test_match(db, tournament.id, create_test_phase(db, tournament.id).id)
+
+    assert get_neighbours(db, early) == (None, same_day_later.id)
+    assert get_neighbours(db, same_day_later) == (early.id, late.id)
+    assert get_neighbours(db, late) == (same_day_later.id, unscheduled.id)
+    with query_budget(0):
+        assert get_neighbours(db, unscheduled) == (late.id, None)
+
+
+def test_rescheduling_reorders_navigation(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    first, second = scheduled(db, tournament.id, phase.id, None, [(18, 17), (19, 17)])
+    first_id, second_id = first.id, second.id
+
+    response = client.get(f"/matches/{first_id}")
+    assert response.context["next_match_id"] == second_id
+    assert f'href="/matches/{second_id}"' in response.text
+
+    client.put(f"/api/matches/{first_id}", json={"date": "2024-08-25"})
+    response = client.get(f"/matches/{first_id}")
+    assert response.context["prev_match_id"] == second_id
+    assert response.context["next_match_id"] is None
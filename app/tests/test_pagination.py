@@ -0,0 +1,145 @@
+"""Test module for keyset (cursor) pagination of list endpoints."""
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.crud.match import CRUDMatch
+from app.models.goal import Goal
+from app.models.match import Match
+from app.tests.fixtures import (
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+def add_match(db: Session, tournament_id, phase_id, home, away, day):
+    match = Match(
+        tournament_id=tournament_id,
+        phase_id=phase_id,
+        home_team_id=home.id,
+        away_team_id=away.id,
+        date=day,
+        status="scheduled",
+    )
+    db.add(match)
+    db.commit()
+    return match.id
+
+
+@pytest.fixture
+def tournament_matches(db: Session):
+    """Seven matches on out-of-order dates."""
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    home, away = create_test_team(db), create_test_team(db)
+    days = [date(2024, 5, d) for d in (3, 1, 2, 1, 3, 2, 1)]
+    ids = [add_match(db, tournament.id, phase.id, home, away, day) for day in days]
+    expected = [i for _, i in sorted(zip(days, ids, strict=True))]
+    return {
+        "tournament_id": tournament.id,
+        "phase_id": phase.id,
+        "teams": (home, away),
+        "expected": expected,
+    }
+
+
+def walk(client, url):
+    """IDs of every page of ``url``, following X-Next-Cursor."""
+    ids, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        ids += [item["id"] for item in response.json()]
+        pages += 1
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            return ids, pages
+
+
+def test_cursor_walks_matches_in_date_order(client, tournament_matches):
+    url = f"/api/matches/tournament/{tournament_matches['tournament_id']}"
+    ids, pages = walk(client, url)
+    assert ids == tournament_matches["expected"]
+    assert pages == 4
+
+    # Offset pages follow the same order and hand out a cursor too
+    response = client.get(url, params={"skip": 2, "limit": 2})
+    assert [m["id"] for m in response.json()] == tournament_matches["expected"][2:4]
+    assert "x-next-cursor" in response.headers
+
+
+def test_rows_written_between_pages_do_not_shift_the_next_page(
+    client, db: Session, tournament_matches
+):
+    url = f"/api/matches/phase/{tournament_matches['phase_id']}"
+    first = client.get(url, params={"limit": 3})
+    cursor = first.headers["x-next-cursor"]
+    # An early match is added and a seen one deleted before the next request
+    add_match(
+        db,
+        tournament_matches["tournament_id"],
+        tournament_matches["phase_id"],
+        *tournament_matches["teams"],
+        date(2024, 4, 1),
+    )
+    client.delete(f"/api/matches/{tournament_matches['expected'][0]}")
+
+    second = client.get(url, params={"limit": 3, "cursor": cursor})
+    assert [m["id"] for m in second.json()] == tournament_matches["expected"][3:6]
+
+
+def test_cursor_on_id_ordered_lists(client, db: Session):
+    teams = [create_test_team(db) for _ in range(5)]
+    ids, _ = walk(client, "/api/teams/")
+    assert ids == sorted(team.id for team in teams)
+
+
+def test_goals_of_a_match_page_in_minute_order(client, db: Session):
+    tournament = create_test_tournament(db)
+    match = create_test_match(db, tournament.id, create_test_phase(db, tournament.id).id)
+    player = create_test_player(db, match.home_team_id)
+    goals = [
+        Goal(match_id=match.id, player_id=player.id, team_id=match.home_team_id, minute=minute)
+        for minute in (80, 12, 45, 12, 3)
+    ]
+    db.add_all(goals)
+    db.commit()
+
+    ids, pages = walk(client, f"/api/goals/match/{match.id}")
+    assert ids == [goal.id for goal in sorted(goals, key=lambda g: (g.minute, g.id))]
+    assert pages == 3
+
+
+def test_invalid_cursor(client, tournament_matches):
+    url = f"/api/matches/tournament/{tournament_matches['tournament_id']}"
+    assert client.get(url, params={"cursor": "not-a-cursor"}).status_code == 400
+    # A cursor from an id-ordered list does not fit the (date, id) key
+    team_cursor = client.get("/api/teams/", params={"limit": 1}).headers["x-next-cursor"]
+    assert client.get(url, params={"cursor": team_cursor}).status_code == 400
+
+    cursor = client.get(url, params={"limit": 1}).headers["x-next-cursor"]
+    response = client.get(url, params={"cursor": cursor, "skip": 1})
+    assert response.status_code == 400
+
+
+def test_unscheduled_matches_come_first(db: Session, tournament_matches):
+    unscheduled = add_match(
+        db,
+        tournament_matches["tournament_id"],
+        tournament_matches["phase_id"],
+        *tournament_matches["teams"],
+        None,
+    )
+    crud = CRUDMatch(Match)
+    ids, cursor = [], None
+    while True:
+        page, cursor = crud.get_page(db, limit=3, cursor=cursor)
+        ids += [match.id for match in page]
+        if cursor is None:
+            break
+    assert ids == [unscheduled, *tournament_matches["expected"]]
@@ -0,0 +1,97 @@
+"""Test module for the player detail page and its maintained stats."""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.player_stats import PlayerStats
+from app.tests.fixtures import (
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+@pytest.fixture
+def scorer(db: Session) -> dict[str, int]:
+    """Ids of a player, their team, and two matches of one tournament."""
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    team = create_test_team(db)
+    player = create_test_player(db, team.id)
+    matches = [
+        create_test_match(db, tournament.id, phase.id, home_team_id=team.id) for _ in range(2)
+    ]
+    return {
+        "tournament_id": tournament.id,
+        "team_id": team.id,
+        "player_id": player.id,
+        "match_ids": [match.id for match in matches],
+    }
+
+
+def add_goal(client: TestClient, scorer: dict[str, int], match_id: int, minute: int) -> int:
+    response = client.post("/api/goals/", json={
+        "match_id": match_id,
+        "player_id": scorer["player_id"],
+        "team_id": scorer["team_id"],
+        "minute": minute,
+    })
+    assert response.status_code == 200
+    return response.json()["id"]
+
+
+def stored_totals(db: Session, scorer: dict[str, int]) -> tuple[int, int] | None:
+    db.expire_all()
+    stats = db.query(PlayerStats).filter_by(
+        player_id=scorer["player_id"], tournament_id=scorer["tournament_id"]
+    ).one_or_none()
+    return (stats.goals_scored, stats.matches_played) if stats else None
+
+
+def test_goal_writes_keep_player_stats_current(client: TestClient, db: Session, scorer):
+    first, second = scorer["match_ids"]
+    goal_id = add_goal(client, scorer, first, 10)
+    add_goal(client, scorer, first, 20)
+    assert stored_totals(db, scorer) == (2, 1)
+
+    other = create_test_player(db, scorer["team_id"])
+    client.put(f"/api/goals/{goal_id}", json={"player_id": other.id})
+    assert stored_totals(db, scorer) == (1, 1)
+
+    add_goal(client, scorer, second, 5)
+    assert stored_totals(db, scorer) == (2, 2)
+
+    client.delete(f"/api/matches/{first}")
+    assert stored_totals(db, scorer) == (1, 1)
+
+
+def test_player_page_reads_stats_and_pages_goals(
+    client: TestClient, db: Session, scorer, monkeypatch
+):
+    monkeypatch.setattr("app.ui.ui_router.PLAYER_GOALS_PAGE", 2)
+    first, second = scorer["match_ids"]
+    goal_ids = [
+        add_goal(client, scorer, first, 10),
+        add_goal(client, scorer, second, 5),
+        add_goal(client, scorer, first, 60),
+    ]
+
+    response = client.get(f"/players/{scorer['player_id']}")
+    assert response.status_code == 200
+    assert response.context["stats"] == {"matches_played": 2, "goals": 3, "goals_per_match": 1.5}
+    page = response.context["goals"]
+    # Both matches share a date, so goals follow the minute
+    assert [goal.id for goal in page] == [goal_ids[1], goal_ids[0]]
+    assert page[0].home_team_name and page[0].away_team_name
+    assert "More Goals" in response.text
+
+    response = client.get(
+        f"/players/{scorer['player_id']}?cursor={response.context['next_cursor']}"
+    )
+    assert [goal.id for goal in response.context["goals"]] == [goal_ids[2]]
+    assert response.context["next_cursor"] is None
+
+    response = client.get(f"/players/{scorer['player_id']}?cursor=bogus")
+    assert response.status_code == 400
@@ -1,6 +1,9 @@
 
+from app.models.goal import Goal
+from app.models.player_stats import PlayerStats
 from app.tests.fixtures import (
     create_test_group,
+    create_test_match,
     create_test_phase,
     create_test_player,
     create_test_team,
@@ -373,4 +376,136 @@ class TestPlayerStatsAPI:
         assert data[0]["player_id"] == player1.id
         assert data[0]["tournament_id"] == tournament1.id
         assert data[0]["matches_played"] == 5
-        assert data[0]["goals_scored"] == 3
\ No newline at end of file
+        assert data[0]["goals_scored"] == 3
+
+    def test_update_stats_from_goals_whole_tournament(self, client, db, refresh):
+        """Test the tournament-wide update across several matches."""
+        tournament = create_test_tournament(db)
+        other_tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        other_phase = create_test_phase(db, other_tournament.id)
+        team1 = create_test_team(db)
+        team2 = create_test_team(db)
+        scorer = create_test_player(db, team1.id)
+        other_scorer = create_test_player(db, team2.id)
+        refresh(db, tournament, other_tournament, team1, team2, scorer, other_scorer)
+
+        matches = [
+            create_test_match(db, tournament.id, phase.id, None, team1.id, team2.id)
+            for _ in range(3)
+        ]
+        other_match = create_test_match(
+            db, other_tournament.id, other_phase.id, None, team1.id, team2.id
+        )
+
+        # scorer: 2 goals in match 1, 1 in match 3; other_scorer: 1 in match 2
+        goals = [
+            (matches[0], scorer, team1),
+            (matches[0], scorer, team1),
+            (matches[2], scorer, team1),
+            (matches[1], other_scorer, team2),
+            # Goals in another tournament must not be counted
+            (other_match, scorer, team1),
+        ]
+        db.add_all([
+            Goal(match_id=match.id, player_id=player.id, team_id=team.id, minute=10 + i)
+            for i, (match, player, team) in enumerate(goals)
+        ])
+        db.commit()
+
+        for _ in range(2):
+            response = client.post(
+                f"/api/player-stats/update-from-goals/?tournament_id={tournament.id}"
+            )
+            assert response.status_code == 200
+            data = response.json()
+
+            assert [stats["player_id"] for stats in data] == [scorer.id, other_scorer.id]
+            assert data[0]["goals_scored"] == 3
+            assert data[0]["matches_played"] == 2
+            assert data[0]["minutes_played"] == 180
+            assert data[0]["player"]["id"] == scorer.id
+            assert data[0]["tournament"]["id"] == tournament.id
+            assert data[1]["goals_scored"] == 1
+
+        # Running twice updates the rows in place
+        assert db.query(PlayerStats).filter(
+            PlayerStats.tournament_id == tournament.id
+        ).count() == 2
+
+    def test_update_stats_from_goals_player_without_goals(self, client, db, refresh):
+        """Test that a player who has not scored gets zeroed stats."""
+        tournament = create_test_tournament(db)
+        team = create_test_team(db)
+        player = create_test_player(db, team.id)
+        refresh(db, tournament, player)
+
+        response = client.post(
+            f"/api/player-stats/update-from-goals/?tournament_id={tournament.id}&player_id={player.id}"
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["player_id"] == player.id
+        assert data[0]["goals_scored"] == 0
+        assert data[0]["matches_played"] == 0
+
+    def test_top_scorers_is_read_only(self, client, db, refresh):
+        """Test that listing top scorers does not create player stats rows."""
+        tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        team1 = create_test_team(db)
+        team2 = create_test_team(db)
+        scorer = create_test_player(db, team1.id)
+        other_scorer = create_test_player(db, team2.id)
+        refresh(db, tournament, team1, team2, scorer, other_scorer)
+
+        match1 = create_test_match(db, tournament.id, phase.id, None, team1.id, team2.id)
+        match2 = create_test_match(db, tournament.id, phase.id, None, team1.id, team2.id)
+        db.add_all([
+            Goal(match_id=match1.id, player_id=scorer.id, team_id=team1.id, minute=10),
+            Goal(match_id=match2.id, player_id=scorer.id, team_id=team1.id, minute=20),
+            Goal(match_id=match2.id, player_id=other_scorer.id, team_id=team2.id, minute=30),
+        ])
+        db.commit()
+
+        response = client.get(f"/api/tournaments/{tournament.id}/top-scorers")
+        assert response.status_code == 200
+        data = response.json()
+
+        assert [s["player_id"] for s in data] == [scorer.id, other_scorer.id]
+        assert data[0]["goals_scored"] == 2
+        assert data[0]["matches_played"] == 2
+        assert data[0]["goals_per_match"] == 1.0
+        assert data[0]["player"]["id"] == scorer.id
+        assert data[0]["team"]["id"] == team1.id
+        assert data[1]["goals_scored"] == 1
+
+        assert db.query(PlayerStats).count() == 0
+
+    def test_top_scorers_include_stats_row(self, client, db, refresh):
+        """Test that top scorers carry the stats row's id, tournament and matches played."""
+        tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        team = create_test_team(db)
+        scorer = create_test_player(db, team.id)
+        refresh(db, tournament, team, scorer)
+
+        match = create_test_match(db, tournament.id, phase.id, None, team.id)
+        db.add(Goal(match_id=match.id, player_id=scorer.id, team_id=team.id, minute=10))
+        stats = PlayerStats(
+            player_id=scorer.id, tournament_id=tournament.id,
+            matches_played=4, goals_scored=1, minutes_played=360,
+        )
+        db.add(stats)
+        db.commit()
+
+        response = client.get(f"/api/tournaments/{tournament.id}/top-scorers")
+        assert response.status_code == 200
+        [data] = response.json()
+
+        assert data["id"] == stats.id
+        assert data["tournament"]["id"] == tournament.id
+        assert data["matches_played"] == 4
+        assert data["goals_per_match"] == 0.25
+        assert data["minutes_per_goal"] == 360.0
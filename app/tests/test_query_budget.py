@@ -0,0 +1,75 @@
+"""Test module guarding the number of queries list endpoints run.
+
+The budgets don't depend on the number of rows listed: an endpoint going
+over its budget is lazy-loading a relationship once per row.
+"""
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.goal import Goal
+from app.tests.fixtures import (
+    add_team_to_group,
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_player_stats,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+@pytest.fixture
+def league(db: Session):
+    """Two groups of four teams, every pairing played once, two goals per player."""
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    teams = []
+    for _ in range(2):
+        group = create_test_group(db, phase.id)
+        group_teams = [create_test_team(db) for _ in range(4)]
+        for team in group_teams:
+            add_team_to_group(db, team, group)
+        for i, home in enumerate(group_teams):
+            for away in group_teams[i + 1:]:
+                match = create_test_match(db, tournament.id, phase.id, group.id, home.id, away.id)
+                players = [create_test_player(db, home.id) for _ in range(2)]
+                db.add_all(
+                    Goal(match_id=match.id, player_id=p.id, team_id=home.id, minute=m)
+                    for p in players
+                    for m in (10, 80)
+                )
+                for player in players:
+                    create_test_player_stats(db, player.id, tournament.id)
+        teams += group_teams
+    db.commit()
+    return {
+        "tournament_id": tournament.id,
+        "phase_id": phase.id,
+        "team_id": teams[0].id,
+        "player_id": players[0].id,
+    }
+
+
+# (url, queries allowed)
+BUDGETS = [
+    ("/api/matches/", 1),
+    ("/api/matches/tournament/{tournament_id}", 1),
+    ("/api/matches/phase/{phase_id}", 1),
+    ("/api/goals/", 1),
+    ("/api/goals/team/{team_id}", 1),
+    ("/api/goals/player/{player_id}", 1),
+    ("/api/groups/", 2),
+    ("/api/teams/", 1),
+    ("/api/teams/{team_id}/players/", 2),
+    ("/api/players/", 1),
+    ("/api/player-stats/?tournament_id={tournament_id}", 1),
+]
+
+
+@pytest.mark.parametrize("url,max_queries", BUDGETS)
+def test_list_endpoint_stays_within_budget(client, league, query_budget, url, max_queries):
+    with query_budget(max_queries):
+        response = client.get(url.format(**league))
+    assert response.status_code == 200
+    assert len(response.json()) > 1
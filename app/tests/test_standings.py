@@ -2,7 +2,12 @@
 import pytest
 from sqlalchemy.orm import Session
 
-from app.core.standings import calculate_group_standings
+from app.core.config import settings
+from app.core.standings import (
+    calculate_group_standings,
+    calculate_group_standings_sql,
+    compute_group_standings,
+)
 from app.models.group import Group
 from app.models.match import Match
 from app.models.phase import Phase
@@ -215,4 +220,100 @@ class TestStandings:
         for team_id in [teams[2].id, teams[3].id]:
             standing = next(s for s in standings if s.team_id == team_id)
             assert standing.matches_played == 0
-            assert standing.points == 0 
\ No newline at end of file
+            assert standing.points == 0
+
+
+@pytest.mark.standings
+class TestSQLStandings:
+    """Parity tests between the SQL aggregate and the Python calculation."""
+
+    def add_match(self, db: Session, group, home, away, home_score=None, away_score=None,
+                  status="completed"):
+        match = Match(
+            tournament_id=group.phase.tournament_id,
+            phase_id=group.phase_id,
+            group_id=group.id,
+            home_team_id=home.id,
+            away_team_id=away.id,
+            home_score=home_score,
+            away_score=away_score,
+            status=status,
+        )
+        db.add(match)
+        db.commit()
+        return match
+
+    def test_empty_group(self, db: Session, group):
+        """The SQL aggregate returns nothing for a group without teams or an unknown group."""
+        assert calculate_group_standings_sql(db, group.id) == []
+        assert calculate_group_standings_sql(db, group.id + 1000) == []
+
+    def test_no_matches(self, db: Session, group, teams):
+        """Teams without matches appear with zeroed counters."""
+        assert calculate_group_standings_sql(db, group.id) == calculate_group_standings(db, group.id)
+
+    def test_parity_with_python_calculation(self, db: Session, group, teams):
+        """The SQL aggregate matches the Python calculation row for row."""
+        results = [
+            (0, 1, 3, 1),
+            (0, 2, 2, 2),
+            (0, 3, 1, 0),
+            (1, 2, 0, 2),
+            (1, 3, 2, 1),
+            (2, 3, 3, 3),
+            (1, 0, 4, 0),
+        ]
+        for home, away, home_score, away_score in results:
+            self.add_match(db, group, teams[home], teams[away], home_score, away_score)
+
+        # Neither scheduled matches nor matches against outside teams count
+        self.add_match(db, group, teams[2], teams[3], status="scheduled")
+        outsider = Team(name="Outsider", short_name="OUT")
+        db.add(outsider)
+        db.commit()
+        self.add_match(db, group, teams[0], outsider, 5, 0)
+
+        expected = calculate_group_standings(db, group.id)
+        actual = calculate_group_standings_sql(db, group.id)
+
+        assert actual == expected
+        assert all(isinstance(s.points, int) for s in actual)
+
+    def test_parity_on_full_three_way_tie(self, db: Session, group):
+        """Teams level on every criterion are ordered by team ID in both implementations."""
+        teams = []
+        for name, short_name in [("Team X", "TX"), ("Team Y", "TY"), ("Team Z", "TZ")]:
+            team = Team(name=name, short_name=short_name)
+            db.add(team)
+            db.commit()
+            teams.append(team)
+        # Joined in reverse, so the group's insertion order differs from ID order
+        group.teams.extend(reversed(teams))
+        db.commit()
+        # Each team wins one match 1-0 and loses one 0-1
+        for home, away in [(0, 1), (1, 2), (2, 0)]:
+            self.add_match(db, group, teams[home], teams[away], 1, 0)
+
+        expected = calculate_group_standings(db, group.id)
+        actual = calculate_group_standings_sql(db, group.id)
+
+        assert actual == expected
+        assert [s.team_id for s in actual] == sorted(team.id for team in teams)
+        assert {(s.points, s.goal_difference, s.goals_for) for s in actual} == {(3, 0, 1)}
+
+    def test_backend_switch(self, db: Session, group, teams, monkeypatch):
+        """The STANDINGS_BACKEND setting selects the implementation."""
+        self.add_match(db, group, teams[0], teams[1], 1, 0)
+
+        calls = []
+        monkeypatch.setattr(settings, "STANDINGS_BACKEND", "sql")
+        monkeypatch.setattr(
+            "app.core.standings.calculate_group_standings_sql",
+            lambda db, group_id: calls.append(group_id) or [],
+        )
+        compute_group_standings(db, group.id)
+        assert calls == [group.id]
+
+        monkeypatch.setattr(settings, "STANDINGS_BACKEND", "python")
+        assert compute_group_standings(db, group.id)[0].team_id == teams[0].id
+        assert calls == [group.id]
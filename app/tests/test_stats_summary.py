@@ -0,0 +1,81 @@
+"""Test module for the stats overview summary."""
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.goal import Goal
+from app.models.team_stats import TeamStats
+from app.tests.fixtures import (
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_team,
+    create_test_tournament,
+)
+
+
+def played_match(db: Session, home_score: int, away_score: int):
+    """A completed match in a new tournament, with its goals and a clean sheet row."""
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    home, away = create_test_team(db), create_test_team(db)
+    match = create_test_match(db, tournament.id, phase.id, None, home.id, away.id)
+    player = create_test_player(db, home.id)
+    match.home_score, match.away_score, match.status = home_score, away_score, "completed"
+    db.add_all(
+        Goal(match_id=match.id, player_id=player.id, team_id=home.id, minute=10 + i)
+        for i in range(home_score)
+    )
+    db.add(TeamStats(team_id=home.id, tournament_id=tournament.id, clean_sheets=1))
+    db.commit()
+    return tournament.id, match.id, home.id
+
+
+@pytest.fixture
+def two_tournaments(db: Session):
+    first, _, _ = played_match(db, 3, 0)
+    second, match_id, team_id = played_match(db, 1, 0)
+    return {"first": first, "second": second, "match_id": match_id, "team_id": team_id}
+
+
+def test_summary_per_scope(client, two_tournaments):
+    overall = client.get("/api/stats/summary").json()
+    assert overall == {
+        "tournament_id": None,
+        "total_matches": 2,
+        "total_goals": 4,
+        "goals_per_match": 2.0,
+        "total_clean_sheets": 2,
+    }
+    first = client.get(f"/api/stats/summary?tournament_id={two_tournaments['first']}").json()
+    assert (first["total_matches"], first["total_goals"], first["goals_per_match"]) == (1, 3, 3.0)
+
+
+def test_summary_is_one_query_then_cached(client, two_tournaments, query_budget):
+    url = f"/api/stats/summary?tournament_id={two_tournaments['first']}"
+    with query_budget(1):
+        client.get(url)
+    with query_budget(0):
+        client.get(url)
+
+
+def test_result_write_refreshes_its_tournament_and_overall(client, two_tournaments):
+    first_url = f"/api/stats/summary?tournament_id={two_tournaments['first']}"
+    second_url = f"/api/stats/summary?tournament_id={two_tournaments['second']}"
+    for url in ("/api/stats/summary", first_url, second_url):
+        client.get(url)
+
+    client.post("/api/goals/", json={
+        "match_id": two_tournaments["match_id"],
+        "team_id": two_tournaments["team_id"],
+        "minute": 90,
+    })
+
+    assert client.get(second_url).json()["total_goals"] == 2
+    assert client.get("/api/stats/summary").json()["total_goals"] == 5
+    assert client.get(first_url).json()["total_goals"] == 3
+
+
+def test_overview_page_shows_summary(client, two_tournaments):
+    response = client.get(f"/stats?tournament_id={two_tournaments['first']}")
+    assert response.status_code == 200
+    assert "3.00" in response.text
@@ -301,4 +301,58 @@ class TestTeamStats:
         assert updated_stats["draws"] == 0
         assert updated_stats["losses"] == 0
         assert updated_stats["goals_for"] == 3
-        assert updated_stats["goals_against"] == 1 
\ No newline at end of file
+        assert updated_stats["goals_against"] == 1
+    
+    def test_recompute_tournament(self, client, db):
+        """Test recalculating every team of a tournament in one call."""
+        tournament = create_test_tournament(db)
+        phase = create_test_phase(db, tournament.id)
+        teams = [create_test_team(db) for _ in range(4)]
+        
+        results = [
+            (0, 1, 2, 0),
+            (2, 3, 1, 1),
+            (0, 2, 0, 3),
+            (1, 3, 4, 2),
+        ]
+        for home, away, home_score, away_score in results:
+            match = create_test_match(db, tournament.id, phase.id, None, teams[home].id, teams[away].id)
+            response = client.put(
+                f"/api/matches/{match.id}/result",
+                json={"home_score": home_score, "away_score": away_score, "status": "completed"},
+            )
+            assert response.status_code == 200
+        
+        # A scheduled match still gives its teams a (zeroed) stats row
+        newcomer = create_test_team(db)
+        create_test_match(db, tournament.id, phase.id, None, newcomer.id, teams[0].id)
+        
+        response = client.post(f"/api/team-stats/recompute/{tournament.id}")
+        assert response.status_code == 200
+        recomputed = response.json()
+        assert len(recomputed) == 5
+        
+        # Ranked by points, then goal difference
+        assert recomputed[0]["team_id"] == teams[2].id
+        assert [s["points"] for s in recomputed] == sorted(
+            (s["points"] for s in recomputed), reverse=True
+        )
+        newcomer_stats = next(s for s in recomputed if s["team_id"] == newcomer.id)
+        assert newcomer_stats["matches_played"] == 0
+        
+        # Same numbers as the per-team recalculation
+        for stats in recomputed:
+            response = client.post(f"/api/team-stats/update/{stats['team_id']}/{tournament.id}")
+            assert response.status_code == 200
+            assert response.json() == stats
+        
+        # Recomputing again updates the existing rows instead of duplicating them
+        response = client.post(f"/api/team-stats/recompute/{tournament.id}")
+        assert response.status_code == 200
+        response = client.get(f"/api/team-stats/tournament/{tournament.id}")
+        assert len(response.json()) == 5
+    
+    def test_recompute_unknown_tournament(self, client, db):
+        """Test recomputing a tournament that does not exist."""
+        response = client.post("/api/team-stats/recompute/9999")
+        assert response.status_code == 404
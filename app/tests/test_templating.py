@@ -0,0 +1,103 @@
+"""Test module for the UI template environment and its fragment cache."""
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.team import Team
+from app.tests.fixtures import (
+    add_team_to_group,
+    create_test_group,
+    create_test_match,
+    create_test_phase,
+    create_test_team,
+    create_test_tournament,
+)
+from app.ui.templating import create_environment, scope_tag
+
+
+def test_scope_tag_picks_narrowest_scope():
+    assert scope_tag("matches", groups=None, phases=4, tournaments=1) == "phases:4"
+    assert scope_tag("matches", groups=None, tournaments=None) == "matches"
+
+
+def test_fragment_is_reused_until_a_write(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    match = create_test_match(db, tournament.id, phase.id)
+    home_team_id, home_team_name = match.home_team_id, match.home_team.name
+    url = f"/matches?tournament_id={tournament.id}"
+    assert home_team_name in client.get(url).text
+
+    # Raw SQL emits no change event, so the cached fixture list is served
+    db.execute(update(Team).where(Team.id == home_team_id).values(name="Renamed FC"))
+    db.commit()
+    response = client.get(url)
+    assert response.context["matches"][0].home_team.name == "Renamed FC"
+    assert "Renamed FC" not in response.text
+
+    # A write through the ORM drops it
+    db.get(Team, home_team_id).city = "Girona"
+    db.commit()
+    assert "Renamed FC" in client.get(url).text
+
+
+def test_fragments_are_keyed_by_filter(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    first = create_test_match(db, tournament.id, phase.id)
+    other = create_test_tournament(db)
+    second = create_test_match(db, other.id, create_test_phase(db, other.id).id)
+    first_link, second_link = f'href="/matches/{first.id}"', f'href="/matches/{second.id}"'
+
+    response = client.get(f"/matches?tournament_id={tournament.id}")
+    assert first_link in response.text and second_link not in response.text
+    response = client.get(f"/matches?tournament_id={other.id}")
+    assert second_link in response.text and first_link not in response.text
+
+
+def test_standings_fragment_is_shared_by_the_group(client, db: Session):
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    teams = [create_test_team(db) for _ in range(3)]
+    for team in teams:
+        add_team_to_group(db, team, group)
+    first = create_test_match(db, tournament.id, phase.id, group.id, teams[0].id, teams[1].id)
+    second = create_test_match(db, tournament.id, phase.id, group.id, teams[1].id, teams[2].id)
+    scheduled = create_test_match(db, tournament.id, phase.id, group.id, teams[0].id, teams[2].id)
+    first_id, second_id, scheduled_id = first.id, second.id, scheduled.id
+
+    def set_result(match_id, home_score, away_score):
+        client.put(
+            f"/api/matches/{match_id}/result",
+            json={"home_score": home_score, "away_score": away_score, "status": "completed"},
+        )
+
+    set_result(first_id, 1, 0)
+    set_result(second_id, 1, 0)
+
+    # Matches not played yet show no standings, and cache none for the group
+    response = client.get(f"/matches/{scheduled_id}")
+    assert response.context["standings"] == []
+    assert response.context["standings_html"] is None
+    assert "data-team-id=" not in response.text
+
+    response = client.get(f"/matches/{first_id}")
+    assert len(response.context["standings"]) == 3
+
+    # The second match of the group reuses the table without loading the standings
+    response = client.get(f"/matches/{second_id}")
+    assert response.context["standings"] == []
+    assert response.context["standings_html"].count("data-team-id=") == 3
+    assert f'data-highlight-teams="{teams[1].id} {teams[2].id}"' in response.text
+
+    set_result(first_id, 0, 3)
+    response = client.get(f"/matches/{second_id}")
+    assert response.context["standings_html"] is None
+    assert response.context["standings"][0].team_id == teams[1].id
+
+
+def test_compiled_templates_are_kept_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TEMPLATE_CACHE_DIR", str(tmp_path / "jinja"))
+    create_environment().get_template("base.html")
+    assert list((tmp_path / "jinja").iterdir())
@@ -0,0 +1,60 @@
+"""Test module for per-request query counts and timings."""
+import re
+
+import pytest
+from sqlalchemy.orm import Session
+from structlog.testing import CapturingLogger
+
+from app.core import timing
+from app.core.config import settings
+from app.tests.fixtures import create_test_team
+
+
+def server_timing(response) -> dict[str, str]:
+    """Metric name to its parameters, from the Server-Timing header."""
+    return {
+        name.strip(): params
+        for name, _, params in (
+            metric.partition(";") for metric in response.headers["server-timing"].split(",")
+        )
+    }
+
+
+def test_server_timing_counts_queries_and_serialization(client, db: Session):
+    for _ in range(3):
+        create_test_team(db)
+
+    metrics = server_timing(client.get("/api/teams/"))
+    assert re.fullmatch(r'dur=[\d.]+;desc="1 queries"', metrics["db"])
+    assert re.fullmatch(r"dur=[\d.]+", metrics["serialize"])
+    assert "total" in metrics
+
+    # Handlers on the async engine are counted too
+    metrics = server_timing(client.get("/matches"))
+    assert not metrics["db"].endswith('desc="0 queries"')
+
+
+def test_request_log_line_has_db_fields(client, db: Session, monkeypatch):
+    team = create_test_team(db)
+    log = CapturingLogger()
+    monkeypatch.setattr("app.main.logger", log)
+
+    client.get(f"/api/teams/{team.id}")
+    completed = next(c.kwargs for c in log.calls if c.args == ("request_completed",))
+    assert completed["db_queries"] == 1
+    assert completed["db_slowest_statement"].startswith("SELECT")
+    assert {"db_time_ms", "db_slowest_ms", "serialize_ms", "duration_ms"} <= completed.keys()
+
+
+@pytest.mark.parametrize("threshold,logged", [(0, False), (0.000001, True)])
+def test_slow_query_log_is_opt_in(client, db: Session, monkeypatch, threshold, logged):
+    log = CapturingLogger()
+    monkeypatch.setattr(timing, "logger", log)
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", threshold)
+
+    client.get("/api/teams/")
+    slow = [c.kwargs for c in log.calls if c.args == ("slow_query",)]
+    assert bool(slow) is logged
+    if logged:
+        assert slow[0]["path"] == "/api/teams/"
+        assert slow[0]["statement"].startswith("SELECT")
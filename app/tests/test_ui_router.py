@@ -1,13 +1,14 @@
 from fastapi.testclient import TestClient
 
-from app.db.database import get_db
+from app.db.database import get_async_db, get_db
 from app.main import app
-from app.tests.utils.utils import get_test_db
+from app.tests.utils.utils import get_test_async_db, get_test_db
 
 client = TestClient(app)
 
 # Override the get_db dependency
 app.dependency_overrides[get_db] = get_test_db
+app.dependency_overrides[get_async_db] = get_test_async_db
 
 def test_home_page():
     """Test that the home page returns a 200 status code."""
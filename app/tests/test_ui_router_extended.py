@@ -3,6 +3,8 @@ from datetime import date
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.models.group_standing import GroupStanding
+
 from app.tests.fixtures import (
     add_team_to_group,
     create_test_group,
@@ -111,6 +113,55 @@ def test_match_result_workflow(client: TestClient, db: Session):
     assert "success" in response.context  # Add check for success message
 
 
+def test_match_pages_render_loaded_relationships(client: TestClient, db: Session):
+    """Test that pages reading related objects work on the async session."""
+    tournament = create_test_tournament(db)
+    phase = create_test_phase(db, tournament.id)
+    group = create_test_group(db, phase.id)
+    team1 = create_test_team(db)
+    team2 = create_test_team(db)
+    add_team_to_group(db, team1, group)
+    add_team_to_group(db, team2, group)
+    player = create_test_player(db, team1.id)
+    match = create_test_match(db, tournament.id, phase.id, group.id, team1.id, team2.id)
+    # Recorded through the API, which keeps the scorer's stats current
+    response = client.post(
+        "/api/goals/",
+        json={"match_id": match.id, "player_id": player.id, "team_id": team1.id, "minute": 30},
+    )
+    assert response.status_code == 200
+
+    response = client.post(
+        f"/matches/{match.id}/result",
+        data={"home_score": 1, "away_score": 0, "status": "completed"},
+    )
+    assert response.status_code == 200
+
+    # The result went through the standings maintenance
+    standing = db.query(GroupStanding).filter(GroupStanding.team_id == team1.id).one()
+    assert standing.points == 3
+
+    response = client.get(f"/matches/{match.id}")
+    assert response.status_code == 200
+    assert [goal.player.name for goal in response.context["goals"]] == [player.name]
+    # Standings table cached when the result page rendered it, leader first
+    assert response.context["standings_html"].index(f'data-team-id="{team1.id}"') < (
+        response.context["standings_html"].index(f'data-team-id="{team2.id}"')
+    )
+
+    response = client.get(f"/players/{player.id}")
+    assert response.status_code == 200
+    assert response.context["stats"]["goals"] == 1
+
+    response = client.get(f"/goals?tournament_id={tournament.id}")
+    assert response.status_code == 200
+    assert len(response.context["goals"]) == 1
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.context["stats"]["matches"] == 1
+
+
 def test_tournament_workflow(client: TestClient, db: Session):
     """Test tournament creation and viewing workflow."""
     # Test tournament creation form
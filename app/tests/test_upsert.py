@@ -0,0 +1,69 @@
+"""Test module for stats writers racing on the same stats row."""
+import importlib
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.crud.player_stats import player_stats
+from app.crud.team_stats import team_stats
+from app.db.upsert import upsert
+from app.models.goal import Goal
+from app.models.player_stats import PlayerStats
+from app.models.team_stats import TeamStats
+from app.tests.conftest import TestingSessionLocal
+from app.tests.fixtures import (
+    create_test_match,
+    create_test_phase,
+    create_test_player,
+    create_test_tournament,
+)
+
+
+def write_first(monkeypatch, module_name, model, **key):
+    """Have another session create the stats row between the recount's reads and its write."""
+    # By module: app.crud re-exports the CRUD objects under the module names
+    module = importlib.import_module(module_name)
+
+    def racing_upsert(db, table, rows, **kwargs):
+        with TestingSessionLocal() as other:
+            other.add(model(**key))
+            other.commit()
+        return upsert(db, table, rows, **kwargs)
+
+    monkeypatch.setattr(module, "upsert", racing_upsert)
+
+
+def test_recompute_updates_row_created_concurrently(db: Session, monkeypatch):
+    tournament = create_test_tournament(db)
+    match = create_test_match(db, tournament.id, create_test_phase(db, tournament.id).id)
+    match.home_score, match.away_score, match.status = 2, 0, "completed"
+    db.commit()
+    write_first(
+        monkeypatch, "app.crud.team_stats", TeamStats,
+        team_id=match.home_team_id, tournament_id=tournament.id, points=0,
+    )
+
+    ranking = team_stats.recompute_tournament(db, tournament_id=tournament.id)
+
+    assert [(stats.team_id, stats.points) for stats in ranking] == [
+        (match.home_team_id, 3), (match.away_team_id, 0),
+    ]
+    assert db.scalar(select(func.count()).select_from(TeamStats)) == 2
+
+
+def test_goal_recount_updates_row_created_concurrently(db: Session, monkeypatch):
+    tournament = create_test_tournament(db)
+    match = create_test_match(db, tournament.id, create_test_phase(db, tournament.id).id)
+    player = create_test_player(db, match.home_team_id)
+    db.add(Goal(match_id=match.id, player_id=player.id, team_id=match.home_team_id, minute=9))
+    db.commit()
+    write_first(
+        monkeypatch, "app.crud.player_stats", PlayerStats,
+        player_id=player.id, tournament_id=tournament.id, goals_scored=0,
+    )
+
+    [stats] = player_stats.apply_goal_totals(db, tournament_id=tournament.id)
+    db.commit()
+
+    assert (stats.player_id, stats.goals_scored, stats.matches_played) == (player.id, 1, 1)
+    assert db.scalar(select(func.count()).select_from(PlayerStats)) == 1
@@ -0,0 +1,95 @@
+"""Template environment of the web UI, with compiled-template and fragment caches.
+
+Compiled templates are kept as bytecode on disk, so a new worker loads them
+instead of parsing and compiling every template again.
+
+Expensive blocks (standings tables, top-scorer lists, fixture lists) are
+wrapped in ``{% cache key, tags %}...{% endcache %}``. The rendered HTML is
+stored in the read cache (app.core.cache) under ``key`` and dropped by the
+change events of ``tags``, like any other cached read. ``key`` must cover
+everything else the block depends on, e.g. the filters of a list. A view
+can fetch a fragment first with ``cached_fragment`` and skip loading the
+block's data when it is there.
+"""
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from markupsafe import Markup
+
+from app.core.cache import cache, get_or_set
+from app.core.config import settings
+from app.core.events import tag
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+
+
+class FragmentCacheExtension(Extension):
+    """The ``{% cache key, tags %}`` block."""
+
+    tags = {"cache"}
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        parser.stream.expect("comma")
+        tags = parser.parse_expression()
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        return nodes.CallBlock(
+            self.call_method("_cached_fragment", [key, tags]), [], [], body
+        ).set_lineno(lineno)
+
+    def _cached_fragment(self, key: Any, tags: Iterable[str], caller: Callable[[], str]) -> Markup:
+        # Stored as a plain string so it survives a JSON round trip through Redis
+        return Markup(get_or_set(_fragment_key(key), lambda: str(caller()), tags=list(tags)))
+
+
+def _fragment_key(key: Any) -> str:
+    if isinstance(key, list | tuple):
+        key = ":".join(str(part) for part in key)
+    return f"fragment:{key}"
+
+
+def cached_fragment(key: Any) -> Markup | None:
+    """The fragment cached under ``key``, or None if it has to be rendered."""
+    html = cache.get(_fragment_key(key))
+    return None if html is None else Markup(html)
+
+
+def scope_tag(table: str, **scopes: int | None) -> str:
+    """
+    Tag of the first scope given an id, else ``table``.
+
+    Narrowest scope first, e.g. ``scope_tag("matches", groups=group_id,
+    tournaments=tournament_id)`` for a list filtered by either.
+    """
+    for entity, id in scopes.items():
+        if id:
+            return tag(entity, id)
+    return table
+
+
+def create_environment() -> Environment:
+    """Environment loading the UI templates, with the caches configured in settings."""
+    bytecode_cache = None
+    if settings.TEMPLATE_BYTECODE_CACHE:
+        directory = settings.TEMPLATE_CACHE_DIR or None
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory)
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        auto_reload=settings.TEMPLATE_AUTO_RELOAD,
+        bytecode_cache=bytecode_cache,
+        extensions=[FragmentCacheExtension],
+    )
+    env.globals.update(tag=tag, scope_tag=scope_tag)
+    return env
+
+
+templates = Jinja2Templates(env=create_environment())
@@ -1,33 +1,65 @@
 from datetime import date, time
-from pathlib import Path
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.standings import calculate_group_standings
-from app.db.database import get_db
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, joinedload, selectinload
+
+from app.core import pagination
+from app.core.counters import get_counts
+from app.core.dashboard import get_summary
+from app.core.navigation import get_neighbours
+from app.core.standings import get_group_standings
+from app.crud.match import match as crud_match
+from app.db.database import get_async_db
 from app.models import Goal, Group, Match, Phase, Player, PlayerStats, Team, TeamStats, Tournament
-
-# Initialize templates
-templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
+from app.ui.templating import cached_fragment, templates
 
 router = APIRouter()
 
+# Handlers run on an AsyncSession, so every relationship a template reads
+# must be loaded up front: lazy loads are not possible outside the query.
+MATCH_DETAILS = (
+    joinedload(Match.tournament),
+    joinedload(Match.phase),
+    joinedload(Match.group),
+    joinedload(Match.home_team),
+    joinedload(Match.away_team),
+)
+
+# Goals per page of the player timeline, oldest match first
+PLAYER_GOALS_PAGE = 50
+PLAYER_GOALS_KEYSET = (Match.__table__.c.date, Goal.__table__.c.minute, Goal.__table__.c.id)
+
+
+async def get_match_details(db: AsyncSession, match_id: int) -> Match | None:
+    """Load a match with everything the match templates display."""
+    return await db.scalar(
+        select(Match)
+        .options(*MATCH_DETAILS)
+        .where(Match.id == match_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def render(request: Request, name: str, context: dict) -> HTMLResponse:
+    """Render a template in the threadpool instead of on the event loop."""
+    return await run_in_threadpool(templates.TemplateResponse, request, name, context)
+
+
+async def get_all(db: AsyncSession, model: type) -> list:
+    """Load every row of ``model``, e.g. for filter dropdowns."""
+    return list(await db.scalars(select(model)))
+
 
 @router.get("/", response_class=HTMLResponse)
-async def home(request: Request, db: Session = Depends(get_db)):
-    # Get system statistics
-    stats = {
-        "tournaments": db.query(Tournament).count(),
-        "teams": db.query(Team).count(),
-        "phases": db.query(Phase).count(),
-        "groups": db.query(Group).count(),
-        "matches": db.query(Match).count(),
-    }
+async def home(request: Request, db: AsyncSession = Depends(get_async_db)):
+    # Totals are maintained on every write, so this reads one row per table
+    stats = await db.run_sync(get_counts)
 
-    return templates.TemplateResponse(
+    return await render(
         request,
         "index.html", 
         {"stats": stats}
@@ -41,29 +73,23 @@ async def list_matches(
     tournament_id: int | None = None,
     phase_id: int | None = None,
     group_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    query = db.query(Match).options(
-        joinedload(Match.tournament),
-        joinedload(Match.phase),
-        joinedload(Match.group),
-        joinedload(Match.home_team),
-        joinedload(Match.away_team),
-    )
+    query = select(Match).options(*MATCH_DETAILS)
     
     if tournament_id:
-        query = query.filter(Match.tournament_id == tournament_id)
+        query = query.where(Match.tournament_id == tournament_id)
     if phase_id:
-        query = query.filter(Match.phase_id == phase_id)
+        query = query.where(Match.phase_id == phase_id)
     if group_id:
-        query = query.filter(Match.group_id == group_id)
+        query = query.where(Match.group_id == group_id)
     
-    matches = query.order_by(Match.date, Match.time).all()
-    tournaments = db.query(Tournament).all()
-    phases = db.query(Phase).all() if tournament_id else []
-    groups = db.query(Group).all() if phase_id else []
+    matches = list(await db.scalars(query.order_by(Match.date, Match.time)))
+    tournaments = await get_all(db, Tournament)
+    phases = await get_all(db, Phase) if tournament_id else []
+    groups = await get_all(db, Group) if phase_id else []
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "matches/list.html",
         {
@@ -82,17 +108,17 @@ async def list_matches(
 async def create_match_form(
     request: Request,
     tournament_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    tournaments = db.query(Tournament).all()
+    tournaments = await get_all(db, Tournament)
     phases = []
     groups = []
-    teams = db.query(Team).all()
+    teams = await get_all(db, Team)
     
     if tournament_id:
-        phases = db.query(Phase).filter(Phase.tournament_id == tournament_id).all()
+        phases = list(await db.scalars(select(Phase).where(Phase.tournament_id == tournament_id)))
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "matches/create.html",
         {
@@ -116,7 +142,7 @@ async def create_match(
     date: date = Form(...),
     time: time | None = Form(None),
     location: str | None = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     match = Match(
         tournament_id=tournament_id,
@@ -130,18 +156,12 @@ async def create_match(
         status="scheduled",
     )
     db.add(match)
-    db.commit()
+    await db.commit()
     
     # Get the created match with relationships
-    match = db.query(Match).options(
-        joinedload(Match.tournament),
-        joinedload(Match.phase),
-        joinedload(Match.group),
-        joinedload(Match.home_team),
-        joinedload(Match.away_team),
-    ).filter(Match.id == match.id).first()
+    match = await get_match_details(db, match.id)
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "matches/view.html",
         {
@@ -157,60 +177,48 @@ async def create_match(
     )
 
 
+async def standings_context(db: AsyncSession, match: Match) -> dict:
+    """
+    Group standings for matches/view.html, shown for completed group matches.
+
+    The table is a fragment shared by every match of the group, so the
+    standings are only loaded when it is not cached.
+    """
+    if not match.group_id or match.status != "completed":
+        return {"standings": [], "standings_html": None}
+    group_id = match.group_id
+    standings_html = cached_fragment(("standings", group_id))
+    standings = []
+    if standings_html is None:
+        standings = await db.run_sync(lambda session: get_group_standings(session, group_id))
+    return {"standings": standings, "standings_html": standings_html}
+
+
 @router.get("/matches/{match_id}", response_class=HTMLResponse)
 async def view_match(
     request: Request,
     match_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    match = db.query(Match).options(
-        joinedload(Match.tournament),
-        joinedload(Match.phase),
-        joinedload(Match.group),
-        joinedload(Match.home_team),
-        joinedload(Match.away_team),
-    ).filter(Match.id == match_id).first()
+    match = await get_match_details(db, match_id)
     
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
     
     # Get goals for this match
-    goals = db.query(Goal).options(
-        joinedload(Goal.player),
-        joinedload(Goal.team)
-    ).filter(Goal.match_id == match_id).order_by(Goal.minute).all()
-    
-    # Get previous and next matches in the same group/phase
-    prev_match = None
-    next_match = None
-    
-    if match.group_id:
-        prev_match = db.query(Match).filter(
-            Match.group_id == match.group_id,
-            Match.id < match_id
-        ).order_by(Match.id.desc()).first()
-        
-        next_match = db.query(Match).filter(
-            Match.group_id == match.group_id,
-            Match.id > match_id
-        ).order_by(Match.id).first()
-    else:
-        prev_match = db.query(Match).filter(
-            Match.phase_id == match.phase_id,
-            Match.id < match_id
-        ).order_by(Match.id.desc()).first()
-        
-        next_match = db.query(Match).filter(
-            Match.phase_id == match.phase_id,
-            Match.id > match_id
-        ).order_by(Match.id).first()
-    
-    # Get standings if match is in a group
-    standings = []
-    if match.group_id and match.status == "completed":
-        standings = calculate_group_standings(db, match.group_id)
+    goals = list(await db.scalars(
+        select(Goal).options(
+            joinedload(Goal.player),
+            joinedload(Goal.team)
+        ).where(Goal.match_id == match_id).order_by(Goal.minute)
+    ))
+    
+    # Previous and next match by kickoff in the same group/phase
+    prev_match_id, next_match_id = await db.run_sync(
+        lambda session: get_neighbours(session, match)
+    )
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "matches/view.html",
         {
@@ -221,9 +229,9 @@ async def view_match(
             "phase": match.phase,
             "group": match.group,
             "goals": goals,
-            "prev_match": prev_match,
-            "next_match": next_match,
-            "standings": standings,
+            "prev_match_id": prev_match_id,
+            "next_match_id": next_match_id,
+            **await standings_context(db, match),
         },
     )
 
@@ -232,20 +240,14 @@ async def view_match(
 async def update_match_result_form(
     request: Request,
     match_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    match = db.query(Match).options(
-        joinedload(Match.tournament),
-        joinedload(Match.phase),
-        joinedload(Match.group),
-        joinedload(Match.home_team),
-        joinedload(Match.away_team),
-    ).filter(Match.id == match_id).first()
+    match = await get_match_details(db, match_id)
     
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "matches/result.html",
         {"match": match},
@@ -259,25 +261,20 @@ async def update_match_result(
     home_score: int = Form(...),
     away_score: int = Form(...),
     status: str = Form(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    match = db.query(Match).options(
-        joinedload(Match.tournament),
-        joinedload(Match.phase),
-        joinedload(Match.group),
-        joinedload(Match.home_team),
-        joinedload(Match.away_team),
-    ).filter(Match.id == match_id).first()
+    match = await get_match_details(db, match_id)
     
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
     
-    match.home_score = home_score
-    match.away_score = away_score
-    match.status = status
-    db.commit()
+    match = await crud_match.update_async(
+        db,
+        db_obj=match,
+        obj_in={"home_score": home_score, "away_score": away_score, "status": status},
+    )
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "matches/view.html",
         {
@@ -288,6 +285,7 @@ async def update_match_result(
             "home_team": match.home_team,
             "away_team": match.away_team,
             "goals": [],
+            **await standings_context(db, match),
             "success": "Match result updated successfully"
         },
     )
@@ -295,10 +293,10 @@ async def update_match_result(
 
 # Tournament routes
 @router.get("/tournaments", response_class=HTMLResponse)
-async def list_tournaments(request: Request, db: Session = Depends(get_db)):
-    tournaments = db.query(Tournament).all()
+async def list_tournaments(request: Request, db: AsyncSession = Depends(get_async_db)):
+    tournaments = await get_all(db, Tournament)
 
-    return templates.TemplateResponse(
+    return await render(
         request,
         "tournaments/list.html", 
         {"tournaments": tournaments}
@@ -307,7 +305,7 @@ async def list_tournaments(request: Request, db: Session = Depends(get_db)):
 
 @router.get("/tournaments/create", response_class=HTMLResponse)
 async def create_tournament_form(request: Request):
-    return templates.TemplateResponse(request, "tournaments/create.html", {})
+    return await render(request, "tournaments/create.html", {})
 
 
 @router.post("/tournaments/create")
@@ -320,7 +318,7 @@ async def create_tournament(
     end_date: date = Form(...),
     description: str | None = Form(None),
     logo_url: str | None = Form(None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     tournament = Tournament(
         name=name,
@@ -332,11 +330,11 @@ async def create_tournament(
         logo_url=logo_url,
     )
     db.add(tournament)
-    db.commit()
+    await db.commit()
     
-    tournaments = db.query(Tournament).all()
+    tournaments = await get_all(db, Tournament)
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "tournaments/list.html",
         {
@@ -348,15 +346,15 @@ async def create_tournament(
 
 @router.get("/tournaments/{tournament_id}", response_class=HTMLResponse)
 async def view_tournament(
-    request: Request, tournament_id: int, db: Session = Depends(get_db)
+    request: Request, tournament_id: int, db: AsyncSession = Depends(get_async_db)
 ):
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    tournament = await db.get(Tournament, tournament_id)
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
-    phases = db.query(Phase).filter(Phase.tournament_id == tournament_id).all()
+    phases = list(await db.scalars(select(Phase).where(Phase.tournament_id == tournament_id)))
 
-    return templates.TemplateResponse(
+    return await render(
         request,
         "tournaments/view.html",
         {
@@ -375,20 +373,20 @@ async def view_tournament(
 async def list_players(
     request: Request,
     team_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    query = db.query(Player).options(
+    query = select(Player).options(
         joinedload(Player.team),
-        joinedload(Player.goals),
+        selectinload(Player.goals),
     )
     
     if team_id:
-        query = query.filter(Player.team_id == team_id)
+        query = query.where(Player.team_id == team_id)
     
-    players = query.all()
-    teams = db.query(Team).all()
+    players = list(await db.scalars(query))
+    teams = await get_all(db, Team)
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "players/index.html",
         {
@@ -403,31 +401,55 @@ async def list_players(
 async def view_player(
     request: Request,
     player_id: int,
-    db: Session = Depends(get_db),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
 ):
-    player = db.query(Player).options(
-        joinedload(Player.team),
-        joinedload(Player.goals).joinedload(Goal.match).joinedload(Match.home_team),
-        joinedload(Player.goals).joinedload(Goal.match).joinedload(Match.away_team),
-    ).filter(Player.id == player_id).first()
+    player = await db.scalar(
+        select(Player).options(joinedload(Player.team)).where(Player.id == player_id)
+    )
     
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    goals = db.query(Goal).filter(Goal.player_id == player_id).all()
-    
-    # Calculate basic statistics
-    matches_played = len(set(goal.match_id for goal in goals))
-    total_goals = len(goals)
-    goals_per_match = round(total_goals / matches_played, 2) if matches_played > 0 else 0
-    
+    # Totals come from the player's stats rows, kept current on every goal write
+    goals_scored, matches_played = (await db.execute(
+        select(
+            func.coalesce(func.sum(PlayerStats.goals_scored), 0),
+            func.coalesce(func.sum(PlayerStats.matches_played), 0),
+        ).where(PlayerStats.player_id == player_id)
+    )).one()
     stats = {
         "matches_played": matches_played,
-        "goals": total_goals,
-        "goals_per_match": goals_per_match,
+        "goals": goals_scored,
+        "goals_per_match": round(goals_scored / matches_played, 2) if matches_played else 0,
     }
-    
-    return templates.TemplateResponse(
+
+    # Only the columns the timeline shows, one page at a time
+    home_team, away_team = aliased(Team), aliased(Team)
+    query = pagination.start_after(
+        select(
+            Goal.id,
+            Goal.match_id,
+            Goal.minute,
+            Goal.type,
+            Match.date,
+            home_team.name.label("home_team_name"),
+            away_team.name.label("away_team_name"),
+        )
+        .join(Match, Goal.match_id == Match.id)
+        .join(home_team, Match.home_team_id == home_team.id)
+        .join(away_team, Match.away_team_id == away_team.id)
+        .where(Goal.player_id == player_id),
+        PLAYER_GOALS_KEYSET,
+        cursor,
+    )
+    goals, next_cursor = pagination.split_page(
+        (await db.execute(query.limit(PLAYER_GOALS_PAGE + 1))).all(),
+        PLAYER_GOALS_PAGE,
+        lambda goal: [goal.date, goal.minute, goal.id],
+    )
+
+    return await render(
         request,
         "players/detail.html",
         {
@@ -435,6 +457,7 @@ async def view_player(
             "team": player.team,
             "stats": stats,
             "goals": goals,
+            "next_cursor": next_cursor,
         },
     )
 
@@ -446,33 +469,35 @@ async def goals_page(
     tournament_id: int | None = None,
     team_id: int | None = None,
     player_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Goals page."""
     # Build query with optional filters
-    query = db.query(Goal).options(
+    query = select(Goal).options(
         joinedload(Goal.match).joinedload(Match.tournament),
+        joinedload(Goal.match).joinedload(Match.home_team),
+        joinedload(Goal.match).joinedload(Match.away_team),
         joinedload(Goal.player),
         joinedload(Goal.team),
     )
 
     if tournament_id:
-        query = query.join(Match).filter(Match.tournament_id == tournament_id)
+        query = query.join(Match).where(Match.tournament_id == tournament_id)
 
     if team_id:
-        query = query.filter(Goal.team_id == team_id)
+        query = query.where(Goal.team_id == team_id)
 
     if player_id:
-        query = query.filter(Goal.player_id == player_id)
+        query = query.where(Goal.player_id == player_id)
 
-    goals = query.order_by(Goal.match_id, Goal.minute).all()
+    goals = list(await db.scalars(query.order_by(Goal.match_id, Goal.minute)))
 
     # Get filter options
-    tournaments = db.query(Tournament).all()
-    teams = db.query(Team).all()
-    players = db.query(Player).options(joinedload(Player.team)).all()
+    tournaments = await get_all(db, Tournament)
+    teams = await get_all(db, Team)
+    players = list(await db.scalars(select(Player).options(joinedload(Player.team))))
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "goals/index.html",
         {
@@ -492,28 +517,31 @@ async def player_stats_page(
     request: Request,
     tournament_id: int | None = None,
     team_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     # Get all tournaments for filter
-    tournaments = db.query(Tournament).all()
+    tournaments = await get_all(db, Tournament)
     
     # Get tournament if specified
     tournament = None
     if tournament_id:
-        tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+        tournament = await db.get(Tournament, tournament_id)
     
     # Get teams for filter
-    teams = db.query(Team).all()
+    teams = await get_all(db, Team)
     
     # Get player stats
-    query = db.query(PlayerStats)
+    query = select(PlayerStats).options(
+        joinedload(PlayerStats.player).joinedload(Player.team),
+        joinedload(PlayerStats.tournament),
+    )
     if tournament_id:
-        query = query.filter(PlayerStats.tournament_id == tournament_id)
+        query = query.where(PlayerStats.tournament_id == tournament_id)
     if team_id:
-        query = query.filter(PlayerStats.team_id == team_id)
-    player_stats = query.all()
+        query = query.where(PlayerStats.team_id == team_id)
+    player_stats = list(await db.scalars(query))
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "player_stats.html",
         {
@@ -534,21 +562,21 @@ async def player_stats_page(
 async def list_teams(
     request: Request,
     tournament_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """List all teams or teams in a specific tournament."""
-    query = db.query(Team)
+    query = select(Team)
     
     if tournament_id:
         # If tournament_id is provided, filter teams that have participated in that tournament
         query = query.join(Match, (Team.id == Match.home_team_id) | (Team.id == Match.away_team_id))\
-                    .filter(Match.tournament_id == tournament_id)\
+                    .where(Match.tournament_id == tournament_id)\
                     .distinct()
     
-    teams = query.order_by(Team.name).all()
-    tournaments = db.query(Tournament).all()
+    teams = list(await db.scalars(query.order_by(Team.name)))
+    tournaments = await get_all(db, Tournament)
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "teams/list.html",
         {
@@ -563,35 +591,39 @@ async def view_team(
     request: Request,
     team_id: int,
     tournament_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    team = db.query(Team).filter(Team.id == team_id).first()
+    team = await db.get(Team, team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
     # Get tournament if specified
     tournament = None
     if tournament_id:
-        tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+        tournament = await db.get(Tournament, tournament_id)
     
     # Get players
-    players = db.query(Player).filter(Player.team_id == team_id).all()
+    players = list(await db.scalars(select(Player).where(Player.team_id == team_id)))
     
     # Get matches
-    matches_query = db.query(Match).filter(
-        (Match.home_team_id == team_id) | (Match.away_team_id == team_id)
-    )
+    matches_query = select(Match).options(
+        joinedload(Match.tournament),
+        joinedload(Match.home_team),
+        joinedload(Match.away_team),
+    ).where(or_(Match.home_team_id == team_id, Match.away_team_id == team_id))
     if tournament_id:
-        matches_query = matches_query.filter(Match.tournament_id == tournament_id)
-    matches = matches_query.all()
+        matches_query = matches_query.where(Match.tournament_id == tournament_id)
+    matches = list(await db.scalars(matches_query))
     
     # Get stats
-    stats_query = db.query(TeamStats).filter(TeamStats.team_id == team_id)
+    stats_query = select(TeamStats).options(
+        joinedload(TeamStats.tournament)
+    ).where(TeamStats.team_id == team_id)
     if tournament_id:
-        stats_query = stats_query.filter(TeamStats.tournament_id == tournament_id)
-    stats = stats_query.all()
+        stats_query = stats_query.where(TeamStats.tournament_id == tournament_id)
+    stats = list(await db.scalars(stats_query))
     
-    return templates.TemplateResponse(
+    return await render(
         request,
         "teams/view.html",
         {
@@ -607,26 +639,25 @@ async def view_team(
 async def stats_overview(
     request: Request,
     tournament_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """Overview of tournament statistics."""
     # Get tournaments for filtering
-    tournaments = db.query(Tournament).all()
+    tournaments = await get_all(db, Tournament)
     
     # Get top scorers
-    top_scorers_query = db.query(PlayerStats).options(
-        joinedload(PlayerStats.player),
+    top_scorers_query = select(PlayerStats).options(
         joinedload(PlayerStats.tournament),
         joinedload(PlayerStats.player).joinedload(Player.team)
     ).order_by(PlayerStats.goals_scored.desc())
     
     if tournament_id:
-        top_scorers_query = top_scorers_query.filter(PlayerStats.tournament_id == tournament_id)
+        top_scorers_query = top_scorers_query.where(PlayerStats.tournament_id == tournament_id)
     
-    top_scorers = top_scorers_query.limit(10).all()
+    top_scorers = list(await db.scalars(top_scorers_query.limit(10)))
     
     # Get team rankings
-    team_rankings_query = db.query(TeamStats).options(
+    team_rankings_query = select(TeamStats).options(
         joinedload(TeamStats.team),
         joinedload(TeamStats.tournament)
     ).order_by(
@@ -635,35 +666,13 @@ async def stats_overview(
     )
     
     if tournament_id:
-        team_rankings_query = team_rankings_query.filter(TeamStats.tournament_id == tournament_id)
-    
-    team_stats = team_rankings_query.limit(10).all()
+        team_rankings_query = team_rankings_query.where(TeamStats.tournament_id == tournament_id)
     
-    # Calculate summary statistics
-    total_matches_query = db.query(Match).filter(Match.status == "completed")
-    total_goals_query = db.query(Goal)
-    
-    if tournament_id:
-        total_matches_query = total_matches_query.filter(Match.tournament_id == tournament_id)
-        total_goals_query = total_goals_query.join(Match).filter(Match.tournament_id == tournament_id)
+    team_stats = list(await db.scalars(team_rankings_query.limit(10)))
     
-    total_matches = total_matches_query.count()
-    total_goals = total_goals_query.count()
-    goals_per_match = total_goals / total_matches if total_matches > 0 else 0
-    
-    # Count clean sheets
-    total_clean_sheets = 0
-    if tournament_id:
-        clean_sheets = db.query(TeamStats).filter(
-            TeamStats.tournament_id == tournament_id,
-            TeamStats.clean_sheets > 0
-        ).all()
-        total_clean_sheets = sum(ts.clean_sheets for ts in clean_sheets)
-    else:
-        clean_sheets = db.query(TeamStats).filter(TeamStats.clean_sheets > 0).all()
-        total_clean_sheets = sum(ts.clean_sheets for ts in clean_sheets)
-    
-    return templates.TemplateResponse(
+    summary = await db.run_sync(lambda session: get_summary(session, tournament_id or None))
+
+    return await render(
         request,
         "stats/overview.html",
         {
@@ -671,9 +680,6 @@ async def stats_overview(
             "selected_tournament_id": tournament_id,
             "top_scorers": top_scorers,
             "team_stats": team_stats,
-            "total_matches": total_matches,
-            "total_goals": total_goals,
-            "goals_per_match": goals_per_match,
-            "total_clean_sheets": total_clean_sheets
+            **summary,
         },
     )
@@ -0,0 +1,42 @@
+"""add group standings table
+
+Revision ID: 4b8e2f91c6d3
+Revises: 7f4e138776cb
+Create Date: 2026-10-17 10:12:31.482215
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4b8e2f91c6d3'
+down_revision = '7f4e138776cb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('group_standings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('group_id', sa.Integer(), nullable=False),
+    sa.Column('team_id', sa.Integer(), nullable=False),
+    sa.Column('matches_played', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('draws', sa.Integer(), nullable=False),
+    sa.Column('losses', sa.Integer(), nullable=False),
+    sa.Column('goals_for', sa.Integer(), nullable=False),
+    sa.Column('goals_against', sa.Integer(), nullable=False),
+    sa.Column('goal_difference', sa.Integer(), nullable=False),
+    sa.Column('points', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['group_id'], ['groups.id'], ),
+    sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('group_id', 'team_id', name='uq_group_standings_group_team')
+    )
+    op.create_index(op.f('ix_group_standings_id'), 'group_standings', ['id'], unique=False)
+    # Rows are primed lazily: the first result written for a group rebuilds its table
+
+
+def downgrade():
+    op.drop_index(op.f('ix_group_standings_id'), table_name='group_standings')
+    op.drop_table('group_standings')
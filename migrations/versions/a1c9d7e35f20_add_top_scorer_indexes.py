@@ -0,0 +1,25 @@
+"""add top scorer indexes
+
+Revision ID: a1c9d7e35f20
+Revises: 4b8e2f91c6d3
+Create Date: 2026-10-17 11:03:47.215904
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a1c9d7e35f20'
+down_revision = '4b8e2f91c6d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Leaderboard query: matches of a tournament, then goals per player in those matches
+    op.create_index('ix_matches_tournament_id_id', 'matches', ['tournament_id', 'id'], unique=False)
+    op.create_index('ix_goals_match_id_player_id', 'goals', ['match_id', 'player_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_goals_match_id_player_id', table_name='goals')
+    op.drop_index('ix_matches_tournament_id_id', table_name='matches')
@@ -0,0 +1,49 @@
+"""add hot path indexes
+
+Revision ID: c5e7a2d94b18
+Revises: a1c9d7e35f20
+Create Date: 2026-10-17 12:18:05.640233
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c5e7a2d94b18'
+down_revision = 'a1c9d7e35f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Match listings by tournament, group and phase, usually narrowed by status
+    op.create_index('ix_matches_tournament_id_status', 'matches', ['tournament_id', 'status'], unique=False)
+    op.create_index('ix_matches_group_id_status', 'matches', ['group_id', 'status'], unique=False)
+    op.create_index('ix_matches_phase_id', 'matches', ['phase_id'], unique=False)
+    # Team statistics look up matches where the team plays home or away
+    op.create_index('ix_matches_home_team_id', 'matches', ['home_team_id'], unique=False)
+    op.create_index('ix_matches_away_team_id', 'matches', ['away_team_id'], unique=False)
+    # Goals by match are served by ix_goals_match_id_player_id
+    op.create_index('ix_goals_player_id', 'goals', ['player_id'], unique=False)
+
+    # Keep the most recent row of any duplicated stats before enforcing uniqueness
+    op.execute(
+        "DELETE FROM team_stats WHERE tournament_id IS NOT NULL AND id NOT IN "
+        "(SELECT MAX(id) FROM team_stats WHERE tournament_id IS NOT NULL GROUP BY team_id, tournament_id)"
+    )
+    op.execute(
+        "DELETE FROM player_stats WHERE tournament_id IS NOT NULL AND id NOT IN "
+        "(SELECT MAX(id) FROM player_stats WHERE tournament_id IS NOT NULL GROUP BY player_id, tournament_id)"
+    )
+    op.create_index('uq_team_stats_team_id_tournament_id', 'team_stats', ['team_id', 'tournament_id'], unique=True)
+    op.create_index('uq_player_stats_player_id_tournament_id', 'player_stats', ['player_id', 'tournament_id'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_player_stats_player_id_tournament_id', table_name='player_stats')
+    op.drop_index('uq_team_stats_team_id_tournament_id', table_name='team_stats')
+    op.drop_index('ix_goals_player_id', table_name='goals')
+    op.drop_index('ix_matches_away_team_id', table_name='matches')
+    op.drop_index('ix_matches_home_team_id', table_name='matches')
+    op.drop_index('ix_matches_phase_id', table_name='matches')
+    op.drop_index('ix_matches_group_id_status', table_name='matches')
+    op.drop_index('ix_matches_tournament_id_status', table_name='matches')
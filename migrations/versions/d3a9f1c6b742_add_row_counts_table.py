@@ -0,0 +1,33 @@
+"""add row counts table
+
+Revision ID: d3a9f1c6b742
+Revises: c5e7a2d94b18
+Create Date: 2026-10-17 14:02:47.118530
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd3a9f1c6b742'
+down_revision = 'c5e7a2d94b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('row_counts',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+    # Seeded while no request is writing; app.core.counters keeps them current
+    for table_name in ('tournaments', 'teams', 'phases', 'groups', 'matches'):
+        op.execute(
+            f"INSERT INTO row_counts (table_name, count) "
+            f"SELECT '{table_name}', COUNT(*) FROM {table_name}"
+        )
+
+
+def downgrade():
+    op.drop_table('row_counts')
@@ -0,0 +1,27 @@
+"""add change versions table
+
+Revision ID: e8b4c2f7a915
+Revises: d3a9f1c6b742
+Create Date: 2026-10-17 18:21:05.402117
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e8b4c2f7a915'
+down_revision = 'd3a9f1c6b742'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('change_versions',
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade():
+    op.drop_table('change_versions')
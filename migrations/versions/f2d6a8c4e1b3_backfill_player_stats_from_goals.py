@@ -0,0 +1,40 @@
+"""backfill player stats from goals
+
+Revision ID: f2d6a8c4e1b3
+Revises: e8b4c2f7a915
+Create Date: 2026-10-17 19:04:36.281904
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f2d6a8c4e1b3'
+down_revision = 'e8b4c2f7a915'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Goals written before the CRUD layer kept player_stats in step: recount
+    # every scorer as CRUDPlayerStats.apply_goal_totals does (90 minutes per
+    # match scored in), so the player page's totals start out right
+    op.execute(
+        "INSERT INTO player_stats (player_id, tournament_id, matches_played, goals_scored, "
+        "minutes_played, goals_per_match, minutes_per_goal) "
+        "SELECT goals.player_id, matches.tournament_id, "
+        "COUNT(DISTINCT goals.match_id), COUNT(goals.id), COUNT(DISTINCT goals.match_id) * 90, "
+        "CAST(COUNT(goals.id) AS FLOAT) / COUNT(DISTINCT goals.match_id), "
+        "CAST(COUNT(DISTINCT goals.match_id) * 90 AS FLOAT) / COUNT(goals.id) "
+        "FROM goals JOIN matches ON matches.id = goals.match_id "
+        "WHERE goals.player_id IS NOT NULL AND matches.tournament_id IS NOT NULL "
+        "GROUP BY goals.player_id, matches.tournament_id "
+        "ON CONFLICT (player_id, tournament_id) DO UPDATE SET "
+        "matches_played = excluded.matches_played, goals_scored = excluded.goals_scored, "
+        "minutes_played = excluded.minutes_played, goals_per_match = excluded.goals_per_match, "
+        "minutes_per_goal = excluded.minutes_per_goal"
+    )
+
+
+def downgrade():
+    # Data only: the recounted rows are left as they are
+    pass
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Measure how many match-center WebSocket subscribers one worker can sustain.
+
+A throwaway SQLite database is seeded and served by a single uvicorn
+worker. For each subscriber count, that many WebSocket clients follow a
+few of the "live" matches while a writer posts score changes to them over
+the REST API. The script reports the delay from each write to its delivery,
+and the largest subscriber count whose p99 stays under --p99-limit with no
+failed connections.
+
+Scores that a client never sees because a later score was merged into the
+same delta are counted as skipped; that is the intended backpressure.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root and this directory to the Python path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(__file__))
+
+import httpx
+import websockets
+from benchmark_ui_load import free_port, percentile, seed_database, start_server
+
+
+class Level:
+    """Results for one subscriber count."""
+
+    def __init__(self, clients: int):
+        self.clients = clients
+        self.connected = 0
+        self.failed = 0
+        self.latencies: list[float] = []
+        self.skipped = 0
+
+
+async def subscriber(
+    url: str, match_ids: list[int], sent: dict, level: Level, ready: asyncio.Event, stop: asyncio.Event
+) -> None:
+    """Follow ``match_ids`` and record the delay of every score delivered."""
+    try:
+        async with websockets.connect(url, open_timeout=30, max_queue=None) as ws:
+            await ws.send(json.dumps({"action": "subscribe", "match_ids": match_ids}))
+            last_seen = {}
+            for _ in match_ids:
+                snapshot = json.loads(await ws.recv())
+                last_seen[snapshot["match_id"]] = snapshot["home_score"] or 0
+            level.connected += 1
+            if level.connected + level.failed == level.clients:
+                ready.set()
+            while not stop.is_set():
+                try:
+                    message = json.loads(await asyncio.wait_for(ws.recv(), 0.5))
+                except asyncio.TimeoutError:
+                    continue
+                score = message.get("home_score")
+                if score is None:
+                    continue
+                match_id = message["match_id"]
+                level.skipped += max(0, score - last_seen[match_id] - 1)
+                last_seen[match_id] = score
+                written = sent.get((match_id, score))
+                if written is not None:
+                    level.latencies.append((time.perf_counter() - written) * 1000)
+    except (OSError, asyncio.TimeoutError, websockets.WebSocketException):
+        level.failed += 1
+        if level.connected + level.failed == level.clients:
+            ready.set()
+
+
+async def run_level(
+    base_url: str, live_matches: list[int], clients: int, per_client: int, updates: int, rate: float
+) -> Level:
+    """Connect ``clients`` subscribers, then write ``updates`` scores at ``rate`` per second."""
+    level = Level(clients)
+    sent: dict[tuple[int, int], float] = {}
+    ready, stop = asyncio.Event(), asyncio.Event()
+    rng = random.Random(clients)
+    ws_url = base_url.replace("http://", "ws://") + "/api/live/matches"
+    tasks = [
+        asyncio.create_task(
+            subscriber(ws_url, rng.sample(live_matches, per_client), sent, level, ready, stop)
+        )
+        for _ in range(clients)
+    ]
+    await asyncio.wait_for(ready.wait(), timeout=120)
+
+    scores = dict.fromkeys(live_matches, 0)
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as http:
+        # Start from 0-0 so every client's snapshot agrees with the counters
+        for match_id in live_matches:
+            await http.put(f"/api/matches/{match_id}/result", json={
+                "home_score": 0, "away_score": 0, "status": "completed",
+            })
+        await asyncio.sleep(1)
+        for n in range(updates):
+            match_id = live_matches[n % len(live_matches)]
+            scores[match_id] += 1
+            sent[(match_id, scores[match_id])] = time.perf_counter()
+            await http.put(f"/api/matches/{match_id}/result", json={
+                "home_score": scores[match_id], "away_score": 0, "status": "completed",
+            })
+            await asyncio.sleep(1 / rate)
+
+    await asyncio.sleep(2)  # let the last deltas arrive
+    stop.set()
+    await asyncio.gather(*tasks)
+    return level
+
+
+def main() -> None:
+    """Seed, serve and step through subscriber counts."""
+    parser = argparse.ArgumentParser(description="Load test the match-center WebSocket.")
+    parser.add_argument("--app-dir", default=PROJECT_ROOT, help="Checkout of the app to serve")
+    parser.add_argument(
+        "--clients", default="100,250,500,1000", help="Comma-separated subscriber counts"
+    )
+    parser.add_argument("--live-matches", type=int, default=10, help="Matches receiving updates")
+    parser.add_argument("--per-client", type=int, default=3, help="Matches each client follows")
+    parser.add_argument("--updates", type=int, default=100, help="Score writes per level")
+    parser.add_argument("--rate", type=float, default=10, help="Score writes per second")
+    parser.add_argument("--p99-limit", type=float, default=500, help="Sustainable p99 in ms")
+    args = parser.parse_args()
+
+    levels = []
+    with tempfile.TemporaryDirectory() as workdir:
+        match_count = seed_database(os.path.join(workdir, "torneig_futbol.db"), 1, 6)
+        port = free_port()
+        server = start_server(os.path.abspath(args.app_dir), workdir, port, workers=1)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            live_matches = list(range(1, min(args.live_matches, match_count) + 1))
+            for clients in (int(c) for c in args.clients.split(",")):
+                levels.append(asyncio.run(run_level(
+                    base_url, live_matches, clients, args.per_client, args.updates, args.rate
+                )))
+        finally:
+            server.terminate()
+            server.wait(timeout=15)
+
+    print(f"App: {os.path.abspath(args.app_dir)}")
+    print(f"{args.updates} score writes at {args.rate}/s over {len(live_matches)} matches")
+    sustained = 0
+    for level in levels:
+        line = f"{level.clients:>6} clients: {level.connected} connected, {level.failed} failed"
+        if level.latencies:
+            p99 = percentile(level.latencies, 99)
+            line += (
+                f", {len(level.latencies)} deliveries, p50 {percentile(level.latencies, 50):.1f} ms,"
+                f" p99 {p99:.1f} ms, {level.skipped} skipped"
+            )
+            if not level.failed and p99 <= args.p99_limit:
+                sustained = level.clients
+        print(line)
+    print(f"Sustained with p99 <= {args.p99_limit:.0f} ms: {sustained} subscribers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+"""
+Benchmark the hot query paths with and without the composite indexes.
+
+The schema is created from the models in an in-memory SQLite database and
+filled with synthetic tournaments. Each hot query is then explained with
+EXPLAIN QUERY PLAN and timed twice: once with the hot path indexes dropped
+and once with them in place.
+"""
+
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, func, or_, select, text
+from sqlalchemy.engine import Connection
+
+import app.models  # noqa: F401  # register all models on Base.metadata
+from app.db.database import Base
+from app.models import Goal, Match
+from app.models.player_stats import PlayerStats
+from app.models.team_stats import TeamStats
+
+# Indexes added for the hot filter paths (see migrations/versions)
+HOT_PATH_INDEXES = {
+    "matches": [
+        "ix_matches_tournament_id_id",
+        "ix_matches_tournament_id_status",
+        "ix_matches_group_id_status",
+        "ix_matches_phase_id",
+        "ix_matches_home_team_id",
+        "ix_matches_away_team_id",
+    ],
+    "goals": ["ix_goals_match_id_player_id", "ix_goals_player_id"],
+    "team_stats": ["uq_team_stats_team_id_tournament_id"],
+    "player_stats": ["uq_player_stats_player_id_tournament_id"],
+}
+
+
+def seed(conn: Connection, tournaments: int, teams: int, goals_per_match: int) -> None:
+    """Insert synthetic tournaments with a double round robin each."""
+    rng = random.Random(42)
+    team_rows = [{"id": i, "name": f"Team {i}"} for i in range(1, teams + 1)]
+    conn.execute(Base.metadata.tables["teams"].insert(), team_rows)
+    conn.execute(Base.metadata.tables["players"].insert(), [
+        {"id": (team - 1) * 11 + n, "name": f"Player {team}-{n}", "team_id": team}
+        for team in range(1, teams + 1)
+        for n in range(1, 12)
+    ])
+
+    match_rows, goal_rows, team_stats_rows, player_stats_rows = [], [], [], []
+    match_id = 0
+    for tournament_id in range(1, tournaments + 1):
+        conn.execute(Base.metadata.tables["tournaments"].insert(), {
+            "id": tournament_id, "name": f"Tournament {tournament_id}",
+        })
+        conn.execute(Base.metadata.tables["phases"].insert(), {
+            "id": tournament_id, "tournament_id": tournament_id, "name": "League",
+        })
+        conn.execute(Base.metadata.tables["groups"].insert(), {
+            "id": tournament_id, "phase_id": tournament_id, "name": "A",
+        })
+        for home in range(1, teams + 1):
+            for away in range(1, teams + 1):
+                if home == away:
+                    continue
+                match_id += 1
+                match_rows.append({
+                    "id": match_id,
+                    "tournament_id": tournament_id,
+                    "phase_id": tournament_id,
+                    "group_id": tournament_id,
+                    "home_team_id": home,
+                    "away_team_id": away,
+                    "date": datetime.date(2024, 1, 1) + datetime.timedelta(days=match_id % 365),
+                    "home_score": 0,
+                    "away_score": 0,
+                    "status": rng.choice(["scheduled", "completed", "completed"]),
+                })
+                for _ in range(rng.randint(0, goals_per_match)):
+                    team = rng.choice([home, away])
+                    goal_rows.append({
+                        "match_id": match_id,
+                        "player_id": (team - 1) * 11 + rng.randint(1, 11),
+                        "team_id": team,
+                        "minute": rng.randint(1, 90),
+                        "type": "regular",
+                    })
+        team_stats_rows += [
+            {"team_id": team, "tournament_id": tournament_id} for team in range(1, teams + 1)
+        ]
+        player_stats_rows += [
+            {"player_id": player, "tournament_id": tournament_id}
+            for player in range(1, teams * 11 + 1)
+        ]
+
+    conn.execute(Base.metadata.tables["matches"].insert(), match_rows)
+    conn.execute(Base.metadata.tables["goals"].insert(), goal_rows)
+    conn.execute(Base.metadata.tables["team_stats"].insert(), team_stats_rows)
+    conn.execute(Base.metadata.tables["player_stats"].insert(), player_stats_rows)
+
+
+def hot_queries(tournament_id: int, team_id: int, player_id: int) -> dict[str, object]:
+    """The filter paths used by the API, UI and statistics recalculation."""
+    return {
+        "matches by tournament and status": select(Match.id).where(
+            Match.tournament_id == tournament_id, Match.status == "completed"
+        ),
+        "matches by group and status": select(Match.id).where(
+            Match.group_id == tournament_id, Match.status == "completed"
+        ),
+        "matches by phase": select(Match.id).where(Match.phase_id == tournament_id),
+        "team matches in tournament": select(Match.id).where(
+            Match.tournament_id == tournament_id,
+            or_(Match.home_team_id == team_id, Match.away_team_id == team_id),
+        ),
+        "goals by match": select(Goal.id).where(Goal.match_id == 1),
+        "goals by player": select(Goal.id).where(Goal.player_id == player_id),
+        "top scorers": (
+            select(Goal.player_id, func.count(Goal.id).label("goals"))
+            .join(Match, Goal.match_id == Match.id)
+            .where(Match.tournament_id == tournament_id)
+            .group_by(Goal.player_id)
+            .order_by(text("goals DESC"))
+            .limit(10)
+        ),
+        "team stats lookup": select(TeamStats.id).where(
+            TeamStats.team_id == team_id, TeamStats.tournament_id == tournament_id
+        ),
+        "player stats lookup": select(PlayerStats.id).where(
+            PlayerStats.player_id == player_id, PlayerStats.tournament_id == tournament_id
+        ),
+    }
+
+
+def run_queries(conn: Connection, queries: dict[str, object], repeat: int) -> dict[str, tuple]:
+    """Explain and time each query, returning (plan, milliseconds per run)."""
+    results = {}
+    for name, query in queries.items():
+        sql = str(query.compile(conn, compile_kwargs={"literal_binds": True}))
+        plan = [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+        started = time.perf_counter()
+        for _ in range(repeat):
+            conn.execute(text(sql)).fetchall()
+        elapsed = (time.perf_counter() - started) / repeat * 1000
+        results[name] = (plan, elapsed)
+    return results
+
+
+def main() -> None:
+    """Seed a throwaway database and compare plans before and after indexing."""
+    parser = argparse.ArgumentParser(description="Compare query plans of the hot filter paths.")
+    parser.add_argument("--tournaments", type=int, default=20, help="Tournaments to generate")
+    parser.add_argument("--teams", type=int, default=20, help="Teams per tournament")
+    parser.add_argument("--goals", type=int, default=5, help="Maximum goals per match")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per query")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as conn:
+        seed(conn, args.tournaments, args.teams, args.goals)
+        queries = hot_queries(args.tournaments // 2 or 1, 1, 1)
+
+        for indexes in HOT_PATH_INDEXES.values():
+            for index in indexes:
+                conn.execute(text(f"DROP INDEX {index}"))
+        conn.execute(text("ANALYZE"))
+        before = run_queries(conn, queries, args.repeat)
+
+        for table, indexes in HOT_PATH_INDEXES.items():
+            for index in Base.metadata.tables[table].indexes:
+                if index.name in indexes:
+                    index.create(conn)
+        conn.execute(text("ANALYZE"))
+        after = run_queries(conn, queries, args.repeat)
+
+    for name in queries:
+        before_plan, before_ms = before[name]
+        after_plan, after_ms = after[name]
+        print(f"{name}: {before_ms:.3f} ms -> {after_ms:.3f} ms")
+        print("  before: " + "; ".join(before_plan))
+        print("  after:  " + "; ".join(after_plan))
+
+
+if __name__ == "__main__":
+    main()
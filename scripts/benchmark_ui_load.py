@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Load test the match page of the web UI under concurrent requests.
+
+A throwaway SQLite database is seeded with synthetic tournaments, a local
+uvicorn server is started on it, and an httpx-based driver requests
+/matches/{id} from many concurrent clients. The script reports throughput
+and p50/p99 latency.
+
+To compare two versions of the app, run the benchmark once per checkout
+with --app-dir, e.g. against a `git worktree` of the previous revision.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add the project root and this directory to the Python path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.dirname(__file__))
+
+import httpx
+from sqlalchemy import create_engine
+
+import app.models  # noqa: F401  # register all models on Base.metadata
+from app.db.database import Base
+from benchmark_query_plans import seed
+
+
+def free_port() -> int:
+    """Find a free local TCP port for the server."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed_database(path: str, tournaments: int, teams: int) -> int:
+    """Create and fill the benchmark database, returning the number of matches."""
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        seed(conn, tournaments, teams, goals_per_match=5)
+    engine.dispose()
+    return tournaments * teams * (teams - 1)
+
+
+def start_server(app_dir: str, workdir: str, port: int, workers: int) -> subprocess.Popen:
+    """Start uvicorn serving app_dir with ./torneig_futbol.db inside workdir."""
+    env = dict(os.environ, PYTHONPATH=app_dir)
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=workdir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return server
+        except httpx.TransportError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start within 30 seconds")
+
+
+async def drive(
+    base_url: str, match_count: int, concurrency: int, requests: int, timeout: float
+) -> tuple[list[float], int]:
+    """Request random match pages from concurrent clients.
+
+    Returns the latencies in ms of successful requests and the number of
+    requests that failed or timed out.
+    """
+    latencies: list[float] = []
+    errors = 0
+    rng = random.Random(7)
+    per_client = requests // concurrency
+
+    async def client_loop(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        for _ in range(per_client):
+            started = time.perf_counter()
+            try:
+                response = await client.get(f"/matches/{rng.randint(1, match_count)}")
+            except httpx.TimeoutException:
+                errors += 1
+                continue
+            if response.is_success:
+                latencies.append((time.perf_counter() - started) * 1000)
+            else:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout) as client:
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+    return latencies, errors
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    return ordered[max(0, round(pct / 100 * len(ordered)) - 1)]
+
+
+def main() -> None:
+    """Seed, serve and load test the match page."""
+    parser = argparse.ArgumentParser(description="Load test concurrent /matches/{id} views.")
+    parser.add_argument("--app-dir", default=PROJECT_ROOT, help="Checkout of the app to serve")
+    parser.add_argument("--tournaments", type=int, default=5, help="Tournaments to generate")
+    parser.add_argument("--teams", type=int, default=16, help="Teams per tournament")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout in seconds")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        match_count = seed_database(
+            os.path.join(workdir, "torneig_futbol.db"), args.tournaments, args.teams
+        )
+        port = free_port()
+        server = start_server(os.path.abspath(args.app_dir), workdir, port, args.workers)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            # Warm up templates, caches and connections before measuring
+            asyncio.run(
+                drive(base_url, match_count, args.concurrency, args.concurrency, args.timeout)
+            )
+            started = time.perf_counter()
+            latencies, errors = asyncio.run(
+                drive(base_url, match_count, args.concurrency, args.requests, args.timeout)
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    print(f"App: {os.path.abspath(args.app_dir)}")
+    print(
+        f"{len(latencies) + errors} requests, {args.concurrency} concurrent clients, "
+        f"{elapsed:.2f} s, {errors} failed or timed out"
+    )
+    print(f"Throughput: {len(latencies) / elapsed:.1f} req/s")
+    if not latencies:
+        return
+    print(
+        f"Latency: p50 {percentile(latencies, 50):.1f} ms, "
+        f"p99 {percentile(latencies, 99):.1f} ms, max {max(latencies):.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
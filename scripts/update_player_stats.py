@@ -2,140 +2,157 @@
 """
 Script to update player statistics based on goals scored in tournaments.
 This script can be run periodically to ensure player statistics are up-to-date.
+
+Statistics are rebuilt as a batch: a single grouped aggregate of goals per
+(tournament, player) with per-type counts, then one INSERT ... ON CONFLICT
+DO UPDATE and one commit per tournament.
 """
 
 import argparse
 import os
 import sys
+import time
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from sqlalchemy import case, distinct, func
 from sqlalchemy.orm import Session
 
+from app.crud.player_stats import STATS_COLUMNS
 from app.db.database import SessionLocal
+from app.db.upsert import upsert
 from app.models import Goal, Match, Player, Tournament
 from app.models.player_stats import PlayerStats
 
+# Minutes credited for every match a player scored in
+MINUTES_PER_MATCH = 90
+
 
 def update_player_stats(
-    db: Session, tournament_id: int | None = None, player_id: int | None = None
-) -> None:
+    db: Session,
+    tournament_id: int | None = None,
+    player_id: int | None = None,
+    dry_run: bool = False,
+) -> dict[str, float]:
     """
     Update player statistics based on goals scored.
-    
+
     Args:
         db: Database session
         tournament_id: Optional tournament ID to filter by
         player_id: Optional player ID to filter by
+        dry_run: Compute and report the statistics without writing them
+
+    Returns:
+        Timing summary in seconds for each stage of the rebuild
     """
+    started = time.perf_counter()
+    timings: dict[str, float] = {}
+
     # Get tournaments to process
+    tournaments_query = db.query(Tournament.id, Tournament.name, Tournament.edition)
     if tournament_id:
-        tournaments: list[Tournament] = db.query(Tournament).filter(Tournament.id == tournament_id).all()
-        if not tournaments:
+        tournaments_query = tournaments_query.filter(Tournament.id == tournament_id)
+    tournaments = tournaments_query.all()
+    if not tournaments:
+        if tournament_id:
             print(f"Tournament with ID {tournament_id} not found.")
-            return
-    else:
-        tournaments: list[Tournament] = db.query(Tournament).all()
-        print(f"Processing {len(tournaments)} tournaments...")
-    
-    # Process each tournament
+        return timings
+    print(f"Processing {len(tournaments)} tournaments...")
+    tournament_ids = [t.id for t in tournaments]
+
+    # One grouped aggregate of goals by tournament and player, counted per type.
+    # Joining Player drops goals whose player no longer exists.
+    step = time.perf_counter()
+    aggregate_query = (
+        db.query(
+            Match.tournament_id,
+            Goal.player_id,
+            Player.name,
+            func.sum(case((Goal.type == "regular", 1), else_=0)),
+            func.sum(case((Goal.type == "penalty", 1), else_=0)),
+            func.sum(case((Goal.type == "own_goal", 1), else_=0)),
+            func.count(distinct(Goal.match_id)),
+        )
+        .join(Match, Goal.match_id == Match.id)
+        .join(Player, Goal.player_id == Player.id)
+        .filter(Match.tournament_id.in_(tournament_ids))
+        .group_by(Match.tournament_id, Goal.player_id, Player.name)
+    )
+    if player_id:
+        aggregate_query = aggregate_query.filter(Goal.player_id == player_id)
+
+    totals: dict[int, list[tuple]] = {tid: [] for tid in tournament_ids}
+    for row in aggregate_query:
+        totals[row[0]].append(row[1:])
+
+    # Keys of the existing stats rows, to report new and updated rows
+    existing_query = db.query(PlayerStats.tournament_id, PlayerStats.player_id).filter(
+        PlayerStats.tournament_id.in_(tournament_ids)
+    )
+    if player_id:
+        existing_query = existing_query.filter(PlayerStats.player_id == player_id)
+    existing = set(existing_query.tuples())
+    timings["aggregate"] = time.perf_counter() - step
+
+    # One upsert and one commit per tournament
+    step = time.perf_counter()
+    created = updated = 0
     for tournament in tournaments:
         print(f"Processing tournament: {tournament.name} ({tournament.edition})")
-        
-        # Get all matches in the tournament
-        matches: list[Match] = db.query(Match).filter(Match.tournament_id == tournament.id).all()
-        match_ids: list[int] = [match.id for match in matches]
-        
-        if not match_ids:
-            print(f"  No matches found for tournament {tournament.name}")
-            continue
-        
-        # Get all goals in these matches
-        goals: list[Goal] = db.query(Goal).filter(Goal.match_id.in_(match_ids)).all()
-        
-        if not goals:
-            print(f"  No goals found for tournament {tournament.name}")
-            continue
-        
-        # Get unique player IDs from goals
-        player_ids: set[int] = set(goal.player_id for goal in goals)
-        
-        if player_id:
-            # Filter to specific player if requested
-            if player_id in player_ids:
-                player_ids = {player_id}
-            else:
+        scorers = totals[tournament.id]
+        if not scorers:
+            if player_id:
                 print(f"  Player with ID {player_id} has no goals in tournament {tournament.name}")
-                continue
-        
-        print(f"  Updating statistics for {len(player_ids)} players...")
-        
-        # Process each player
-        for pid in player_ids:
-            player: Player | None = db.query(Player).filter(Player.id == pid).first()
-            if not player:
-                print(f"  Warning: Player with ID {pid} not found, skipping...")
-                continue
-            
-            # Get or create player stats for this tournament
-            stats: PlayerStats | None = db.query(PlayerStats).filter(
-                PlayerStats.player_id == pid,
-                PlayerStats.tournament_id == tournament.id
-            ).first()
-            
-            if not stats:
-                stats = PlayerStats(
-                    player_id=pid,
-                    tournament_id=tournament.id,
-                    matches_played=0,
-                    minutes_played=0,
-                    goals=0,
-                    assists=0,
-                    penalty_goals=0,
-                    own_goals=0,
-                    yellow_cards=0,
-                    red_cards=0,
-                    goals_per_match=0.0,
-                    minutes_per_goal=0.0
-                )
-                db.add(stats)
-            
-            # Get player's goals in this tournament
-            player_goals: list[Goal] = [g for g in goals if g.player_id == pid]
-            
-            # Count goals by type
-            regular_goals: int = sum(1 for g in player_goals if g.type == "regular")
-            penalty_goals: int = sum(1 for g in player_goals if g.type == "penalty")
-            own_goals: int = sum(1 for g in player_goals if g.type == "own_goal")
-            
-            # Count matches played (matches where the player scored)
-            matches_with_goals: set[int] = set(g.match_id for g in player_goals)
-            
-            # Update stats
-            stats.goals = regular_goals + penalty_goals
-            stats.penalty_goals = penalty_goals
-            stats.own_goals = own_goals
-            stats.matches_played = len(matches_with_goals)
-            
-            # Estimate minutes played (90 minutes per match)
-            stats.minutes_played = stats.matches_played * 90
-            
-            # Update calculated stats
-            if stats.matches_played > 0:
-                stats.goals_per_match = stats.goals / stats.matches_played
             else:
-                stats.goals_per_match = 0.0
-                
-            if stats.goals > 0:
-                stats.minutes_per_goal = stats.minutes_played / stats.goals
+                print(f"  No goals found for tournament {tournament.name}")
+            continue
+
+        print(f"  Updating statistics for {len(scorers)} players...")
+        rows = []
+        for pid, name, regular_goals, penalty_goals, own_goals, matches_played in scorers:
+            if (tournament.id, pid) in existing:
+                updated += 1
             else:
-                stats.minutes_per_goal = 0.0
-            
+                created += 1
+
+            # Transient: only used to derive the calculated columns.
+            # Own goals don't count towards a player's tally.
+            stats = PlayerStats(
+                player_id=pid,
+                tournament_id=tournament.id,
+                goals_scored=regular_goals + penalty_goals,
+                matches_played=matches_played,
+                # Estimate minutes played (90 minutes per match)
+                minutes_played=matches_played * MINUTES_PER_MATCH,
+            )
+            stats.update_calculated_stats()
+            rows.append({column: getattr(stats, column) for column in STATS_COLUMNS})
+
+            print(
+                f"  {name}: {stats.goals_scored} goals in {stats.matches_played} matches"
+                + (f" ({own_goals} own goals)" if own_goals else "")
+            )
+
+        # Concurrent runs update the same rows instead of failing on the unique index
+        upsert(db, PlayerStats.__table__, rows, conflict=("player_id", "tournament_id"))
+        if dry_run:
+            db.rollback()
+        else:
             db.commit()
-            print(f"  Updated stats for {player.name}: {stats.goals} goals in {stats.matches_played} matches")
-    
-    print("Player statistics update completed.")
+    timings["write"] = time.perf_counter() - step
+    timings["total"] = time.perf_counter() - started
+
+    action = "Would update" if dry_run else "Updated"
+    print(f"{action} {created + updated} player statistics ({created} new, {updated} existing).")
+    print(
+        f"Timing: aggregate {timings['aggregate'] * 1000:.1f} ms, "
+        f"write {timings['write'] * 1000:.1f} ms, "
+        f"total {timings['total'] * 1000:.1f} ms"
+    )
+    print("Player statistics update completed." if not dry_run else "Dry run: no changes written.")
+    return timings
 
 
 def main() -> None:
@@ -147,16 +164,21 @@ def main() -> None:
     parser.add_argument(
         "--player", "-p", type=int, help="Player ID to update stats for"
     )
-    
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Compute statistics without writing them"
+    )
+
     args = parser.parse_args()
-    
+
     # Create database session
     db: Session = SessionLocal()
     try:
-        update_player_stats(db, tournament_id=args.tournament, player_id=args.player)
+        update_player_stats(
+            db, tournament_id=args.tournament, player_id=args.player, dry_run=args.dry_run
+        )
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()